@@ -0,0 +1,185 @@
+# Measure the client's hot paths: building requests, decoding responses, constructing models, paginating, fanning
+# requests out and resolving related objects, all against the in-process fake server so that no network is involved.
+#
+# Usage: python3 benchmarks/bench_client.py [--scale N]
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import schoolopy
+from schoolopy.codec import JSONCodec
+from schoolopy.fake import FakeSchoology
+from payloads import PAYLOADS
+
+
+def measure(function, number, repeat=3):
+    """
+    Time a function, keeping the best of several runs.
+
+    :param function: Function taking no arguments.
+    :param number: Number of calls per run.
+    :param repeat: Number of runs.
+    :return: Seconds per call.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def result(name, seconds, operations=1, **extra):
+    """
+    Build a result dictionary.
+
+    :param name: Name of the benchmark.
+    :param seconds: Seconds taken for the given number of operations.
+    :param operations: Number of operations, e.g. objects or requests, done in that time.
+    """
+    return dict({
+        'benchmark': name,
+        'operations': operations,
+        'seconds': seconds,
+        'operations_per_second': operations / seconds if seconds else 0.0,
+    }, **extra)
+
+
+def client(fake, **kwargs):
+    return schoolopy.Schoology(schoolopy.Auth('key', 'secret'), transport=fake, **kwargs)
+
+
+def bench_requests(scale):
+    """
+    Build URL parameters and OAuth headers.
+    """
+    sc = client(FakeSchoology(users=0, sections=0))
+    params = {'start': 200, 'limit': 200, 'with_attachments': 1}
+    return [
+        result('params_string', measure(lambda: sc._get_params_string(params), 2000 * scale)),
+        result('oauth_header', measure(sc.schoology_auth._oauth_header, 2000 * scale)),
+    ]
+
+
+def bench_decode(scale):
+    """
+    Decode list pages with the default codec and wrap their objects in models.
+    """
+    sc = client(FakeSchoology(users=0, sections=0))
+    results = []
+    for payload_name, build in PAYLOADS.items():
+        payload = build()
+        key = [key for key in payload if isinstance(payload[key], list)][0]
+        body = JSONCodec().dumps(payload)
+        raws = payload[key]
+        decode = measure(lambda: sc.codec.loads(body), 20 * scale)
+        results.append(result('decode', decode, len(raws), payload=payload_name, codec=sc.codec.name, bytes=len(body),
+                              mb_per_second=len(body) / decode / 1e6))
+        results.append(result('models', measure(lambda: [schoolopy.User(raw) for raw in raws], 20 * scale), len(raws),
+                              payload=payload_name))
+    return results
+
+
+def bench_pagination(scale):
+    """
+    Fetch every user through paginate() and stream(), a page of 200 at a time.
+    """
+    fake = FakeSchoology(users=2000 * scale, sections=0)
+    sc = client(fake)
+    sc.limit = 200
+    users = len(fake.collections['users'][1])
+    return [
+        result('paginate', measure(lambda: list(sc.paginate(sc.get_users)), 1), users),
+        result('stream', measure(lambda: list(sc.stream(sc.get_users)), 1), users),
+    ]
+
+
+def bench_fan_out(scale, latency=0.002):
+    """
+    Fetch users one by one, sequentially, over a thread pool and through multiget, with a few milliseconds of
+    latency on each request. With aiohttp installed, AsyncSchoology is measured against the fake served over HTTP.
+    """
+    fake = FakeSchoology(users=200 * scale, sections=0, latency=latency)
+    sc = client(fake)
+    ids = [user['id'] for user in fake.collections['users'][1]]
+    sample = ids[:max(1, len(ids) // 10)]
+    results = [
+        result('fan_out_sequential', measure(lambda: [sc.get_user(id) for id in sample], 1), len(sample), latency=latency),
+        result('fan_out_threads', measure(lambda: sc.get_many(sc.get_user, ids, max_workers=16), 1), len(ids),
+               latency=latency, workers=16),
+        result('fan_out_multiget', measure(lambda: sc.multi_get(sc.get_user, ids), 1), len(ids), latency=latency),
+    ]
+    if schoolopy.aio.aiohttp is not None:
+        api_host = fake.serve()
+
+        async def fetch():
+            async with schoolopy.AsyncSchoology(schoolopy.Auth('key', 'secret'), api_host=api_host) as asc:
+                started = time.perf_counter()
+                await asc.get_many(asc.get_user, ids, max_workers=64)
+                return time.perf_counter() - started
+
+        try:
+            results.append(result('fan_out_async', min(asyncio.run(fetch()) for i in range(3)), len(ids),
+                                  latency=latency, workers=64))
+        finally:
+            fake.close()
+    return results
+
+
+def bench_resolve(scale, latency=0.002):
+    """
+    Look up the author and section of each update of a feed page, one request per update as in the example script,
+    and through a Resolver, with a few milliseconds of latency on each request. Operations are updates resolved.
+    """
+    fake = FakeSchoology(users=200, sections=10, updates=50 * scale, latency=latency)
+    sc = client(fake)
+    sc.limit = 50 * scale
+    feed = sc.get_feed()
+
+    def one_by_one():
+        for update in feed:
+            update['user'] = sc.get_user(update['uid'])
+            update['section'] = sc.get_section(update['section_id'])
+
+    return [
+        result('resolve_n_plus_one', measure(one_by_one, 1), len(feed), latency=latency),
+        result('resolve_batched', measure(lambda: schoolopy.Resolver(sc, fields=['uid', 'section_id']).resolve(feed), 1),
+               len(feed), latency=latency),
+    ]
+
+
+SUITES = {
+    'requests': bench_requests,
+    'decode': bench_decode,
+    'pagination': bench_pagination,
+    'fan_out': bench_fan_out,
+    'resolve': bench_resolve,
+}
+
+
+def run(scale=1, suites=None):
+    """
+    Run the client benchmarks.
+
+    :param scale: Multiplier of the amount of work each benchmark does.
+    :param suites: Names of the suites to run. Defaults to all of SUITES.
+    :return: List of result dictionaries.
+    """
+    results = []
+    for name in suites or SUITES:
+        for entry in SUITES[name](scale):
+            entry['suite'] = name
+            results.append(entry)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the client's hot paths against the in-process fake server.")
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--suite', action='append', choices=list(SUITES))
+    args = parser.parse_args()
+    print('%-20s %-12s %10s %12s %14s' % ('benchmark', 'payload', 'operations', 'seconds', 'operations/s'))
+    for entry in run(args.scale, args.suite):
+        print('%-20s %-12s %10d %12.6f %14.1f' % (entry['benchmark'], entry.get('payload', ''), entry['operations'],
+                                                  entry['seconds'], entry['operations_per_second']))
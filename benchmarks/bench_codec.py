@@ -0,0 +1,50 @@
+# Compare the JSON codecs installed on representative Schoology responses.
+#
+# Usage: python3 benchmarks/bench_codec.py [--repeat N]
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from schoolopy.codec import JSONCodec, available_codecs
+from payloads import PAYLOADS
+
+
+def run(repeat=200):
+    """
+    Time decoding and encoding of each payload with each codec.
+
+    :param repeat: Number of times to decode and encode each payload.
+    :return: List of result dictionaries.
+    """
+    results = []
+    for payload_name, build in PAYLOADS.items():
+        payload = build()
+        body = JSONCodec().dumps(payload)
+        for codec in available_codecs():
+            decode = min(timeit.repeat(lambda: codec.loads(body), number=repeat, repeat=3)) / repeat
+            encode = min(timeit.repeat(lambda: codec.dumps(payload), number=repeat, repeat=3)) / repeat
+            results.append({
+                'benchmark': 'codec',
+                'payload': payload_name,
+                'codec': codec.name,
+                'bytes': len(body),
+                'decode_seconds': decode,
+                'encode_seconds': encode,
+                'decode_mb_per_second': len(body) / decode / 1e6,
+            })
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the JSON codecs installed on representative Schoology responses.')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    print('%-12s %-8s %10s %12s %12s %10s' % ('payload', 'codec', 'bytes', 'decode (us)', 'encode (us)', 'MB/s'))
+    for result in run(args.repeat):
+        print('%-12s %-8s %10d %12.1f %12.1f %10.1f' % (result['payload'], result['codec'], result['bytes'],
+                                                       result['decode_seconds'] * 1e6, result['encode_seconds'] * 1e6,
+                                                       result['decode_mb_per_second']))
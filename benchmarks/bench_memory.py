@@ -0,0 +1,86 @@
+# Compare the memory held by the dict-based, compact and lazy models, and the time taken to build them.
+#
+# Usage: python3 benchmarks/bench_memory.py [--count N]
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from schoolopy import models, compact, lazy
+from schoolopy.fake import user, enrollment, assignment
+
+STYLES = {
+    'dict': lambda model: model,
+    'compact': lambda model: compact.MODELS[model],
+    'lazy': lambda model: lazy.MODELS[model],
+}
+
+OBJECTS = [
+    ('users', 'user', models.User, user),
+    ('enrollments', 'enrollment', models.Enrollment, enrollment),
+    ('assignments', 'assignment', models.Assignment, assignment),
+]
+
+
+def measure(body, key, model):
+    """
+    Build a model for every object of a response, as the client does, and measure what they hold on to.
+
+    :param body: Response as JSON.
+    :param key: Key of the list of objects in the response.
+    :param model: Class to wrap the objects in.
+    :return: Tuple of the bytes allocated and still held once the decoded response is discarded, and the seconds
+             taken to build the models, timed separately as tracing allocations slows everything down.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = [model(raw) for raw in json.loads(body)[key]]
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    raws = json.loads(body)[key]
+    started = time.perf_counter()
+    objects = [model(raw) for raw in raws]
+    return held, time.perf_counter() - started
+
+
+def run(count=20000):
+    """
+    Measure each model style on each kind of object.
+
+    :param count: Number of objects of each kind.
+    :return: List of result dictionaries.
+    """
+    results = []
+    for name, key, model, factory in OBJECTS:
+        body = json.dumps({key: [factory(i) for i in range(count)]})
+        for style, resolve in STYLES.items():
+            held, elapsed = measure(body, key, resolve(model))
+            results.append({
+                'benchmark': 'memory',
+                'payload': name,
+                'style': style,
+                'operations': count,
+                'bytes': held,
+                'bytes_per_object': held / count,
+                'seconds': elapsed,
+                'operations_per_second': count / elapsed,
+            })
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the memory held by the dict-based, compact and lazy models.')
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args()
+    print('%-12s %-8s %10s %14s %12s' % ('payload', 'style', 'objects', 'bytes/object', 'objects/s'))
+    for result in run(args.count):
+        print('%-12s %-8s %10d %14.0f %12.0f' % (result['payload'], result['style'], result['operations'],
+                                                 result['bytes_per_object'], result['operations_per_second']))
@@ -0,0 +1,27 @@
+# Synthetic responses shaped like those of Schoology's list endpoints, for benchmarking.
+
+from schoolopy.fake import user, enrollment, assignment
+
+
+def page(key, factory, count=200, start=0, total=None):
+    """
+    Build one page of a list response.
+
+    :param key: Key the endpoint returns its objects under.
+    :param factory: Function building the object with a given index.
+    :param count: Number of objects on the page.
+    :param start: Index of the first object.
+    :param total: Total reported by the endpoint. Defaults to a single page.
+    """
+    total = start + count if total is None else total
+    response = {key: [factory(i) for i in range(start, start + count)], 'total': str(total), 'links': {'self': ''}}
+    if start + count < total:
+        response['links']['next'] = 'https://api.schoology.com/v1/?start=%d&limit=%d' % (start + count, count)
+    return response
+
+
+PAYLOADS = {
+    'users': lambda: page('user', user),
+    'enrollments': lambda: page('enrollment', enrollment),
+    'assignments': lambda: page('assignment', assignment, count=50),
+}
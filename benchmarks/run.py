@@ -0,0 +1,107 @@
+# Run every benchmark and save the results as JSON, optionally comparing them with an earlier run.
+#
+# Usage: python3 benchmarks/run.py [--output results.json] [--compare baseline.json] [--scale N]
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import bench_client
+import bench_codec
+import bench_memory
+from schoolopy.codec import default_codec
+
+
+def environment():
+    """
+    Describe what the benchmarks ran on, so that runs can be told apart.
+
+    :return: Dictionary.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            schoolopy_version = version('schoolopy')
+        except PackageNotFoundError:
+            schoolopy_version = None
+    except ImportError:
+        schoolopy_version = None
+    return {
+        'schoolopy': schoolopy_version,
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'codec': default_codec().name,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+
+
+def key(result):
+    """
+    Identify a result across runs.
+    """
+    return (result['benchmark'], result.get('payload'), result.get('codec') or result.get('style'))
+
+
+def compare(results, baseline):
+    """
+    Print how each result's speed changed from a baseline run.
+
+    :param results: List of result dictionaries.
+    :param baseline: Results of the earlier run as saved by this script.
+    """
+    before = {key(result): result for result in baseline['results']}
+    print('%-20s %-12s %-8s %14s %14s %8s' % ('benchmark', 'payload', 'variant', 'before (op/s)', 'after (op/s)', 'change'))
+    for result in results:
+        old = before.get(key(result))
+        if old is None or 'operations_per_second' not in old or 'operations_per_second' not in result:
+            continue
+        print('%-20s %-12s %-8s %14.1f %14.1f %+7.1f%%' % (
+            result['benchmark'], result.get('payload') or '', result.get('codec') or result.get('style') or '',
+            old['operations_per_second'], result['operations_per_second'],
+            (result['operations_per_second'] / old['operations_per_second'] - 1) * 100 if old['operations_per_second'] else 0))
+
+
+def codec_results(repeat):
+    """
+    Run the codec benchmark, reporting decodes per second like the rest.
+    """
+    results = bench_codec.run(repeat)
+    for result in results:
+        result['suite'] = 'codec'
+        result['operations_per_second'] = 1 / result['decode_seconds']
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run every benchmark and save the results as JSON.')
+    parser.add_argument('--output', help='File to write the results to. Printed if not given.')
+    parser.add_argument('--compare', help='Results of an earlier run to compare with.')
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=200, help='Repetitions of the codec benchmark.')
+    args = parser.parse_args()
+
+    memory = bench_memory.run(20000 * args.scale)
+    for result in memory:
+        result['suite'] = 'memory'
+    report = {'environment': environment(), 'results': bench_client.run(args.scale) + codec_results(args.repeat) + memory}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=4)
+    elif not args.compare:
+        print(json.dumps(report, indent=4))
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report['results'], json.load(f))
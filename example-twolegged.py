@@ -8,8 +8,9 @@ sc = schoolopy.Schoology(schoolopy.Auth(cfg['key'], cfg['secret']))
 sc.limit = 10  # Only retrieve 10 objects max
 
 print('Your name is %s' % sc.get_me().name_display)
-for update in sc.get_feed():
-    user = sc.get_user(update.uid)
-    print('By: ' + user.name_display)
+# Fetch the authors of the whole page of updates at once, rather than one request per update.
+feed = schoolopy.Resolver(sc, fields=['uid']).resolve(sc.get_feed())
+for update in feed:
+    print('By: ' + update.user.name_display)
     print(update.body[:40].replace('\r\n', ' ').replace('\n', ' ') + '...')
     print('%d likes\n' % update.likes)
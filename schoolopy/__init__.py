@@ -2,3 +2,15 @@
 
 from .main import *
 from .authentication import *
+from .aio import AsyncSchoology
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .cache import ResponseCache, SQLiteCache
+from .coalesce import SingleFlight
+from .streaming import ItemStream
+from .sync import EnrollmentSync, EnrollmentPlan
+from .metrics import Metrics, RequestEvent
+from .tracing import Tracer, SpanRecorder
+from .columnar import to_columns, to_numpy, to_arrow, to_pandas, to_parquet
+from .identity import IdentityMap
+from .resolve import Resolver
@@ -0,0 +1,612 @@
+import asyncio
+import functools
+import json
+import os
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .errors import NoDataError, IncompleteDownloadError
+from .main import Schoology, _Pagination, _PendingRequest, _multiget_unsupported
+from .streaming import ItemStream
+from .codec import default_codec
+from .download import Download, expected_size, attachment_files, attachment_path, manifest_entry
+from .metrics import RequestEvent, endpoint_template
+
+try:
+    from json.decoder import JSONDecodeError
+except ImportError:
+    JSONDecodeError = ValueError
+
+
+class _Interrupted(Exception):
+    """
+    Raised when the connection drops while a file is being downloaded.
+    """
+    pass
+
+
+class AsyncSchoology:
+    """
+    Asynchronous counterpart to Schoology, built on aiohttp.
+
+    Every public method of Schoology is available here as a coroutine taking the same arguments.
+    Use it as an async context manager, or call close() once done, to release its connections.
+    """
+    def __init__(self, schoology_auth, api_host='https://api.schoology.com/v1/', max_connections=100, rate_limiter=None, retry=None,
+                 cache=None, validator_cache=None, single_flight=None, codec=None, hooks=None, tracer=None, identity_map=None):
+        """
+        :param schoology_auth: Authorized Auth instance.
+        :param api_host: Root URL of the API.
+        :param max_connections: Maximum number of connections open at once.
+        :param rate_limiter: Optional RateLimiter to throttle requests with, e.g. RateLimiter.for_key(key).
+        :param retry: Optional RetryPolicy deciding which failed requests to send again.
+        :param cache: Optional ResponseCache to answer repeated GET requests from.
+        :param validator_cache: Optional ResponseCache keeping validators of GET responses to make repeated requests conditional.
+        :param single_flight: Optional SingleFlight through which identical GET requests made at the same time share one HTTP call.
+        :param codec: Codec to encode and decode JSON with. Defaults to the fastest installed, see codec.default_codec.
+        :param hooks: Functions to call with a metrics.RequestEvent after every request, or cache hit.
+        :param tracer: Optional tracing.Tracer to open spans for each public method called and each request made.
+        :param identity_map: Optional IdentityMap through which objects returned more than once resolve to one shared model.
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncSchoology requires aiohttp. Install it with pip3 install aiohttp.')
+        # The endpoint methods themselves are those of a regular Schoology instance, replayed against responses fetched here.
+        self._sync = Schoology(schoology_auth, api_host, identity_map=identity_map)
+        self.schoology_auth = schoology_auth
+        self.api_host = api_host
+        self.max_connections = max_connections
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.cache = cache
+        self.validator_cache = validator_cache
+        self.single_flight = single_flight
+        self.codec = default_codec() if codec is None else codec
+        self.hooks = list(hooks or [])
+        self.tracer = tracer
+        self._session = None
+        if tracer is not None:
+            self.hooks.append(tracer)
+            tracer.instrument(self)
+
+    @property
+    def identity_map(self):
+        return self._sync.identity_map
+
+    @property
+    def limit(self):
+        return self._sync.limit
+
+    @limit.setter
+    def limit(self, limit):
+        self._sync.limit = limit
+
+    @property
+    def model_style(self):
+        return self._sync.model_style
+
+    @model_style.setter
+    def model_style(self, model_style):
+        self._sync.model_style = model_style
+
+    @property
+    def start(self):
+        return self._sync.start
+
+    @start.setter
+    def start(self, start):
+        self._sync.start = start
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the underlying HTTP session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.max_connections))
+        return self._session
+
+    def _headers(self, api=True):
+        """
+        Build the headers of a request.
+
+        Host is left for aiohttp to set from the URL, since files may be served from other hosts, or redirected to them.
+
+        :param api: Whether the request is to an API endpoint, sending and receiving JSON, rather than for a file.
+        :return: Dictionary of headers.
+        """
+        headers = {'Authorization': self.schoology_auth._oauth_header()}
+        if api:
+            headers['Accept'] = 'application/json'
+            headers['Content-Type'] = 'application/json'
+        return headers
+
+    async def _send(self, verb, url, read, **kwargs):
+        """
+        Send a request, waiting for the rate limiter and retrying failures as the retry policy allows.
+
+        :param verb: HTTP method to use.
+        :param url: Full URL to request.
+        :param read: Coroutine function reading what is needed from the successful response.
+        :param kwargs: Further arguments to pass to the session.
+        :return: Result of read.
+        """
+        started = time.monotonic()
+        waited = 0.0
+        attempt = 1
+        response = None
+        error = None
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    waited += await self.rate_limiter.acquire_async()
+                response = None
+                try:
+                    async with self.session.request(verb, url, **kwargs) as response:
+                        if self.retry is None or not self.retry.should_retry(verb, attempt, response.status):
+                            response.raise_for_status()
+                            return await read(response)
+                        delay = self.retry.delay(attempt, response.headers)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if self.retry is None or not self.retry.should_retry(verb, attempt):
+                        raise
+                    delay = self.retry.delay(attempt)
+                await asyncio.sleep(delay)
+                waited += delay
+                attempt += 1
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self.hooks:
+                self._emit(RequestEvent(verb, url, endpoint_template(url, self.api_host),
+                                        status=None if response is None else response.status,
+                                        elapsed=time.monotonic() - started,
+                                        bytes=None if response is None else response.content_length,
+                                        request_bytes=len(kwargs.get('data') or b''), attempts=attempt, waited=waited,
+                                        error=error))
+
+    def _emit(self, event):
+        for hook in self.hooks:
+            hook(event)
+
+    async def _request(self, verb, path, data=None, params=None):
+        """
+        Send a request to a given endpoint.
+
+        :param verb: HTTP method to use.
+        :param path: Path (following API root) to endpoint.
+        :param data: JSON data to send, if any.
+        :param params: Custom URL parameters to add, or None to send none at all.
+        :return: JSON response, or None for DELETE requests.
+        """
+        url = self.api_host + path
+        if params is not None:
+            url += self._sync._get_params_string(params)
+
+        async def read(response):
+            return None if verb == 'DELETE' else await response.read()
+
+        try:
+            body = await self._send(verb, url, read, data=None if data is None else self.codec.dumps(data),
+                                    headers=self._headers())
+        finally:
+            if verb != 'GET' and self.cache is not None:
+                self.cache.invalidate(path)
+        if verb == 'DELETE':
+            return None
+        return self._decode(verb, url, body)
+
+    def _decode(self, verb, url, body):
+        try:
+            return self.codec.loads(body)
+        except ValueError:
+            raise NoDataError(f'{verb.capitalize()} request to {url} failed: {body.decode("utf-8", "replace")}')
+
+    async def _get(self, path, params={}):
+        key = self._sync._cache_key(path, params)
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if data is not None:
+                if self.hooks:
+                    self._emit(RequestEvent('GET', self.api_host + path + self._sync._get_params_string(params),
+                                            endpoint_template(path), cache_hit=True))
+                return data
+        if self.single_flight is not None:
+            return await self.single_flight.do_async(key, lambda: self._fetch(key, path, params))
+        return await self._fetch(key, path, params)
+
+    async def _fetch(self, key, path, params):
+        headers = self._headers()
+        validated = None if self.validator_cache is None else self.validator_cache.get(key)
+        if validated is not None:
+            headers.update(Schoology._conditional_headers(*validated[:2]))
+
+        async def read(response):
+            if response.status == 304:
+                return None
+            return response.headers.get('ETag'), response.headers.get('Last-Modified'), await response.read()
+
+        url = self.api_host + path + self._sync._get_params_string(params)
+        fetched = await self._send('GET', url, read, headers=headers)
+        if fetched is None and validated is not None:
+            data = validated[2]
+        else:
+            etag, last_modified, body = fetched or (None, None, b'')
+            data = self._decode('GET', url, body)
+            if self.validator_cache is not None and (etag or last_modified):
+                self.validator_cache.set(key, path, [etag, last_modified, data])
+        if self.cache is not None:
+            self.cache.set(key, path, data)
+        return data
+
+    async def _post(self, path, data, params={}):
+        return await self._request('POST', path, data, params)
+
+    async def _put(self, path, data, params={}):
+        return await self._request('PUT', path, data, params)
+
+    async def _delete(self, path, params=None):
+        return await self._request('DELETE', path, params=params)
+
+    async def _call(self, method, *args, **kwargs):
+        """
+        Run a method of the underlying Schoology instance, performing its requests asynchronously.
+
+        The method is replayed with the responses gathered so far until it no longer needs another. Arguments that can
+        only be iterated over once, such as generators, are first read into lists, so that every run sees all of them.
+
+        :param method: Bound method of self._sync.
+        :return: Result of the method.
+        """
+        args = [_replayable(arg) for arg in args]
+        kwargs = {key: _replayable(value) for key, value in kwargs.items()}
+        return await self._resume([], method, *args, **kwargs)
+
+    async def _resume(self, responses, method, *args, **kwargs):
+        """
+        Like _call, but with the answers to the method's first requests already known.
+
+        :param responses: Decoded responses to the method's first requests, in order.
+        :param method: Bound method of self._sync.
+        :return: Result of the method.
+        """
+        responses = list(responses)
+        while True:
+            try:
+                return self._sync._replay(responses, method, *args, **kwargs)
+            except _PendingRequest as request:
+                responses.append(await self._answer(request))
+
+    async def _answer(self, request):
+        if request.verb == 'DELETE':
+            return await self._delete(request.path, request.params)
+        if request.verb == 'GET':
+            return await self._get(request.path, request.params)
+        return await self._request(request.verb, request.path, request.data, request.params)
+
+    async def paginate(self, method, *args, start=None, **kwargs):
+        """
+        Lazily iterate over every object a list method can return, following Schoology's pagination.
+
+        :param method: Bound list method of this instance, e.g. sc.get_users.
+        :param args: Positional arguments to pass to the method.
+        :param start: Offset to start at in place of self.start.
+        :param kwargs: Keyword arguments to pass to the method.
+        :return: Async generator yielding model objects.
+        """
+        pages = await self._call(self._sync._paginated, getattr(self._sync, method.__name__), *args, start=start, **kwargs)
+        start = pages.params.get('start', self.start)
+        while start is not None:
+            data = await self._get(pages.path, dict(pages.params, start=start))
+            items = data.get(pages.key) or []
+            for raw in items:
+                yield pages.model(raw)
+            start = _Pagination.next_start(data, start, len(items))
+
+    async def stream(self, method, *args, start=None, **kwargs):
+        """
+        Like paginate, but decode each page one object at a time rather than whole.
+
+        Each page's body is parsed as its chunks arrive, so neither the whole body nor more than one decoded object of
+        it is held in memory at a time. Streamed pages bypass the response cache.
+
+        :param method: Bound list method of this instance, e.g. sc.get_users.
+        :param args: Positional arguments to pass to the method.
+        :param start: Offset to start at in place of self.start.
+        :param kwargs: Keyword arguments to pass to the method.
+        :return: Async generator yielding model objects.
+        """
+        pages = await self._call(self._sync._paginated, getattr(self._sync, method.__name__), *args, start=start, **kwargs)
+        start = pages.params.get('start', self.start)
+        while start is not None:
+            url = self.api_host + pages.path + self._sync._get_params_string(dict(pages.params, start=start))
+            # Objects are handed over one at a time while the response is read, parsing no further ahead than that.
+            queue = asyncio.Queue(1)
+
+            async def read(response):
+                items = ItemStream(response.content.iter_chunked(self._sync.stream_chunk_size), pages.key)
+                count = 0
+                async for raw in items:
+                    count += 1
+                    await queue.put(pages.model(raw))
+                return items.members, count
+
+            page = asyncio.ensure_future(self._send('GET', url, read, headers=self._headers()))
+            try:
+                while not page.done():
+                    item = asyncio.ensure_future(queue.get())
+                    await asyncio.wait([item, page], return_when=asyncio.FIRST_COMPLETED)
+                    if not item.done():
+                        item.cancel()
+                        break
+                    yield item.result()
+                while not queue.empty():
+                    yield queue.get_nowait()
+                try:
+                    members, count = page.result()
+                except JSONDecodeError:
+                    raise NoDataError(f'Get request to {url} returned invalid JSON.')
+            finally:
+                if not page.done():
+                    page.cancel()
+            start = _Pagination.next_start(members, start, count)
+
+    async def get_many(self, method, ids, max_workers=100, **kwargs):
+        """
+        Call a method once per ID, running the calls concurrently.
+
+        :param method: Bound method of this instance, or its name, e.g. sc.get_user.
+        :param ids: IDs to pass as the method's first argument. Tuples are unpacked into several arguments.
+        :param max_workers: Maximum number of calls in progress at once.
+        :param kwargs: Keyword arguments to pass to every call.
+        :return: List of the results of each call in the order of ids. Calls that failed hold the exception they raised instead.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def call(id):
+            async with semaphore:
+                try:
+                    return await method(*(id if isinstance(id, tuple) else (id,)), **kwargs)
+                except Exception as e:
+                    return e
+
+        return await asyncio.gather(*[call(id) for id in ids])
+
+    async def multi_get(self, method, ids, **kwargs):
+        """
+        Call a method once per ID, combining the GET requests of the calls into as few multi-get requests as possible.
+
+        See Schoology.multi_get.
+
+        :param method: Bound method of this instance, or its name, e.g. sc.get_user.
+        :param ids: IDs to pass as the method's first argument. Tuples are unpacked into several arguments.
+        :param kwargs: Keyword arguments to pass to every call.
+        :return: List of the results of each call in the order of ids. Calls that failed hold the exception they raised instead.
+        """
+        method = getattr(self._sync, method if isinstance(method, str) else method.__name__)
+        calls = [id if isinstance(id, tuple) else (id,) for id in ids]
+
+        async def finish(args, responses):
+            try:
+                return await self._resume(responses, method, *args, **kwargs)
+            except Exception as e:
+                return e
+
+        results = [None] * len(calls)
+        pending = []
+        for i, args in enumerate(calls):
+            try:
+                results[i] = self._sync._replay([], method, *args, **kwargs)
+            except _PendingRequest as request:
+                cached = None
+                if request.verb == 'GET' and self.cache is not None:
+                    cached = self.cache.get(self._sync._cache_key(request.path, request.params))
+                if cached is not None:
+                    results[i] = await finish(args, [cached])
+                elif request.verb == 'GET':
+                    pending.append((i, request))
+                else:
+                    results[i] = await finish(args, [])
+            except Exception as e:
+                results[i] = e
+
+        batches = [pending[offset:offset + self._sync.multiget_limit]
+                   for offset in range(0, len(pending), self._sync.multiget_limit)]
+        responses = await asyncio.gather(*[
+            self._multiget([request.path + self._sync._get_params_string(request.params) for i, request in batch])
+            for batch in batches
+        ])
+        for batch, bodies in zip(batches, responses):
+            for (i, request), body in zip(batch, bodies):
+                if body is not None and self.cache is not None:
+                    self.cache.set(self._sync._cache_key(request.path, request.params), request.path, body)
+            finished = await asyncio.gather(*[finish(calls[i], [] if body is None else [body])
+                                              for (i, request), body in zip(batch, bodies)])
+            for (i, request), result in zip(batch, finished):
+                results[i] = result
+        return results
+
+    async def _multiget(self, paths):
+        """
+        GET several endpoints at once through Schoology's multiget endpoint.
+
+        See Schoology._multiget.
+
+        :param paths: Paths (following API root, including URL parameters) to GET. No more than multiget_limit.
+        :return: List of the decoded responses in the order of paths, holding None for sub-requests that failed.
+        """
+        root = urlparse(self.api_host).path
+        try:
+            responses = (await self._post('multiget', {'request': [root + path for path in paths]}))['response']
+        except aiohttp.ClientResponseError as e:
+            if e.status not in _multiget_unsupported:
+                raise
+            return [None] * len(paths)
+        bodies = [response.get('body') if 200 <= int(response.get('response_code', 0)) < 300 else None
+                  for response in responses]
+        return bodies + [None] * (len(paths) - len(bodies))
+
+    async def get_file(self, url):
+        """
+        Get a file from the Schoology API.
+
+        :param url: URL of the file to retrieve.
+        :return: File data in binary format.
+        """
+        return await self._send('GET', url, lambda response: response.read(), headers=self._headers(api=False))
+
+    async def download_file(self, url, destination, resume=False, chunk_size=1048576, max_resumes=5):
+        """
+        Download a file from the Schoology API, writing it out chunk by chunk rather than holding it in memory.
+
+        See Schoology.download_file.
+
+        :param url: URL of the file to retrieve.
+        :param destination: Path to write the file to, or a binary file-like object to write it into.
+        :param resume: Whether to continue a partial file already at the destination path, rather than overwrite it.
+        :param chunk_size: Number of bytes to read and write at a time.
+        :param max_resumes: Maximum number of times to resume after losing the connection.
+        :return: Download object with the size of the file and the throughput achieved.
+        """
+        if isinstance(destination, (str, os.PathLike)):
+            offset = os.path.getsize(destination) if resume and os.path.exists(destination) else 0
+            with open(destination, 'ab' if offset else 'wb') as file:
+                return await self._download(url, file, destination, offset, chunk_size, max_resumes)
+        return await self._download(url, destination, destination, 0, chunk_size, max_resumes)
+
+    async def _download(self, url, file, destination, offset, chunk_size, max_resumes):
+        started = time.monotonic()
+        origin = file.tell() - offset if file.seekable() else None
+        written = offset
+        size = None
+        resumes = 0
+
+        async def read(response):
+            nonlocal written, size
+            if written and response.status != 206:
+                if origin is None:
+                    raise IncompleteDownloadError(f'Could not resume download of {url}: range requests are not supported.')
+                file.seek(origin)
+                file.truncate()
+                written = 0
+            size = expected_size(response.status, response.headers) or size
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    file.write(chunk)
+                    written += len(chunk)
+            except (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # Kept apart from connection errors before the response, which _send retries from scratch.
+                raise _Interrupted() from e
+
+        while True:
+            headers = self._headers(api=False)
+            if written:
+                headers['Range'] = 'bytes=%d-' % written
+            try:
+                await self._send('GET', url, read, headers=headers)
+                break
+            except aiohttp.ClientResponseError as e:
+                if not written or e.status != 416:
+                    raise
+                size = expected_size(416, e.headers or {}) or written
+                break
+            except _Interrupted as e:
+                if resumes >= max_resumes:
+                    raise e.__cause__
+                resumes += 1
+        if size is not None and written != size:
+            raise IncompleteDownloadError(f'Download of {url} ended after {written} of {size} bytes.')
+        return Download(url, destination, written, offset, time.monotonic() - started, resumes)
+
+    async def download_attachments(self, items, directory, submissions=True, max_workers=32, max_per_host=8, resume=True, manifest=None):
+        """
+        Download every file attached to a set of models, or to the assignments of a section, several at a time.
+
+        See Schoology.download_attachments.
+
+        :param items: Section ID, or models fetched with their attachments, e.g. the result of get_assignments.
+        :param directory: Directory to save the files into, created if need be.
+        :param submissions: When items is a section ID, whether to include the files attached to submissions.
+        :param max_workers: Maximum number of downloads in progress at once.
+        :param max_per_host: Maximum number of downloads in progress at once from the same host.
+        :param resume: Whether to continue partial files left in the directory by an earlier run.
+        :param manifest: Optional path to write the list of results to as JSON.
+        :return: List with a dictionary per file giving its URL, path and size, or the error its download ran into.
+        """
+        if isinstance(items, (int, str)):
+            items = await self._section_attachments(items, submissions, max_workers)
+        files = attachment_files(items)
+        os.makedirs(directory, exist_ok=True)
+        semaphore = asyncio.Semaphore(max_workers)
+        hosts = {urlparse(file['download_path']).netloc: None for file in files}
+        hosts = {host: asyncio.Semaphore(max_per_host) for host in hosts}
+
+        async def download(file):
+            path = attachment_path(directory, file)
+            async with semaphore, hosts[urlparse(file['download_path']).netloc]:
+                try:
+                    return manifest_entry(file, path, await self.download_file(file['download_path'], path, resume=resume))
+                except Exception as e:
+                    return manifest_entry(file, path, e)
+
+        results = await asyncio.gather(*[download(file) for file in files])
+        if manifest is not None:
+            with open(manifest, 'w') as f:
+                json.dump(results, f, indent=4)
+        return results
+
+    async def _section_attachments(self, section_id, submissions, max_workers):
+        assignments = [assignment async for assignment in self.paginate(self.get_assignments, section_id, with_attachments=True)]
+        items = [assignments]
+        if submissions:
+            async def revisions(assignment_id):
+                return [revision async for revision in self.paginate(self.get_assignment_submissions, section_id, assignment_id)]
+
+            results = await self.get_many(revisions, [assignment['id'] for assignment in assignments], max_workers=max_workers)
+            items += [result for result in results if not isinstance(result, Exception)]
+        return items
+
+
+def _replayable(value):
+    """
+    Read an argument that may not survive being iterated over more than once, such as a generator, into a list.
+
+    :param value: Argument of a replayed method.
+    :return: The argument, or a list of its items.
+    """
+    if isinstance(value, Iterable) and not isinstance(value, (Sequence, Mapping, str, bytes)):
+        return list(value)
+    return value
+
+
+def _mirror(name):
+    method = getattr(Schoology, name)
+
+    @functools.wraps(method)
+    async def call(self, *args, **kwargs):
+        return await self._call(getattr(self._sync, name), *args, **kwargs)
+    return call
+
+
+for _name, _method in list(vars(Schoology).items()):
+    if not _name.startswith('_') and callable(_method) and _name not in vars(AsyncSchoology):
+        setattr(AsyncSchoology, _name, _mirror(_name))
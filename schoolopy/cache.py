@@ -0,0 +1,197 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def _overlaps(path, other):
+    """
+    Check whether one endpoint path is the same as, or nested within, another.
+    """
+    return path == other or path.startswith(other + '/') or other.startswith(path + '/')
+
+
+class ResponseCache:
+    """
+    In-memory cache of decoded GET responses, expiring entries after a per-endpoint TTL and evicting the least recently used.
+
+    Keys identify a request by its path and normalized URL parameters. Entries are also stored under their path so that
+    a write to an overlapping path can invalidate them.
+    """
+    def __init__(self, max_size=1024, ttl=300, ttls=None):
+        """
+        :param max_size: Maximum number of responses kept.
+        :param ttl: Seconds a response stays fresh, None to keep it until evicted or 0 not to cache it at all.
+        :param ttls: Dictionary mapping endpoint paths to their own TTL, e.g. {'roles': 3600}.
+                     The entry for the longest matching path prefix applies.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, path):
+        """
+        Look up the TTL applying to an endpoint.
+
+        :param path: Path (following API root) to endpoint.
+        :return: TTL in seconds, None for no expiry.
+        """
+        matches = [prefix for prefix in self.ttls if path == prefix or path.startswith(prefix.rstrip('/') + '/')]
+        if matches:
+            return self.ttls[max(matches, key=len)]
+        return self.ttl
+
+    def get(self, key):
+        """
+        Get a fresh response from the cache.
+
+        :param key: Key of the request.
+        :return: Cached response, or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[2] is None or entry[2] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, path, value):
+        """
+        Store a response in the cache.
+
+        :param key: Key of the request.
+        :param path: Path (following API root) the response came from.
+        :param value: Decoded response.
+        """
+        path = path.strip('/')
+        ttl = self.ttl_for(path)
+        if value is None or ttl == 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, path, None if ttl is None else time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """
+        Drop every response from a path overlapping the given one.
+
+        :param path: Path (following API root) that was written to.
+        """
+        path = path.strip('/')
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if _overlaps(entry[1], path)]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Drop every response.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Response cache persisted in a SQLite database, so that it survives restarts and can be shared between processes.
+
+    Behaves as ResponseCache does, except that max_size is enforced every compact_interval writes rather than on each one.
+    Responses are stored as JSON.
+    """
+    def __init__(self, filename, max_size=100000, ttl=300, ttls=None, compact_interval=256):
+        """
+        :param filename: Path of the database file, created if need be.
+        :param max_size: Maximum number of responses kept.
+        :param ttl: Seconds a response stays fresh, None to keep it until evicted or 0 not to cache it at all.
+        :param ttls: Dictionary mapping endpoint paths to their own TTL, e.g. {'roles': 3600}.
+        :param compact_interval: Number of writes between removals of expired and excess responses.
+        """
+        super().__init__(max_size, ttl, ttls)
+        self.filename = filename
+        self.compact_interval = compact_interval
+        self._writes = 0
+        self._connection = sqlite3.connect(filename, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS responses ('
+                                     'key TEXT PRIMARY KEY, path TEXT NOT NULL, value TEXT NOT NULL, expires REAL, accessed REAL NOT NULL)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS responses_path ON responses (path)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute('SELECT value, expires FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is not None and (row[1] is None or row[1] > now):
+                self._connection.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+                self.hits += 1
+                return json.loads(row[0])
+            if row is not None:
+                self._connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self.misses += 1
+            return None
+
+    def set(self, key, path, value):
+        path = path.strip('/')
+        ttl = self.ttl_for(path)
+        if value is None or ttl == 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                                     (key, path, json.dumps(value), None if ttl is None else now + ttl, now))
+            self._writes += 1
+            if self._writes % self.compact_interval == 0:
+                self._trim()
+
+    def invalidate(self, path):
+        path = path.strip('/')
+        with self._lock:
+            self._connection.execute('DELETE FROM responses WHERE path = ? '
+                                     'OR substr(path, 1, length(?) + 1) = ? || \'/\' '
+                                     'OR substr(?, 1, length(path) + 1) = path || \'/\'',
+                                     (path, path, path, path))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute('DELETE FROM responses')
+
+    def _trim(self):
+        """
+        Remove expired responses, then the least recently used beyond max_size. The lock must be held.
+        """
+        self._connection.execute('DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?', (time.time(),))
+        self._connection.execute('DELETE FROM responses WHERE key IN '
+                                 '(SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)', (self.max_size,))
+
+    def compact(self):
+        """
+        Remove expired and excess responses and reclaim the space they took up on disk.
+        """
+        with self._lock:
+            self._trim()
+            self._connection.execute('VACUUM')
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
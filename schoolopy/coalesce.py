@@ -0,0 +1,79 @@
+import asyncio
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Lets concurrent callers asking for the same key share one call and its result.
+
+    The first caller for a key makes the call; any others arriving before it finishes wait for its result, or
+    its exception, instead of making their own. coalesced counts the calls saved this way.
+    """
+    def __init__(self):
+        self.coalesced = 0
+        self._calls = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function):
+        """
+        Call a function, unless a call for the same key is already in progress on another thread.
+
+        :param key: Key identifying the call.
+        :param function: Function taking no arguments to call.
+        :return: Result of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key, function):
+        """
+        Await a coroutine function, unless a call for the same key is already in progress on the event loop.
+
+        :param key: Key identifying the call.
+        :param function: Coroutine function taking no arguments to await.
+        :return: Result of the call.
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+        future = self._futures[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await function()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, as there may be no one else waiting for it.
+            future.exception()
+            raise
+        finally:
+            del self._futures[key]
@@ -0,0 +1,110 @@
+import json
+from collections.abc import Mapping, Sequence
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _plain(obj):
+    """
+    Convert an object the JSON libraries cannot encode by themselves, such as a compact or lazy model or a
+    LazySequence, to one they can.
+
+    :param obj: Object to convert.
+    :return: Dictionary or list.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+        return list(obj)
+    raise TypeError('Object of type %s is not JSON serializable' % type(obj).__name__)
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes responses using the standard library's json module.
+
+    Other codecs expose the same loads() and dumps() methods; any decoding error they raise is a ValueError.
+    Models that are mappings rather than dicts, such as compact and lazy models, are encoded as dictionaries, and
+    lazy sequences as lists.
+    """
+    name = 'json'
+
+    def loads(self, data):
+        """
+        :param data: JSON document as bytes or str.
+        :return: Decoded object.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """
+        :param obj: Object to encode.
+        :return: JSON document as bytes.
+        """
+        return json.dumps(obj, default=_plain).encode('utf-8')
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec backed by orjson.
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires orjson. Install it with pip3 install orjson.')
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj, default=_plain)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Codec backed by ujson.
+    """
+    name = 'ujson'
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError('UjsonCodec requires ujson. Install it with pip3 install ujson.')
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+    def dumps(self, obj):
+        return ujson.dumps(obj, default=_plain).encode('utf-8')
+
+
+def available_codecs():
+    """
+    Instantiate every codec whose library is installed, fastest first.
+
+    :return: List of codecs.
+    """
+    codecs = []
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    if ujson is not None:
+        codecs.append(UjsonCodec())
+    codecs.append(JSONCodec())
+    return codecs
+
+
+def default_codec():
+    """
+    Get the fastest codec installed.
+
+    :return: OrjsonCodec or UjsonCodec when available, JSONCodec otherwise.
+    """
+    return available_codecs()[0]
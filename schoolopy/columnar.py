@@ -0,0 +1,168 @@
+from itertools import zip_longest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def _getter(field):
+    """
+    Build a function reading a field from a model, following dots into nested objects, as in 'links.self'.
+
+    :param field: Name or dotted path of the field.
+    :return: Function taking a model and returning the field's value, or None if it is missing.
+    """
+    if '.' not in field:
+        return lambda item: item.get(field)
+    path = field.split('.')
+
+    def get(item):
+        for key in path:
+            if not hasattr(item, 'get'):
+                return None
+            item = item.get(key)
+        return item
+    return get
+
+
+def to_columns(items, fields=None, types=None):
+    """
+    Gather models into columns, one list of values per field, in a single pass over them.
+
+    :param items: Models, or any mappings, as a list or an iterator; pass sc.paginate(method, ...) to read every page
+                  of a list endpoint without holding its models.
+    :param fields: Names of the fields to gather, in order, which may be dotted paths into nested objects, as in
+                   'links.self'. By default, every field of any item, in the order they are first seen.
+    :param types: Dictionary mapping fields to functions converting their values, e.g. {'uid': int}, as the API
+                  returns many numbers as strings. Missing values are left as None.
+    :return: Dictionary mapping each field to the list of its values, holding None where an item lacks the field.
+    """
+    names = list(fields or [])
+    known = set(names)
+    getters = [_getter(name) for name in names] if any('.' in name for name in names) else None
+    rows = []
+    for item in items:
+        if fields is None and not known.issuperset(item):
+            for name in item:
+                if name not in known:
+                    known.add(name)
+                    names.append(name)
+        # Reading a row through the item's own get() keeps the loop over fields out of Python for plain names.
+        rows.append(tuple(map(item.get, names)) if getters is None else tuple(get(item) for get in getters))
+    # Rows read before a field first appeared are shorter; zip_longest pads them with None.
+    columns = dict(zip(names, map(list, zip_longest(*rows)))) if rows else {name: [] for name in names}
+    for name, convert in (types or {}).items():
+        if name in columns:
+            columns[name] = [None if value is None else convert(value) for value in columns[name]]
+    return columns
+
+
+def _array(values):
+    """
+    Build a NumPy array of the narrowest type holding a column's values: bool, int64, float64 or, failing those, object.
+
+    :param values: List of values.
+    :return: NumPy array.
+    """
+    kinds = {type(value) for value in values}
+    if kinds == {bool}:
+        return numpy.array(values, dtype=bool)
+    if kinds == {int}:
+        try:
+            return numpy.array(values, dtype=numpy.int64)
+        except OverflowError:
+            # Integers beyond int64 are kept exact as Python ints.
+            kinds = set()
+    if kinds and kinds <= {int, float, type(None)} and kinds != {type(None)}:
+        return numpy.array([numpy.nan if value is None else value for value in values], dtype=numpy.float64)
+    # Filled in place so that nested lists stay objects instead of becoming another dimension.
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def to_numpy(items, fields=None, types=None):
+    """
+    Gather models into typed NumPy arrays, one per field. Requires numpy.
+
+    Columns of booleans become bool arrays, of integers int64 arrays, of numbers with some missing float64 arrays with
+    NaN in their place, and any other column an object array.
+
+    :param items: Models, as a list or an iterator, as for to_columns.
+    :param fields: Names of the fields to gather, as for to_columns.
+    :param types: Functions converting the values of fields, as for to_columns.
+    :return: Dictionary mapping each field to its array.
+    """
+    if numpy is None:
+        raise ImportError('to_numpy requires numpy. Install it with pip3 install numpy.')
+    return {field: _array(values) for field, values in to_columns(items, fields, types).items()}
+
+
+def _arrow_array(values):
+    """
+    Build an Arrow array from a column's values, falling back to their text for columns Arrow cannot type, such as
+    those mixing numbers and strings or holding integers beyond int64.
+
+    :param values: List of values.
+    :return: Arrow array.
+    """
+    try:
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+        return pyarrow.array([None if value is None else str(value) for value in values], type=pyarrow.string())
+
+
+def to_arrow(items, fields=None, types=None):
+    """
+    Gather models into an Arrow table, with nested objects as structs and lists. Requires pyarrow.
+
+    :param items: Models, as a list or an iterator, as for to_columns.
+    :param fields: Names of the fields to gather, as for to_columns.
+    :param types: Functions converting the values of fields, as for to_columns.
+    :return: pyarrow.Table.
+    """
+    if pyarrow is None:
+        raise ImportError('to_arrow requires pyarrow. Install it with pip3 install pyarrow.')
+    columns = to_columns(items, fields, types)
+    return pyarrow.table({field: _arrow_array(values) for field, values in columns.items()})
+
+
+def to_pandas(items, fields=None, types=None):
+    """
+    Gather models into a pandas DataFrame, built from typed arrays rather than row by row. Requires pandas.
+
+    :param items: Models, as a list or an iterator, as for to_columns.
+    :param fields: Names of the fields to gather, as for to_columns.
+    :param types: Functions converting the values of fields, as for to_columns.
+    :return: pandas.DataFrame.
+    """
+    if pandas is None:
+        raise ImportError('to_pandas requires pandas. Install it with pip3 install pandas.')
+    return pandas.DataFrame(to_numpy(items, fields, types))
+
+
+def to_parquet(items, path, fields=None, types=None, **kwargs):
+    """
+    Write models to a Parquet file. Requires pyarrow.
+
+    :param items: Models, as a list or an iterator, as for to_columns.
+    :param path: Path or file-like object to write to.
+    :param fields: Names of the fields to gather, as for to_columns.
+    :param types: Functions converting the values of fields, as for to_columns.
+    :param kwargs: Options passed on to pyarrow.parquet.write_table, such as compression.
+    """
+    if pyarrow is None:
+        raise ImportError('to_parquet requires pyarrow. Install it with pip3 install pyarrow.')
+    pyarrow.parquet.write_table(to_arrow(items, fields, types), path, **kwargs)
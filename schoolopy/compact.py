@@ -0,0 +1,220 @@
+from collections.abc import MutableMapping
+
+from . import models
+
+
+class _compact_model(MutableMapping):
+    """
+    Model keeping the fields its class declares in slots, rather than in a dictionary of its own, and any other
+    fields in a spill dictionary only created when there are some.
+
+    Fields can be read and written as attributes or items, as with the dict-based models, but compact models are
+    mappings rather than dicts: use dict(model) where a real dictionary is needed.
+    """
+    __slots__ = ('_extra', '__weakref__')
+    _fields = frozenset()
+    _order = ()
+    _setters = {}
+
+    def __init__(self, json={}):
+        setters = self._setters
+        extra = None
+        for key, value in json.items():
+            setter = setters.get(key)
+            if setter is not None:
+                setter(self, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        object.__setattr__(self, '_extra', extra)
+
+    def __getattr__(self, name):
+        # Only reached for fields not set in their slot and for undeclared fields.
+        extra = object.__getattribute__(self, '_extra') if name != '_extra' else None
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self._fields:
+            object.__setattr__(self, key, value)
+        else:
+            if self._extra is None:
+                object.__setattr__(self, '_extra', {})
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._fields:
+            try:
+                object.__delattr__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __iter__(self):
+        for key in self._order:
+            try:
+                object.__getattribute__(self, key)
+            except AttributeError:
+                continue
+            yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, MutableMapping)):
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    def __getstate__(self):
+        return dict(self)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_extra', None)
+        self.update(state)
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, self.json())
+
+    def json(self):
+        return dict.__repr__(dict(self))
+
+
+def _compact(model, fields=()):
+    """
+    Create the compact counterpart of a dict-based model class.
+
+    :param model: Model class from the models module.
+    :param fields: Names of the fields to keep in slots, typically those the API returns for every object.
+    """
+    # Fields named like methods of the class can only live in the spill dictionary.
+    fields = [field for field in fields if not hasattr(_compact_model, field)]
+    cls = type(model.__name__, (_compact_model,), {
+        '__slots__': tuple(fields),
+        '__module__': __name__,
+        '_fields': frozenset(fields),
+        '_order': tuple(fields),
+    })
+    # Setting slots through their descriptors skips the lookup object.__setattr__ goes through.
+    cls._setters = {field: vars(cls)[field].__set__ for field in fields}
+    return cls
+
+
+_common = ('id', 'title', 'description', 'created', 'last_updated', 'links')
+
+School = _compact(models.School, ('id', 'title', 'address1', 'address2', 'city', 'state', 'postal_code', 'country',
+                                  'website', 'phone', 'fax', 'picture_url', 'links'))
+Building = _compact(models.Building, ('id', 'title', 'address1', 'address2', 'city', 'state', 'postal_code', 'country',
+                                      'website', 'phone', 'fax', 'building_code', 'picture_url', 'links'))
+User = _compact(models.User, ('uid', 'id', 'school_id', 'synced', 'school_uid', 'building_id', 'additional_buildings',
+                              'name_title', 'name_title_show', 'name_first', 'name_first_preferred',
+                              'use_preferred_first_name', 'name_middle', 'name_middle_show', 'name_last', 'name_display',
+                              'username', 'primary_email', 'picture_url', 'gender', 'position', 'grad_year', 'password',
+                              'role_id', 'tz_offset', 'tz_name', 'parents', 'child_uids', 'send_message', 'language',
+                              'permissions', 'links'))
+Enrollment = _compact(models.Enrollment, ('id', 'uid', 'school_uid', 'name_title', 'name_title_show', 'name_first',
+                                          'name_first_preferred', 'use_preferred_first_name', 'name_middle',
+                                          'name_middle_show', 'name_last', 'name_display', 'admin', 'status',
+                                          'picture_url', 'links'))
+Group = _compact(models.Group, ('id', 'title', 'description', 'website', 'access_code', 'category', 'group_code',
+                                'privacy_level', 'picture_url', 'school_id', 'building_id', 'options', 'links'))
+Course = _compact(models.Course, ('id', 'building_id', 'title', 'course_code', 'department', 'description', 'credits',
+                                  'subject_area', 'grade_level_range_start', 'grade_level_range_end', 'synced', 'links'))
+Section = _compact(models.Section, ('id', 'course_title', 'course_code', 'course_id', 'school_id', 'building_id',
+                                    'access_code', 'section_title', 'section_code', 'section_school_code', 'synced',
+                                    'active', 'description', 'parent_id', 'grading_periods', 'profile_url', 'location',
+                                    'meeting_days', 'start_time', 'end_time', 'class_periods', 'options', 'links'))
+Event = _compact(models.Event, ('id', 'title', 'description', 'start', 'has_end', 'end', 'all_day', 'editable',
+                                'rsvp', 'comments_enabled', 'type', 'assignment_id', 'web_url', 'realm', 'section_id',
+                                'group_id', 'school_id', 'district_id', 'user_id', 'links'))
+BlogPost = _compact(models.BlogPost, ('id', 'uid', 'title', 'body', 'created', 'last_updated', 'num_comments',
+                                      'published', 'links'))
+BlogPostComment = _compact(models.BlogPostComment, ('id', 'uid', 'comment', 'created', 'parent_id', 'status', 'likes',
+                                                    'user_like_action', 'links'))
+Discussion = _compact(models.Discussion, ('id', 'uid', 'title', 'body', 'graded', 'weight', 'num_comments',
+                                          'last_updated', 'published', 'available', 'completed', 'web_url', 'links'))
+DiscussionReply = _compact(models.DiscussionReply, ('id', 'uid', 'comment', 'created', 'parent_id', 'status', 'likes',
+                                                    'user_like_action', 'links'))
+Update = _compact(models.Update, ('id', 'body', 'uid', 'created', 'last_updated', 'likes', 'user_like_action',
+                                  'realm', 'group_id', 'section_id', 'school_id', 'num_comments', 'links'))
+UpdateComment = _compact(models.UpdateComment, ('id', 'uid', 'comment', 'created', 'parent_id', 'status', 'likes',
+                                                'user_like_action', 'links'))
+Reminder = _compact(models.Reminder, _common)
+MediaAlbum = _compact(models.MediaAlbum, ('id', 'title', 'description', 'cover_image_url', 'content_count',
+                                          'photo_count', 'video_count', 'audio_count', 'created', 'links'))
+Media = _compact(models.Media, ('id', 'album_id', 'caption', 'type', 'created', 'url', 'links'))
+Document = _compact(models.Document, ('id', 'title', 'course_fid', 'attachments', 'links'))
+GradingScale = _compact(models.GradingScale, ('id', 'title', 'scale', 'links'))
+GradingCategory = _compact(models.GradingCategory, ('id', 'title', 'delta', 'weight', 'calculation_type', 'links'))
+GradingGroup = _compact(models.GradingGroup, ('id', 'title', 'members', 'links'))
+Rubric = _compact(models.Rubric, ('id', 'title', 'total_points', 'criteria', 'links'))
+Assignment = _compact(models.Assignment, ('id', 'title', 'description', 'due', 'grading_scale', 'grading_period',
+                                          'grading_category', 'max_points', 'factor', 'is_final', 'show_comments',
+                                          'grade_stats', 'allow_dropbox', 'allow_discussion', 'published', 'type',
+                                          'grade_item_id', 'available', 'completed', 'dropbox_locked',
+                                          'grading_scale_type', 'show_rubric', 'display_weight', 'folder_id',
+                                          'assignment_type', 'web_url', 'num_assignees', 'assignees',
+                                          'grading_group_ids', 'completion_status', 'attachments', 'links'))
+Page = _compact(models.Page, ('id', 'title', 'body', 'inline', 'published', 'available', 'completed', 'links'))
+FriendRequest = _compact(models.FriendRequest, ('id', 'uid', 'created', 'links'))
+Invite = _compact(models.Invite, ('id', 'invite_token', 'created', 'links'))
+Grade = _compact(models.Grade, ('enrollment_id', 'assignment_id', 'grade', 'exception', 'max_points', 'is_final',
+                                'timestamp', 'comment', 'comment_status', 'override', 'calculated_grade', 'pending',
+                                'type', 'location', 'scale_id', 'scale_type', 'category_id', 'links'))
+Language = _compact(models.Language, ('language_code', 'language_name'))
+Association = _compact(models.Association, ('id', 'uid', 'parent_uid', 'child_uid', 'links'))
+Session = _compact(models.Session, ('api_uid', 'web_session_timestamp'))
+MessageThread = _compact(models.MessageThread, ('id', 'subject', 'recipient_ids', 'last_updated', 'author_id',
+                                                'message_status', 'message', 'links'))
+Message = _compact(models.Message, ('id', 'subject', 'recipient_ids', 'last_updated', 'author_id', 'message_status',
+                                    'message', 'links'))
+Action = _compact(models.Action, ('action_type', 'item_type', 'item_id', 'uid', 'timestamp', 'links'))
+Role = _compact(models.Role, ('id', 'title', 'faculty', 'role_type', 'links'))
+GradingPeriod = _compact(models.GradingPeriod, ('id', 'title', 'start', 'end', 'links'))
+CourseFolder = _compact(models.CourseFolder, ('id', 'title', 'body', 'folder_id', 'color', 'available', 'completed',
+                                              'links'))
+Submission = _compact(models.Submission, ('revision_id', 'uid', 'created', 'num_items', 'late', 'draft',
+                                          'attachments', 'links'))
+
+# Compact counterpart of each dict-based model class.
+MODELS = {getattr(models, compact.__name__): compact for compact in list(globals().values())
+          if isinstance(compact, type) and issubclass(compact, _compact_model) and compact is not _compact_model}
@@ -0,0 +1,105 @@
+import os
+import re
+from collections.abc import Mapping
+
+_content_range = re.compile(r'bytes (?:\d+-\d+|\*)/(\d+|\*)')
+
+
+class Download:
+    """
+    Outcome of a file download.
+    """
+    def __init__(self, url, destination, size, resumed_from, elapsed, resumes):
+        """
+        :param url: URL downloaded.
+        :param destination: Path or file-like object written to.
+        :param size: Size of the file in bytes.
+        :param resumed_from: Number of bytes already present before the download began.
+        :param elapsed: Seconds the download took.
+        :param resumes: Number of times the download was resumed after losing its connection.
+        """
+        self.url = url
+        self.destination = destination
+        self.size = size
+        self.resumed_from = resumed_from
+        self.elapsed = elapsed
+        self.resumes = resumes
+
+    @property
+    def throughput(self):
+        """
+        Bytes transferred per second.
+        """
+        return (self.size - self.resumed_from) / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return 'Download(%r, %d bytes, %.1fs, %.0f B/s, %d resumes)' % (self.url, self.size, self.elapsed, self.throughput, self.resumes)
+
+
+def expected_size(status, headers):
+    """
+    Work out the full size of a file from the headers of a response to a (possibly ranged) request for it.
+
+    :param status: HTTP status code of the response. Content-Range is read for 206 and 416 responses.
+    :param headers: Headers of the response.
+    :return: Size in bytes, or None if unknown.
+    """
+    if status in (206, 416):
+        match = _content_range.match(headers.get('Content-Range', ''))
+        if match and match.group(1) != '*':
+            return int(match.group(1))
+        return None
+    length = headers.get('Content-Length')
+    return int(length) if length is not None and 'Content-Encoding' not in headers else None
+
+
+def attachment_files(items):
+    """
+    Collect the file attachments of models fetched with their attachments, such as assignments and submission revisions.
+
+    :param items: Models, or lists of models, holding attachment metadata.
+    :return: List of the attachments' file objects, each with an id, filename and download_path, in order and without duplicates.
+    """
+    files = []
+    seen = set()
+    for item in items:
+        for model in [item] if isinstance(item, Mapping) else item:
+            for file in ((model.get('attachments') or {}).get('files') or {}).get('file') or []:
+                if file.get('download_path') and file['download_path'] not in seen:
+                    seen.add(file['download_path'])
+                    files.append(file)
+    return files
+
+
+def attachment_path(directory, file):
+    """
+    Choose where in a directory to save an attachment, prefixing its filename with its ID to keep names unique.
+
+    :param directory: Directory to save into.
+    :param file: Attachment's file object.
+    :return: Path to save the attachment to.
+    """
+    filename = os.path.basename(file.get('filename') or file.get('title') or 'attachment')
+    return os.path.join(directory, '%s-%s' % (file.get('id'), filename))
+
+
+def manifest_entry(file, path, result):
+    """
+    Describe the outcome of downloading an attachment.
+
+    :param file: Attachment's file object.
+    :param path: Path the attachment was saved to.
+    :param result: Download object, or the exception raised if the download failed.
+    :return: Dictionary suitable for writing out as JSON.
+    """
+    entry = {
+        'id': file.get('id'),
+        'filename': file.get('filename'),
+        'url': file['download_path'],
+        'path': path,
+    }
+    if isinstance(result, Exception):
+        entry['error'] = '%s: %s' % (type(result).__name__, result)
+    else:
+        entry.update(size=result.size, elapsed=result.elapsed, resumes=result.resumes)
+    return entry
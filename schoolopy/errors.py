@@ -12,3 +12,11 @@ class NoDataError(Exception):
     from a standard API endpoint.
     """
     pass
+
+
+class IncompleteDownloadError(Exception):
+    """
+    This exception represents a case where a file download ended with fewer or more
+    bytes than the server announced.
+    """
+    pass
@@ -0,0 +1,483 @@
+import http.client
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+def user(i):
+    """
+    Build a user as returned by the users endpoints.
+
+    :param i: Index of the user.
+    """
+    return {
+        'uid': str(100000 + i),
+        'id': str(100000 + i),
+        'school_id': '2000001',
+        'synced': '1',
+        'school_uid': 'S%06d' % i,
+        'building_id': '2000001',
+        'additional_buildings': '',
+        'name_title': '',
+        'name_title_show': '0',
+        'name_first': 'First%d' % i,
+        'name_first_preferred': '',
+        'use_preferred_first_name': '1',
+        'name_middle': '',
+        'name_middle_show': '0',
+        'name_last': 'Last%d' % i,
+        'name_display': 'First%d Last%d' % (i, i),
+        'username': 'user%d' % i,
+        'primary_email': 'user%d@example.org' % i,
+        'picture_url': 'https://asset-cdn.schoology.com/system/files/imagecache/profile_reg/pictures/picture-%d.jpg' % i,
+        'gender': ['M', 'F', ''][i % 3],
+        'position': None,
+        'grad_year': str(2025 + i % 4),
+        'password': '',
+        'role_id': str([258937, 258938, 258939][i % 3]),
+        'tz_offset': -5,
+        'tz_name': 'America/New_York',
+        'parents': None,
+        'child_uids': None,
+        'send_message': 0,
+        'language': 'en',
+        'permissions': {'is_directory_public': 1, 'allow_connections': 1},
+    }
+
+
+def section(i):
+    """
+    Build a section as returned by the sections endpoints.
+
+    :param i: Index of the section.
+    """
+    return {
+        'id': str(4000000 + i),
+        'course_title': 'Course %d' % i,
+        'course_code': 'C%03d' % i,
+        'course_id': str(3000000 + i),
+        'school_id': '2000001',
+        'building_id': '2000001',
+        'access_code': '',
+        'section_title': 'Section %d' % i,
+        'section_code': 'S%03d' % i,
+        'section_school_code': '',
+        'synced': '1',
+        'active': 1,
+        'description': '',
+        'parent_id': '0',
+        'grading_periods': [800001],
+        'profile_url': 'https://asset-cdn.schoology.com/sites/all/themes/schoology_theme/images/course-default.svg',
+        'location': '',
+        'meeting_days': [''],
+        'start_time': '',
+        'end_time': '',
+        'class_periods': '',
+        'options': {'weighted_grading_categories': '0', 'upload_documents': '1', 'member_post': '1'},
+        'links': {'self': 'https://api.schoology.com/v1/sections/%d' % (4000000 + i)},
+    }
+
+
+def enrollment(i):
+    """
+    Build an enrollment as returned by the enrollments endpoints.
+
+    :param i: Index of the enrollment, which is also that of its user.
+    """
+    return {
+        'id': str(300000000 + i),
+        'uid': str(100000 + i),
+        'school_uid': 'S%06d' % i,
+        'name_title': '',
+        'name_title_show': 0,
+        'name_first': 'First%d' % i,
+        'name_first_preferred': '',
+        'use_preferred_first_name': '1',
+        'name_middle': '',
+        'name_middle_show': 0,
+        'name_last': 'Last%d' % i,
+        'name_display': 'First%d Last%d' % (i, i),
+        'admin': 1 if i % 25 == 0 else 0,
+        'status': '1',
+        'picture_url': 'https://asset-cdn.schoology.com/system/files/imagecache/profile_tiny/pictures/picture-%d.jpg' % i,
+        'links': {'self': 'https://api.schoology.com/v1/sections/4000001/enrollments/%d' % (300000000 + i)},
+    }
+
+
+def update(i, users=500, sections=10):
+    """
+    Build an update as returned by the feed, posted by one of the users in one of the sections.
+
+    :param i: Index of the update.
+    :param users: Number of users to pick the poster among.
+    :param sections: Number of sections to pick the section among.
+    """
+    return {
+        'id': str(600000000 + i),
+        'body': 'Reminder: update %d about this week\'s reading.' % i,
+        'uid': str(100000 + i % max(users, 1)),
+        'created': 1760000000 + i * 60,
+        'last_updated': 1760000000 + i * 60,
+        'likes': i % 7,
+        'user_like_action': False,
+        'realm': 'section',
+        'section_id': str(4000000 + i % max(sections, 1)),
+        'num_comments': i % 3,
+        'links': {'self': 'https://api.schoology.com/v1/sections/%d/updates/%d' % (4000000 + i % max(sections, 1), 600000000 + i)},
+    }
+
+
+def assignment(i, api_host='https://api.schoology.com/v1/'):
+    """
+    Build an assignment with one file attached, as returned by the assignments endpoints.
+
+    :param i: Index of the assignment.
+    :param api_host: Root URL of the API, which the attachment is downloaded from.
+    """
+    return {
+        'id': str(500000000 + i),
+        'title': 'Assignment %d' % i,
+        'description': 'Read chapter %d and answer the questions at the end. ' % i * 4,
+        'due': '2026-10-%02d 23:59:00' % (i % 28 + 1),
+        'grading_scale': '21',
+        'grading_period': '800001',
+        'grading_category': '900001',
+        'max_points': '100',
+        'factor': '1',
+        'is_final': '0',
+        'show_comments': '0',
+        'grade_stats': '0',
+        'allow_dropbox': '1',
+        'allow_discussion': '0',
+        'published': '1',
+        'type': 'assignment',
+        'grade_item_id': str(500000000 + i),
+        'available': 1,
+        'completed': 0,
+        'dropbox_locked': 0,
+        'grading_scale_type': 1,
+        'show_rubric': False,
+        'display_weight': str(i),
+        'folder_id': '0',
+        'assignment_type': 'basic',
+        'web_url': 'https://app.schoology.com/assignment/%d' % (500000000 + i),
+        'num_assignees': 30,
+        'assignees': [],
+        'grading_group_ids': [],
+        'completion_status': '',
+        'attachments': {'files': {'file': [{
+            'id': str(700000000 + i),
+            'type': 'file',
+            'title': 'worksheet-%d.pdf' % i,
+            'filename': 'worksheet-%d.pdf' % i,
+            'filesize': 48213 + i,
+            'md5_checksum': '%032x' % i,
+            'created': 1760000000 + i,
+            'timestamp': 1760000000 + i,
+            'filemime': 'application/pdf',
+            'extension': 'pdf',
+            'download_path': '%sattachment/%d/source/%032x.pdf' % (api_host, 700000000 + i, i),
+        }]}},
+        'links': {'self': 'https://api.schoology.com/v1/sections/4000001/assignments/%d' % (500000000 + i)},
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Leave room for many clients connecting at once, as in load tests.
+    request_queue_size = 128
+
+
+class FakeSchoology:
+    """
+    In-process stand-in for the Schoology API, serving generated users, sections, enrollments and assignments,
+    so that the client can be tested, benchmarked and load-tested without network access.
+
+    Pass it as the transport of a Schoology instance to have requests answered directly, without sockets, or call
+    serve() to expose it over HTTP, as AsyncSchoology needs. List endpoints are paginated as Schoology paginates them,
+    objects carry ETags, attachments support Range requests, and writes change the fixtures.
+    Responses can be slowed down with latency and made to fail with error_rate or fail().
+    """
+    def __init__(self, users=500, sections=10, enrollments=30, assignments=20, updates=50, file_size=65536, latency=0,
+                 error_rate=0, error_statuses=(500, 503), seed=0, api_host='https://api.schoology.com/v1/'):
+        """
+        :param users: Number of users in the school.
+        :param sections: Number of sections, all taught by the first user, who is the one authenticated.
+        :param enrollments: Number of enrollments per section.
+        :param assignments: Number of assignments per section, each with one attachment.
+        :param updates: Number of updates in the feed, posted by the users in the sections.
+        :param file_size: Size in bytes of each attachment.
+        :param latency: Seconds to wait before answering each request, or a (minimum, maximum) tuple to wait a
+                        random time in between.
+        :param error_rate: Fraction of requests, picked at random, to answer with one of error_statuses instead.
+        :param error_statuses: HTTP status codes to fail requests with.
+        :param seed: Seed of the random numbers used for latency and errors.
+        :param api_host: Root URL the fake answers to.
+        """
+        self.api_host = api_host
+        self.file_size = file_size
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._failures = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._next_id = 900000000
+
+        self.collections = {'users': ('user', [user(i) for i in range(users)])}
+        self.collections['users/%s/sections' % user(0)['uid']] = ('section', [section(i) for i in range(sections)])
+        for s in range(sections):
+            section_id = section(s)['id']
+            self.collections['sections/%s/enrollments' % section_id] = (
+                'enrollment', [enrollment(s * enrollments + i) for i in range(enrollments)])
+            self.collections['sections/%s/assignments' % section_id] = (
+                'assignment', [assignment(s * assignments + i, api_host) for i in range(assignments)])
+        self.collections['recent'] = ('update', [update(i, users, sections) for i in range(updates)])
+        self.objects = {'users/me': self.collections['users'][1][0]} if users else {}
+        for path, (key, items) in self.collections.items():
+            if key == 'section':
+                path = 'sections'
+            for item in items:
+                self.objects['%s/%s' % (path, item['id'])] = item
+
+    def fail(self, status, times=1, path=None):
+        """
+        Make upcoming requests fail.
+
+        :param status: HTTP status code to answer with.
+        :param times: Number of requests to fail.
+        :param path: Only fail requests to paths (following API root) beginning with this one.
+        """
+        with self._lock:
+            self._failures.extend([(status, path)] * times)
+
+    def request(self, verb, url, params=None, data=None, headers=None, **kwargs):
+        """
+        Answer a request, as a requests session would.
+
+        :param verb: HTTP method.
+        :param url: Full URL requested.
+        :param params: URL parameters to add.
+        :param data: Body of the request as JSON.
+        :param headers: Headers of the request.
+        :param kwargs: Further arguments of requests.Session.request. The JSON body may be passed as json, the rest are ignored.
+        :return: requests.Response.
+        """
+        parsed = urlparse(url)
+        path = parsed.path[len(urlparse(self.api_host).path):].strip('/')
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        query.update(params or {})
+        headers = CaseInsensitiveDict(headers or {})
+        body = json.loads(data) if data else kwargs.get('json')
+
+        latency = self.latency
+        if isinstance(latency, tuple):
+            latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+        with self._lock:
+            self.requests += 1
+            status = self._failure(path)
+            if status is not None:
+                self.errors += 1
+                return self._response(url, status, None, {'Retry-After': '0'} if status in (429, 503) else {})
+            return self._route(verb, url, path, query, body, headers)
+
+    def _failure(self, path):
+        """
+        Decide whether to fail a request. The lock must be held.
+
+        :return: HTTP status code to fail with, or None.
+        """
+        for i, (status, prefix) in enumerate(self._failures):
+            if prefix is None or path.startswith(prefix.strip('/')):
+                del self._failures[i]
+                return status
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._random.choice(self.error_statuses)
+        return None
+
+    def _route(self, verb, url, path, query, body, headers):
+        """
+        Answer a request with the fixtures. The lock must be held.
+        """
+        if path.startswith('attachment/') and verb == 'GET':
+            return self._file(url, headers)
+        if path == 'multiget' and verb == 'POST':
+            root = urlparse(self.api_host).path
+            responses = []
+            for request in body['request']:
+                response = self._route('GET', self.api_host + request[len(root):], *self._split(request[len(root):]),
+                                       None, CaseInsensitiveDict())
+                responses.append({'response_code': response.status_code, 'location': request,
+                                  'body': json.loads(response.content) if response.content else None})
+            return self._response(url, 200, {'response': responses})
+        if path == 'enrollments' and verb == 'DELETE':
+            ids = set(query.get('enrollment_ids', '').split(','))
+            for key, items in self.collections.values():
+                if key == 'enrollment':
+                    items[:] = [item for item in items if item['id'] not in ids]
+            self.objects = {path: item for path, item in self.objects.items()
+                            if '/enrollments/' not in path or item['id'] not in ids}
+            return self._response(url, 204, None)
+        if path in self.collections:
+            key, items = self.collections[path]
+            if verb == 'GET':
+                return self._page(url, path, key, items, query)
+            if verb in ('POST', 'PUT'):
+                return self._write(url, verb, path, key, items, body)
+        if path in self.objects:
+            item = self.objects[path]
+            if verb == 'GET':
+                etag = '"%08x"' % zlib.crc32(json.dumps(item, sort_keys=True).encode('utf-8'))
+                if headers.get('If-None-Match') == etag:
+                    return self._response(url, 304, None, {'ETag': etag})
+                return self._response(url, 200, item, {'ETag': etag})
+            if verb == 'PUT':
+                item.update(body or {})
+                return self._response(url, 204, None)
+            if verb == 'DELETE':
+                del self.objects[path]
+                for key, items in self.collections.values():
+                    if item in items:
+                        items.remove(item)
+                return self._response(url, 204, None)
+        return self._response(url, 404, None)
+
+    @staticmethod
+    def _split(path):
+        parsed = urlparse(path)
+        return parsed.path.strip('/'), {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+
+    def _page(self, url, path, key, items, query):
+        start = int(query.get('start', 0))
+        limit = int(query.get('limit', 20))
+        links = {'self': url}
+        if start + limit < len(items):
+            links['next'] = '%s%s?%s' % (self.api_host, path, urlencode(dict(query, start=start + limit, limit=limit)))
+        return self._response(url, 200, {key: items[start:start + limit], 'total': str(len(items)), 'links': links})
+
+    def _write(self, url, verb, path, key, items, body):
+        bulk = (body or {}).get(key + 's')
+        if bulk is None:
+            if verb != 'POST':
+                return self._response(url, 405, None)
+            return self._response(url, 201, self._create(path, items, body or {}))
+        results = []
+        for entry in bulk.get(key) or []:
+            if verb == 'POST':
+                results.append(dict(self._create(path, items, entry), response_code=201))
+                continue
+            existing = self.objects.get('%s/%s' % (path, entry.get('id')))
+            if existing is None:
+                results.append({'response_code': 404, 'id': entry.get('id'), 'message': 'Not found.'})
+            else:
+                existing.update(entry)
+                results.append({'response_code': 200, 'id': existing['id']})
+        return self._response(url, 200, {key: results})
+
+    def _create(self, path, items, entry):
+        self._next_id += 1
+        item = dict(entry, id=str(self._next_id))
+        items.append(item)
+        self.objects['%s/%s' % (path, item['id'])] = item
+        return item
+
+    def _file(self, url, headers):
+        content = bytes(range(256)) * (self.file_size // 256 + 1)
+        content = content[:self.file_size]
+        range_header = headers.get('Range', '')
+        if not range_header.startswith('bytes='):
+            return self._response(url, 200, content)
+        start = int(range_header[len('bytes='):].split('-')[0])
+        if start >= len(content):
+            return self._response(url, 416, None, {'Content-Range': 'bytes */%d' % len(content)})
+        return self._response(url, 206, content[start:],
+                              {'Content-Range': 'bytes %d-%d/%d' % (start, len(content) - 1, len(content))})
+
+    @staticmethod
+    def _response(url, status, payload, headers=None):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.client.responses.get(status, '')
+        response.url = url
+        response.headers = CaseInsensitiveDict(headers or {})
+        if isinstance(payload, bytes):
+            response._content = payload
+            response.headers['Content-Type'] = 'application/octet-stream'
+        elif payload is not None:
+            response._content = json.dumps(payload).encode('utf-8')
+            response.headers['Content-Type'] = 'application/json'
+        else:
+            response._content = b''
+        response.headers['Content-Length'] = str(len(response._content))
+        response._content_consumed = True
+        response.encoding = 'utf-8'
+        return response
+
+    def serve(self, host='127.0.0.1', port=0):
+        """
+        Answer requests over HTTP on a background thread.
+
+        :param host: Address to listen on.
+        :param port: Port to listen on, 0 for any free one.
+        :return: Root URL of the API as served, to pass as api_host.
+        """
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def handle_request(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                response = fake.request(self.command, origin + self.path, data=body or None, headers=dict(self.headers))
+                self.send_response(response.status_code)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = _Server((host, port), Handler)
+        origin = 'http://%s:%d' % (host, self._server.server_address[1])
+        served = origin + urlparse(self.api_host).path
+        with self._lock:
+            self._rebase(served)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return served
+
+    def _rebase(self, api_host):
+        """
+        Point the fake and the download links of its attachments at a new root URL. The lock must be held.
+        """
+        for key, items in self.collections.values():
+            if key == 'assignment':
+                for item in items:
+                    for file in item['attachments']['files']['file']:
+                        file['download_path'] = api_host + file['download_path'][len(self.api_host):]
+        self.api_host = api_host
+
+    def close(self):
+        """
+        Stop serving over HTTP.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
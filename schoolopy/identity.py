@@ -0,0 +1,94 @@
+import functools
+import threading
+import weakref
+
+
+class IdentityMap:
+    """
+    Keeps a single model instance per entity, keyed by model type and ID, so that an object returned by several
+    responses, such as a user appearing in enrollments, likes and networks, is one shared instance whose fields are
+    updated with those of each newer copy.
+
+    Pass one to Schoology as identity_map. By default instances are held weakly, so the map only knows of models still
+    in use elsewhere and never grows past them; get() tells whether one is held before fetching it again.
+    """
+    # Fields identifying objects of model types not identified by their id, or None for types whose objects carry no
+    # identity of their own. Submissions only have a revision_id, which counts up per user and assignment, so many
+    # unrelated submissions share one.
+    id_fields = {'Submission': None}
+
+    def __init__(self, weak=True):
+        """
+        :param weak: Whether to hold instances weakly. If False, they are held until clear() is called.
+        """
+        self._models = weakref.WeakValueDictionary() if weak else {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def _key(self, name, id):
+        return name, str(id)
+
+    def add(self, model):
+        """
+        Resolve a model to the instance held for its entity, merging its fields into that instance, or hold it if
+        there is none. Models of types without IDs, such as grades and submissions, are returned as they are.
+
+        :param model: Model object.
+        :return: Instance held for the entity.
+        """
+        name = type(model).__name__
+        field = self.id_fields.get(name, 'id')
+        id = model.get(field) if field is not None else None
+        if id is None:
+            return model
+        key = self._key(name, id)
+        with self._lock:
+            held = self._models.get(key)
+            if held is None:
+                self._models[key] = model
+                return model
+            self.hits += 1
+            if held is not model:
+                held.update(model)
+        return held
+
+    def factory(self, model):
+        """
+        Wrap a model class in a function building its instances through this map.
+
+        :param model: Model class.
+        :return: Function taking a decoded object and returning the instance held for it.
+        """
+        @functools.wraps(model, updated=())
+        def build(raw):
+            return self.add(model(raw))
+        return build
+
+    def get(self, model, id, default=None):
+        """
+        Look up the instance held for an entity.
+
+        :param model: Model class, of any model style, e.g. schoolopy.User.
+        :param id: ID of the entity.
+        :param default: Value to return if no instance is held.
+        :return: Model object, or default.
+        """
+        return self._models.get(self._key(model.__name__, id), default)
+
+    def __contains__(self, key):
+        """
+        :param key: Tuple of a model class and an ID.
+        """
+        model, id = key
+        return self.get(model, id) is not None
+
+    def __len__(self):
+        return len(self._models)
+
+    def clear(self):
+        """
+        Forget every instance held.
+        """
+        with self._lock:
+            self._models.clear()
+            self.hits = 0
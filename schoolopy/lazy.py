@@ -0,0 +1,192 @@
+from collections.abc import MutableMapping, Sequence
+
+from . import models
+
+
+class _lazy_model(MutableMapping):
+    """
+    Model wrapping an object decoded from a response as it is, instead of copying its fields, so that building one
+    costs next to nothing and fields are only looked up when accessed.
+
+    The object may be shared, e.g. with the response cache, so it is copied the first time the model is changed.
+    Fields can be read and written as attributes or items, as with the dict-based models, but lazy models are
+    mappings rather than dicts: use dict(model) where a real dictionary is needed.
+    """
+    __slots__ = ('_raw', '_owned', '__weakref__')
+
+    def __init__(self, json=None):
+        object.__setattr__(self, '_raw', {} if json is None else json)
+        object.__setattr__(self, '_owned', json is None)
+
+    def _own(self):
+        """
+        Copy the wrapped object before its first change.
+
+        :return: Object owned by this model.
+        """
+        if not self._owned:
+            object.__setattr__(self, '_raw', dict(self._raw))
+            object.__setattr__(self, '_owned', True)
+        return self._raw
+
+    def __getattr__(self, name):
+        # Only reached for names that are not attributes of the class.
+        try:
+            return object.__getattribute__(self, '_raw')[name]
+        except KeyError:
+            raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+    def __setattr__(self, name, value):
+        self._own()[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __getitem__(self, key):
+        return self._raw[key]
+
+    def __setitem__(self, key, value):
+        self._own()[key] = value
+
+    def __delitem__(self, key):
+        if key not in self._raw:
+            raise KeyError(key)
+        del self._own()[key]
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __contains__(self, key):
+        return key in self._raw
+
+    def get(self, key, default=None):
+        return self._raw.get(key, default)
+
+    def keys(self):
+        return self._raw.keys()
+
+    def items(self):
+        return self._raw.items()
+
+    def values(self):
+        return self._raw.values()
+
+    def __eq__(self, other):
+        if isinstance(other, _lazy_model):
+            return self._raw == other._raw
+        if isinstance(other, (dict, MutableMapping)):
+            return self._raw == dict(other)
+        return NotImplemented
+
+    def __getstate__(self):
+        return self._raw
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_raw', state)
+        object.__setattr__(self, '_owned', True)
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, self.json())
+
+    def json(self):
+        return dict.__repr__(self._raw)
+
+
+def _lazy(model):
+    """
+    Create the lazy counterpart of a dict-based model class.
+
+    :param model: Model class from the models module.
+    """
+    return type(model.__name__, (_lazy_model,), {'__slots__': (), '__module__': __name__})
+
+
+class LazySequence(Sequence):
+    """
+    List of objects from a response, wrapped in models only as they are accessed. Returned by list methods when
+    model_style is 'lazy'.
+
+    Each object's model is kept once made, so changes to it stick.
+    """
+    __slots__ = ('_model', '_raws', '_models')
+
+    def __init__(self, model, raws):
+        """
+        :param model: Model class, or function building models, to wrap objects in.
+        :param raws: List of decoded objects.
+        """
+        self._model = model
+        self._raws = raws
+        self._models = [None] * len(raws)
+
+    def __len__(self):
+        return len(self._raws)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        model = self._models[index]
+        if model is None:
+            model = self._models[index] = self._model(self._raws[index])
+        return model
+
+    def __iter__(self):
+        for i in range(len(self._raws)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazySequence)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return 'LazySequence(%d %s objects)' % (len(self), self._model.__name__)
+
+
+School = _lazy(models.School)
+Building = _lazy(models.Building)
+User = _lazy(models.User)
+Enrollment = _lazy(models.Enrollment)
+Group = _lazy(models.Group)
+Course = _lazy(models.Course)
+Section = _lazy(models.Section)
+Event = _lazy(models.Event)
+BlogPost = _lazy(models.BlogPost)
+BlogPostComment = _lazy(models.BlogPostComment)
+Discussion = _lazy(models.Discussion)
+DiscussionReply = _lazy(models.DiscussionReply)
+Update = _lazy(models.Update)
+UpdateComment = _lazy(models.UpdateComment)
+Reminder = _lazy(models.Reminder)
+MediaAlbum = _lazy(models.MediaAlbum)
+Media = _lazy(models.Media)
+Document = _lazy(models.Document)
+GradingScale = _lazy(models.GradingScale)
+GradingCategory = _lazy(models.GradingCategory)
+GradingGroup = _lazy(models.GradingGroup)
+Rubric = _lazy(models.Rubric)
+Assignment = _lazy(models.Assignment)
+Page = _lazy(models.Page)
+FriendRequest = _lazy(models.FriendRequest)
+Invite = _lazy(models.Invite)
+Grade = _lazy(models.Grade)
+Language = _lazy(models.Language)
+Association = _lazy(models.Association)
+Session = _lazy(models.Session)
+MessageThread = _lazy(models.MessageThread)
+Message = _lazy(models.Message)
+Action = _lazy(models.Action)
+Role = _lazy(models.Role)
+GradingPeriod = _lazy(models.GradingPeriod)
+CourseFolder = _lazy(models.CourseFolder)
+Submission = _lazy(models.Submission)
+
+# Lazy counterpart of each dict-based model class.
+MODELS = {getattr(models, lazy.__name__): lazy for lazy in list(globals().values())
+          if isinstance(lazy, type) and issubclass(lazy, _lazy_model) and lazy is not _lazy_model}
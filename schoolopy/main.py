@@ -1,43 +1,253 @@
-from .errors import NoDataError, NoDifferenceError
+from .errors import NoDataError, NoDifferenceError, IncompleteDownloadError
 from .models import *
+from . import compact, lazy
 from .authentication import AuthorizationError
+from .streaming import ItemStream
+from .codec import default_codec
+from .download import Download, expected_size, attachment_files, attachment_path, manifest_entry
+from .metrics import RequestEvent, endpoint_template
+import contextvars
+import os
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs
+import requests
+from requests.adapters import HTTPAdapter
 
 try:
     from json.decoder import JSONDecodeError
 except ImportError:
     JSONDecodeError = ValueError
 
+# Statuses meaning the multiget endpoint itself is unavailable, rather than the request having failed.
+_multiget_unsupported = frozenset([404, 405, 501])
+
+
+class _Pagination:
+    """
+    Lazy iterator over every page of a list endpoint.
+
+    Returned by list methods in place of a list while Schoology.paginate is active.
+    """
+    def __init__(self, schoology, model, key, path, params):
+        self.schoology = schoology
+        self.model = model
+        self.key = key
+        self.path = path
+        self.params = params
+        self.stream = False
+
+    def __iter__(self):
+        start = self.params.get('start', self.schoology.start)
+        while start is not None:
+            params = dict(self.params, start=start)
+            if self.stream:
+                count = 0
+                with self.schoology._get_stream(self.path, params) as response:
+                    items = ItemStream(response.iter_content(self.schoology.stream_chunk_size), self.key)
+                    try:
+                        for raw in items:
+                            count += 1
+                            yield self.model(raw)
+                    except JSONDecodeError:
+                        raise NoDataError(f'Get request to {response.url} returned invalid JSON.')
+                data = items.members
+            else:
+                data = self.schoology._get(self.path, params)
+                items = data.get(self.key) or []
+                for raw in items:
+                    yield self.model(raw)
+                count = len(items)
+            start = self.next_start(data, start, count)
+
+    @staticmethod
+    def next_start(data, start, count):
+        """
+        Work out the offset of the page following the one just received.
+
+        :param data: Decoded page of results.
+        :param start: Offset the page was requested at.
+        :param count: Number of objects on the page.
+        :return: Offset of the next page, or None if this was the last one.
+        """
+        next_url = (data.get('links') or {}).get('next')
+        if not next_url or not count:
+            return None
+        query = parse_qs(urlparse(next_url).query)
+        next_start = int(query['start'][0]) if 'start' in query else int(start) + count
+        if 'total' in data and next_start >= int(data['total']):
+            return None
+        return next_start
+
+
+class _PendingRequest(Exception):
+    """
+    Raised while replaying a call when it makes a request that has not been answered yet.
+    """
+    def __init__(self, verb, path, data=None, params={}):
+        super().__init__(verb, path)
+        self.verb = verb
+        self.path = path
+        self.data = data
+        self.params = params
+
+
+class _Replay:
+    """
+    Answers the requests made during a replayed call, in order, from responses fetched beforehand.
+    """
+    def __init__(self, responses):
+        self.responses = responses
+        self.position = 0
+
+    def next(self, verb, path, data=None, params={}):
+        if self.position >= len(self.responses):
+            raise _PendingRequest(verb, path, data, params)
+        self.position += 1
+        return self.responses[self.position - 1]
+
 
 class Schoology:
     key = ''
     secret = ''
     limit = 20
     start = 0
-
-    def __init__(self, schoology_auth, api_host='https://api.schoology.com/v1/'):
+    model_style = 'dict'
+    multiget_limit = 50
+    bulk_limit = 50
+    stream_chunk_size = 65536
+
+    def __init__(self, schoology_auth, api_host='https://api.schoology.com/v1/', rate_limiter=None, retry=None, cache=None,
+                 validator_cache=None, single_flight=None, codec=None, transport=None, hooks=None, tracer=None,
+                 identity_map=None):
+        """
+        :param schoology_auth: Authorized Auth instance.
+        :param api_host: Root URL of the API.
+        :param rate_limiter: Optional RateLimiter to throttle requests with, e.g. RateLimiter.for_key(key).
+        :param retry: Optional RetryPolicy deciding which failed requests to send again.
+        :param cache: Optional ResponseCache to answer repeated GET requests from.
+        :param validator_cache: Optional ResponseCache, usually without a TTL, keeping the ETag and Last-Modified validators
+                                of GET responses along with their data, so that repeated requests can be made conditional.
+        :param single_flight: Optional SingleFlight through which identical GET requests made at the same time share one HTTP call.
+        :param codec: Codec to encode and decode JSON with. Defaults to the fastest installed, see codec.default_codec.
+        :param transport: Object to send requests through in place of the Auth instance's session, taking the arguments
+                          of requests.Session.request and returning a requests.Response, such as a fake.FakeSchoology.
+        :param hooks: Functions to call with a metrics.RequestEvent after every request, or cache hit, such as a
+                      metrics.Metrics instance. Hooks are called on the thread that made the request.
+        :param tracer: Optional tracing.Tracer to open spans for each public method called and each request made.
+        :param identity_map: Optional IdentityMap through which objects returned more than once resolve to one shared model.
+        """
         if not schoology_auth.authorized:
             raise AuthorizationError('Auth instance not authorized. Run authorize() after requesting authorization.')
         self.key = schoology_auth.consumer_key
         self.secret = schoology_auth.consumer_secret
         self.schoology_auth = schoology_auth
         self.api_host = api_host
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.cache = cache
+        self.validator_cache = validator_cache
+        self.single_flight = single_flight
+        self.codec = default_codec() if codec is None else codec
+        self.transport = transport
+        self.hooks = list(hooks or [])
+        self.tracer = tracer
+        self.identity_map = identity_map
+        self._local = threading.local()
+        if tracer is not None:
+            self.hooks.append(tracer)
+            tracer.instrument(self)
 
     def _get_params_string(self, params):
         """
         Take a dictionary of parameters and convert it into a parameter string.
 
-        :params: Dictionary of parameter names and values.
+        :params: Dictionary of parameter names and values. Explicit start and limit values take precedence over those of the instance.
         :return: String representing encoded URL parameters.
         """
-        params.update({
+        params = dict({
             'start': self.start,
             'limit': self.limit,
-        })
+        }, **params)
         string = '&'.join([f'{key}={value}' for key, value in params.items()])
         return '?' + string
 
+    def _cache_key(self, path, params):
+        """
+        Identify a GET request independently of the order its parameters were given in.
+
+        :param path: Path (following API root) to endpoint.
+        :param params: Custom URL parameters to add.
+        :return: String identifying the request.
+        """
+        return path.strip('/') + self._get_params_string(dict(sorted(params.items())))
+
+    def _request(self, verb, url, **kwargs):
+        """
+        Send a request through the transport, or else the Auth instance's session.
+
+        Every request made by this class passes through here, waiting for the rate limiter first if there is one
+        and being sent again for as long as the retry policy, if any, allows. Hooks are told of the outcome.
+
+        :param verb: HTTP method to use.
+        :param url: Full URL to request.
+        :param kwargs: Further arguments to pass to the session.
+        :return: Response received.
+        """
+        started = time.monotonic()
+        waited = 0.0
+        attempt = 1
+        response = None
+        error = None
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    waited += self.rate_limiter.acquire()
+                response = None
+                try:
+                    response = self._session().request(verb, url, **kwargs)
+                except (requests.ConnectionError, requests.Timeout):
+                    if self.retry is None or not self.retry.should_retry(verb, attempt):
+                        raise
+                    delay = self.retry.delay(attempt)
+                else:
+                    if self.retry is None or not self.retry.should_retry(verb, attempt, response.status_code):
+                        response.raise_for_status()
+                        return response
+                    delay = self.retry.delay(attempt, response.headers)
+                    # Release the connection of a response not kept, which would stay checked out if streamed.
+                    response.close()
+                time.sleep(delay)
+                waited += delay
+                attempt += 1
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self.hooks:
+                if response is None:
+                    size = None
+                elif kwargs.get('stream'):
+                    size = int(response.headers['Content-Length']) if 'Content-Length' in response.headers else None
+                else:
+                    size = len(response.content)
+                self._emit(RequestEvent(verb, url, endpoint_template(url, self.api_host),
+                                        status=None if response is None else response.status_code,
+                                        elapsed=time.monotonic() - started, bytes=size,
+                                        request_bytes=len(kwargs.get('data') or b''), attempts=attempt, waited=waited,
+                                        error=error))
+
+    def _emit(self, event):
+        """
+        Pass an event to every hook.
+
+        :param event: metrics.RequestEvent.
+        """
+        for hook in self.hooks:
+            hook(event)
+
     def _get(self, path, params={}):
         """
         GET data from a given endpoint.
@@ -46,16 +256,386 @@ class Schoology:
         :param params: Custom URL parameters to add.
         :return: JSON response.
         """
-        response = self.schoology_auth.oauth.get(
-            url=self.api_host + path + self._get_params_string(params),
-            headers=self.schoology_auth._request_header(),
+        replay = getattr(self._local, 'replay', None)
+        if replay is not None:
+            return replay.next('GET', path, params=params)
+        key = self._cache_key(path, params)
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if data is not None:
+                if self.hooks:
+                    self._emit(RequestEvent('GET', self.api_host + path + self._get_params_string(params),
+                                            endpoint_template(path), cache_hit=True))
+                return data
+        if self.single_flight is not None:
+            return self.single_flight.do(key, lambda: self._fetch(key, path, params))
+        return self._fetch(key, path, params)
+
+    def _fetch(self, key, path, params):
+        """
+        Send a GET request on behalf of _get, once it could not be answered from the cache.
+
+        :param key: Cache key of the request.
+        :param path: Path (following API root) to endpoint.
+        :param params: Custom URL parameters to add.
+        :return: JSON response.
+        """
+        headers = self.schoology_auth._request_header()
+        validated = None if self.validator_cache is None else self.validator_cache.get(key)
+        if validated is not None:
+            headers.update(self._conditional_headers(*validated[:2]))
+        response = self._request(
+            'GET',
+            self.api_host + path + self._get_params_string(params),
+            headers=headers,
             auth=self.schoology_auth.oauth.auth
         )
-        response.raise_for_status()
+        if response.status_code == 304 and validated is not None:
+            data = validated[2]
+        else:
+            try:
+                data = self.codec.loads(response.content)
+            except ValueError:
+                raise NoDataError(f'Get request to {response.url} failed: {response.text}')
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            if self.validator_cache is not None and (etag or last_modified):
+                self.validator_cache.set(key, path, [etag, last_modified, data])
+        if self.cache is not None:
+            self.cache.set(key, path, data)
+        return data
+
+    @staticmethod
+    def _conditional_headers(etag, last_modified):
+        """
+        Build the headers making a request conditional on a resource having changed.
+
+        :param etag: ETag of the version held, if known.
+        :param last_modified: Last-Modified date of the version held, if known.
+        :return: Dictionary of headers.
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _get_list(self, model, key, path, params={}):
+        """
+        GET a list endpoint and wrap each object it returns in a model.
+
+        :param model: Model class to wrap each object in.
+        :param key: Key under which the endpoint returns its objects.
+        :param path: Path (following API root) to endpoint.
+        :param params: Custom URL parameters to add.
+        :return: List of model objects, or a lazy iterator over all pages while paginating. With the 'lazy' model
+                 style, a LazySequence wrapping objects as they are accessed.
+        """
+        model = self._factory(model)
+        if getattr(self._local, 'paginate', False):
+            return _Pagination(self, model, key, path, params)
+        if self.model_style == 'lazy':
+            return lazy.LazySequence(model, self._get(path, params)[key])
+        return [model(raw) for raw in self._get(path, params)[key]]
+
+    def _model_class(self, model):
+        """
+        Look up the class to wrap objects in, following self.model_style.
+
+        With 'dict', the default, objects are wrapped in the dict-based classes of the models module. With 'compact',
+        they are wrapped in their counterparts from the compact module, which keep their fields in slots and take up
+        around a quarter less memory, but are mappings rather than dicts. With 'lazy', they are wrapped in their
+        counterparts from the lazy module, which hold on to the decoded objects rather than copying them, and list
+        methods return lazy sequences; this suits jobs reading a few fields of many objects.
+
+        :param model: Model class from the models module.
+        :return: Class to instantiate.
+        """
+        if self.model_style == 'dict':
+            return model
+        if self.model_style == 'compact':
+            return compact.MODELS[model]
+        if self.model_style == 'lazy':
+            return lazy.MODELS[model]
+        raise ValueError('Unknown model style %r.' % self.model_style)
+
+    def _factory(self, model):
+        """
+        Look up how to build models of a class, following self.model_style and going through self.identity_map if set.
+
+        :param model: Model class from the models module.
+        :return: Class, or function, taking a decoded object and returning a model object.
+        """
+        model = self._model_class(model)
+        if self.identity_map is None:
+            return model
+        return self.identity_map.factory(model)
+
+    def _make(self, model, raw):
+        """
+        Wrap an object returned by the API in a model, following self.model_style.
+
+        :param model: Model class from the models module.
+        :param raw: Decoded object.
+        :return: Model object.
+        """
+        return self._factory(model)(raw)
+
+    def paginate(self, method, *args, start=None, **kwargs):
+        """
+        Lazily iterate over every object a list method can return, following Schoology's pagination.
+
+        Pages are requested as iteration reaches them, starting at self.start and self.limit objects at a time,
+        until the response no longer links to a next page or the reported total is reached.
+
+        :param method: Bound list method of this instance, e.g. sc.get_users.
+        :param args: Positional arguments to pass to the method.
+        :param start: Offset to start at in place of self.start, e.g. 0 to read every object whatever self.start is.
+        :param kwargs: Keyword arguments to pass to the method.
+        :return: Generator yielding model objects.
+        """
+        return iter(self._paginated(method, *args, start=start, **kwargs))
+
+    def stream(self, method, *args, start=None, **kwargs):
+        """
+        Like paginate, but parse each page incrementally as it downloads rather than decoding it whole.
+
+        Only one object of a page is held in memory at a time. Streamed pages bypass the response cache.
+
+        :param method: Bound list method of this instance, e.g. sc.get_users.
+        :param args: Positional arguments to pass to the method.
+        :param start: Offset to start at in place of self.start.
+        :param kwargs: Keyword arguments to pass to the method.
+        :return: Generator yielding model objects.
+        """
+        pages = self._paginated(method, *args, start=start, **kwargs)
+        pages.stream = True
+        return iter(pages)
+
+    def _get_stream(self, path, params={}):
+        """
+        GET an endpoint without reading the body of the response.
+
+        :param path: Path (following API root) to endpoint.
+        :param params: Custom URL parameters to add.
+        :return: Response, whose body is yet to be read.
+        """
+        return self._request(
+            'GET',
+            self.api_host + path + self._get_params_string(params),
+            headers=self.schoology_auth._request_header(),
+            auth=self.schoology_auth.oauth.auth,
+            stream=True
+        )
+
+    def _paginated(self, method, *args, start=None, **kwargs):
+        """
+        Call a list method in pagination mode.
+
+        :param start: Offset to start at, if not that of the method's parameters or self.start.
+        :return: _Pagination over the method's endpoint.
+        """
+        self._local.paginate = True
         try:
-            return response.json()
-        except JSONDecodeError:
-            raise NoDataError(f'Get request to {response.url} failed: {response.text}')
+            pages = method(*args, **kwargs)
+        finally:
+            self._local.paginate = False
+        if not isinstance(pages, _Pagination):
+            raise TypeError('%s does not return a paginated list.' % method.__name__)
+        if start is not None:
+            pages.params = dict(pages.params, start=start)
+        return pages
+
+    def _replay(self, responses, method, *args, **kwargs):
+        """
+        Call a method with its requests answered, in order, from responses that have already been fetched.
+
+        This lets the endpoint methods be driven by something other than blocking HTTP calls, as AsyncSchoology does.
+
+        :param responses: Decoded responses to the method's requests, in the order it makes them.
+        :param method: Bound method of this instance to call.
+        :raise _PendingRequest: If the method makes a request beyond those answered.
+        :return: Result of the method.
+        """
+        self._local.replay = _Replay(responses)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self._local.replay = None
+
+    def get_many(self, method, ids, max_workers=8, **kwargs):
+        """
+        Call a method once per ID, running the calls concurrently over a pool of threads.
+
+        The threads share the Auth instance's session, whose connection pool is grown to max_workers if need be.
+
+        :param method: Bound method of this instance, or its name, e.g. sc.get_user.
+        :param ids: IDs to pass as the method's first argument. Tuples are unpacked into several arguments.
+        :param max_workers: Maximum number of calls in progress at once.
+        :param kwargs: Keyword arguments to pass to every call.
+        :return: List of the results of each call in the order of ids. Calls that failed hold the exception they raised instead.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        self._pool_connections(max_workers)
+
+        def call(id):
+            try:
+                return method(*(id if isinstance(id, tuple) else (id,)), **kwargs)
+            except Exception as e:
+                return e
+
+        return self._map(call, ids, max_workers)
+
+    def multi_get(self, method, ids, **kwargs):
+        """
+        Call a method once per ID, combining the GET requests of the calls into as few multi-get requests as possible.
+
+        Each call is first run to find out what it would request. Those requests are sent through Schoology's
+        multiget endpoint, self.multiget_limit at a time, and each call is then replayed against its own part of
+        the combined response, so results are the same models the method normally returns.
+        Calls whose sub-request failed, or which need further requests, fall back to individual requests, as do all
+        calls if the multiget endpoint is unavailable. Errors of a combined request as a whole, such as 401 or 429
+        responses, are raised.
+
+        :param method: Bound method of this instance, or its name, e.g. sc.get_user.
+        :param ids: IDs to pass as the method's first argument. Tuples are unpacked into several arguments.
+        :param kwargs: Keyword arguments to pass to every call.
+        :return: List of the results of each call in the order of ids. Calls that failed hold the exception they raised instead.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        calls = [id if isinstance(id, tuple) else (id,) for id in ids]
+
+        def finish(args, responses):
+            try:
+                try:
+                    return self._replay(responses, method, *args, **kwargs)
+                except _PendingRequest:
+                    return method(*args, **kwargs)
+            except Exception as e:
+                return e
+
+        results = [None] * len(calls)
+        pending = []
+        for i, args in enumerate(calls):
+            try:
+                results[i] = self._replay([], method, *args, **kwargs)
+            except _PendingRequest as request:
+                cached = None
+                if request.verb == 'GET' and self.cache is not None:
+                    cached = self.cache.get(self._cache_key(request.path, request.params))
+                if cached is not None:
+                    results[i] = finish(args, [cached])
+                elif request.verb == 'GET':
+                    pending.append((i, request))
+                else:
+                    results[i] = finish(args, [])
+            except Exception as e:
+                results[i] = e
+
+        for offset in range(0, len(pending), self.multiget_limit):
+            batch = pending[offset:offset + self.multiget_limit]
+            bodies = self._multiget([request.path + self._get_params_string(request.params) for i, request in batch])
+            for (i, request), body in zip(batch, bodies):
+                if body is not None and self.cache is not None:
+                    self.cache.set(self._cache_key(request.path, request.params), request.path, body)
+                results[i] = finish(calls[i], [] if body is None else [body])
+        return results
+
+    def _multiget(self, paths):
+        """
+        GET several endpoints at once through Schoology's multiget endpoint.
+
+        Should the multiget endpoint be unavailable, every path is reported as failed, to be fetched on its own; any
+        other error of the combined request is raised, rather than turned into a request per path.
+
+        :param paths: Paths (following API root, including URL parameters) to GET. No more than self.multiget_limit.
+        :return: List of the decoded responses in the order of paths, holding None for sub-requests that failed.
+        """
+        root = urlparse(self.api_host).path
+        try:
+            responses = self._post('multiget', {'request': [root + path for path in paths]})['response']
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in _multiget_unsupported:
+                raise
+            return [None] * len(paths)
+        bodies = [response.get('body') if 200 <= int(response.get('response_code', 0)) < 300 else None
+                  for response in responses]
+        return bodies + [None] * (len(paths) - len(bodies))
+
+    def _bulk(self, verb, path, key, model, objects, max_workers=1):
+        """
+        Create or update objects in bulk, self.bulk_limit at a time as the API allows.
+
+        When there are more objects than fit in one request, they are split into chunks which are sent up to
+        max_workers at once.
+
+        :param verb: 'POST' to create the objects or 'PUT' to update them.
+        :param path: Path (following API root) to bulk endpoint.
+        :param key: Singular name of the objects in the request and response, e.g. 'user'.
+        :param model: Model class to wrap each result in.
+        :param objects: List of model objects or dictionaries to send.
+        :param max_workers: Maximum number of chunks in flight at once.
+        :return: List of the results for each object in the order given. Schoology reports the outcome of each object
+                 with its own response_code. Objects whose chunk failed altogether hold the exception raised instead.
+        """
+        write = self._post if verb == 'POST' else self._put
+        model = self._factory(model)
+        objects = list(objects)
+        chunks = [objects[offset:offset + self.bulk_limit] for offset in range(0, len(objects), self.bulk_limit)]
+
+        def send(chunk):
+            try:
+                response = write(path, {key + 's': {key: [dict(item) for item in chunk]}})
+            except _PendingRequest:
+                raise
+            except Exception as e:
+                return [e] * len(chunk)
+            results = [model(raw) for raw in ((response or {}).get(key) or [])[:len(chunk)]]
+            return results + [None] * (len(chunk) - len(results))
+
+        # Replayed calls have their requests answered one after another on this thread.
+        if max_workers > 1 and len(chunks) > 1 and getattr(self._local, 'replay', None) is None:
+            self._pool_connections(max_workers)
+            return [result for results in self._map(send, chunks, max_workers) for result in results]
+        return [result for chunk in chunks for result in send(chunk)]
+
+    @staticmethod
+    def _map(function, items, max_workers):
+        """
+        Call a function on each of a list of items over a pool of threads.
+
+        Each call runs in a copy of the caller's context, so that tracing spans opened in it nest under the caller's.
+
+        :param function: Function taking one item.
+        :param items: Items to call the function on.
+        :param max_workers: Maximum number of calls in progress at once.
+        :return: List of the results in the order of items.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, function, item) for item in items]
+            return [future.result() for future in futures]
+
+    def _session(self):
+        """
+        :return: Transport to send requests through.
+        """
+        return self.schoology_auth.oauth if self.transport is None else self.transport
+
+    def _pool_connections(self, size):
+        """
+        Make sure the session keeps enough connections to the API open for a number of concurrent requests.
+
+        :param size: Number of requests that may be in flight at once.
+        """
+        session = self._session()
+        if not hasattr(session, 'mount'):
+            return
+        if getattr(session.get_adapter(self.api_host), '_pool_maxsize', 0) < size:
+            adapter = HTTPAdapter(pool_maxsize=size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
 
     def _post(self, path, data, params={}):
         """
@@ -65,16 +645,23 @@ class Schoology:
         :param data: JSON data to POST.
         :return: JSON response.
         """
-        response = self.schoology_auth.oauth.post(
-            url=self.api_host + path + self._get_params_string(params),
-            json=data,
-            headers=self.schoology_auth._request_header(),
-            auth=self.schoology_auth.oauth.auth
-        )
-        response.raise_for_status()
+        replay = getattr(self._local, 'replay', None)
+        if replay is not None:
+            return replay.next('POST', path, data, params)
         try:
-            return response.json()
-        except json.decoder.JSONDecodeError:
+            response = self._request(
+                'POST',
+                self.api_host + path + self._get_params_string(params),
+                data=self.codec.dumps(data),
+                headers=self.schoology_auth._request_header(),
+                auth=self.schoology_auth.oauth.auth
+            )
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(path)
+        try:
+            return self.codec.loads(response.content)
+        except ValueError:
             raise NoDataError(f'Post request to {response.url} failed: {response.text}')
 
     def _put(self, path, data, params={}):
@@ -85,31 +672,45 @@ class Schoology:
         :param data: JSON data to PUT.
         :return: JSON response.
         """
-        response = self.schoology_auth.oauth.put(
-            url=self.api_host + path + self._get_params_string(params),
-            json=data,
-            headers=self.schoology_auth._request_header(),
-            auth=self.schoology_auth.oauth.auth
-        )
-        response.raise_for_status()
+        replay = getattr(self._local, 'replay', None)
+        if replay is not None:
+            return replay.next('PUT', path, data, params)
+        try:
+            response = self._request(
+                'PUT',
+                self.api_host + path + self._get_params_string(params),
+                data=self.codec.dumps(data),
+                headers=self.schoology_auth._request_header(),
+                auth=self.schoology_auth.oauth.auth
+            )
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(path)
         try:
-            return response.json()
-        except json.decoder.JSONDecodeError:
+            return self.codec.loads(response.content)
+        except ValueError:
             raise NoDataError(f'Put request to {response.url} failed: {response.text}')
 
-    def _delete(self, path):
+    def _delete(self, path, params=None):
         """
         Send a DELETE request to a given endpoint.
 
         :param path: Path (following API root) to endpoint.
+        :param params: Custom URL parameters to add, if any.
         """
-        response = self.schoology_auth.oauth.delete(
-            url=self.api_host + path,
-            headers=self.schoology_auth._request_header(),
-            auth=self.schoology_auth.oauth.auth
-        )
-        response.raise_for_status()
-        return response
+        replay = getattr(self._local, 'replay', None)
+        if replay is not None:
+            return replay.next('DELETE', path, params=params)
+        try:
+            return self._request(
+                'DELETE',
+                self.api_host + path + ('' if params is None else self._get_params_string(params)),
+                headers=self.schoology_auth._request_header(),
+                auth=self.schoology_auth.oauth.auth
+            )
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(path)
 
     def get_schools(self):
         """
@@ -117,7 +718,7 @@ class Schoology:
 
         :return: List of school objects of which a user is aware.
         """
-        return [School(raw) for raw in self._get('schools')['school']]
+        return self._get_list(School, 'school', 'schools')
 
     def get_school(self, school_id):
         """
@@ -125,7 +726,7 @@ class Schoology:
 
         :return: School object with data on the requested school.
         """
-        return School(self._get('schools/%s' % school_id))
+        return self._make(School, self._get('schools/%s' % school_id))
 
     def create_school(self, school):
         """
@@ -134,7 +735,7 @@ class Schoology:
         :param school: School object containing necessary fields.
         :return: School object obtained from API.
         """
-        return School(self._post('schools', school.json()))
+        return self._make(School, self._post('schools', school.json()))
 
     def edit_school(self, school_id, school):
         """
@@ -154,7 +755,7 @@ class Schoology:
         :param school_id: ID of school whose buildings to get.
         :return: List of building objects in that school.
         """
-        return [Building(raw) for raw in self._get('schools/%s/buildings' % school_id)['building']]
+        return self._get_list(Building, 'building', 'schools/%s/buildings' % school_id)
 
     # There is currently no endpoint for getting data on individual buildings.
     # This is due in part to the oft-blurred line Schoology draws between schools and buildings.
@@ -166,7 +767,7 @@ class Schoology:
         :param building: Building object containing necessary fields.
         :return: Building object obtained from API.
         """
-        return Building(self._post('schools/%s/buildings' % school_id, building.json()))
+        return self._make(Building, self._post('schools/%s/buildings' % school_id, building.json()))
 
     def get_self_user_info(self):
         """
@@ -174,7 +775,7 @@ class Schoology:
 
         :return: Session object obtained from API.
         """
-        return Session(self._get('app-user-info'))
+        return self._make(Session, self._get('app-user-info'))
 
     def get_me(self):
         """
@@ -182,7 +783,7 @@ class Schoology:
 
         :return: User object obtained from API. (Of yourself)
         """
-        return User(self._get('users/me'))
+        return self._make(User, self._get('users/me'))
 
     def get_users(self, inactive=False):
         """
@@ -191,7 +792,7 @@ class Schoology:
         :param inactive: Gets inactive users instead of normal ones.
         :return: List of User objects.
         """
-        return [User(raw) for raw in self._get('users' + ('/inactive' if inactive else ''))['user']]
+        return self._get_list(User, 'user', 'users' + ('/inactive' if inactive else ''))
 
     def get_user(self, user_id, inactive=False):
         """
@@ -201,7 +802,7 @@ class Schoology:
         :param inactive: Gets inactive users instead of normal ones.
         :return: User object.
         """
-        return User(self._get(('users/' + ('inactive/' if inactive else '') + '%s') % user_id))
+        return self._make(User, self._get(('users/' + ('inactive/' if inactive else '') + '%s') % user_id))
 
     def create_user(self, user):
         """
@@ -210,16 +811,17 @@ class Schoology:
         :param user: User object containing necessary fields.
         :return: User object obtained from API.
         """
-        return User(self._post('users', user))
+        return self._make(User, self._post('users', user))
 
-    def create_users(self, users):
+    def create_users(self, users, max_workers=1):
         """
-        Bulk create users.
+        Bulk create users, self.bulk_limit per request.
 
         :param users: A list of User objects.
-        :return: User objects obtained from API.
+        :param max_workers: Maximum number of requests in flight at once.
+        :return: User objects obtained from API, in the order of users. See _bulk.
         """
-        return [User(raw) for raw in self._post('users', {'users': {'user': [user.json() for user in users]}})]
+        return self._bulk('POST', 'users', 'user', User, users, max_workers)
 
     def update_user(self, user, user_id):
         """
@@ -231,14 +833,15 @@ class Schoology:
         """
         self._put('users/%s' % user_id, user)
 
-    def update_users(self, users):
+    def update_users(self, users, max_workers=1):
         """
-        Bulk update users.
+        Bulk update users, self.bulk_limit per request.
 
         :param users: A list of users.
-        :return: User objects obtained from API.
+        :param max_workers: Maximum number of requests in flight at once.
+        :return: User objects obtained from API, in the order of users. See _bulk.
         """
-        return [User(raw) for raw in self._put('users', {'users': {'user': [user.json() for user in users]}})]
+        return self._bulk('PUT', 'users', 'user', User, users, max_workers)
 
     def delete_user(self, user_id):
         """
@@ -254,7 +857,7 @@ class Schoology:
 
         :return: A list of Language objects.
         """
-        return [Language(raw) for raw in self._get('users/languages')['language']]
+        return self._get_list(Language, 'language', 'users/languages')
 
     def get_groups(self):
         """
@@ -262,7 +865,7 @@ class Schoology:
 
         :return: List of Group objects.
         """
-        return [Group(raw) for raw in self._get('groups')['group']]
+        return self._get_list(Group, 'group', 'groups')
 
     def get_group(self, group_id):
         """
@@ -271,7 +874,7 @@ class Schoology:
         :param group_id: ID of group on which to get data.
         :return: Group object.
         """
-        return Group(self._get('groups/%s' % group_id))
+        return self._make(Group, self._get('groups/%s' % group_id))
 
     def get_courses(self):
         """
@@ -279,7 +882,7 @@ class Schoology:
 
         :return: List of Course objects.
         """
-        return [Course(raw) for raw in self._get('courses')['course']]
+        return self._get_list(Course, 'course', 'courses')
 
     def get_course(self, course_id):
         """
@@ -288,7 +891,7 @@ class Schoology:
         :param course_id: ID of course on which to get data.
         :return: Course object.
         """
-        return Course(self._get('courses/%s' % course_id))
+        return self._make(Course, self._get('courses/%s' % course_id))
 
     def get_course_sections(self, course_id=None, include_past=False):
         """
@@ -296,7 +899,7 @@ class Schoology:
 
         :return: List of Section objects.
         """
-        return [Section(raw) for raw in self._get('courses/%s/sections' % course_id)['section']]
+        return self._get_list(Section, 'section', 'courses/%s/sections' % course_id)
 
     def get_sections(self, user_id=None):
         """
@@ -315,7 +918,7 @@ class Schoology:
         :param section_id: ID of section on which to get data.
         :return: Section object.
         """
-        return Section(self._get('sections/%s' % section_id))
+        return self._make(Section, self._get('sections/%s' % section_id))
 
     def create_enrollment(self, enrollment, section_id=None, group_id=None):
         """
@@ -333,10 +936,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_section_enrollment(self, enrollment, section_id):
-        return Enrollment(self._post('sections/%s/enrollments' % section_id, enrollment.json()))
+        return self._make(Enrollment, self._post('sections/%s/enrollments' % section_id, enrollment.json()))
 
     def create_group_enrollment(self, enrollment, group_id):
-        return Enrollment(self._post('groups/%s/enrollments' % group_id, enrollment.json()))
+        return self._make(Enrollment, self._post('groups/%s/enrollments' % group_id, enrollment.json()))
 
 
     def get_enrollments(self, section_id=None, group_id=None):
@@ -354,40 +957,41 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_section_enrollments(self, section_id):
-        return [Enrollment(raw) for raw in self._get('sections/%s/enrollments' % section_id)['enrollment']]
+        return self._get_list(Enrollment, 'enrollment', 'sections/%s/enrollments' % section_id)
 
     def get_group_enrollments(self, group_id):
-        return [Enrollment(raw) for raw in self._get('groups/%s/enrollments' % group_id)['enrollment']]
+        return self._get_list(Enrollment, 'enrollment', 'groups/%s/enrollments' % group_id)
 
 
     # TODO: Do we need to provide the ID of the realm?
     def join_section(self, access_code):
-        return Enrollment(self._post('sections/accesscode' % access_code, {'access_code': access_code}))
+        return self._make(Enrollment, self._post('sections/accesscode' % access_code, {'access_code': access_code}))
 
     def join_group(self, access_code):
-        return Enrollment(self._post('sections/accesscode' % access_code, {'access_code': access_code}))
+        return self._make(Enrollment, self._post('sections/accesscode' % access_code, {'access_code': access_code}))
 
 
-    def create_enrollments(self, enrollments, section_id=None, group_id=None):
+    def create_enrollments(self, enrollments, section_id=None, group_id=None, max_workers=1):
         """
-        Create multiple enrollments.
+        Create multiple enrollments, self.bulk_limit per request.
 
         :param enrollments: List of Enrollment objects to post to API.
         :param *_id: ID of realm.
-        :return: List of User objects.
+        :param max_workers: Maximum number of requests in flight at once.
+        :return: List of Enrollment objects, in the order of enrollments. See _bulk.
         """
         if section_id:
-            return self.create_section_enrollments(enrollments, section_id)
+            return self.create_section_enrollments(enrollments, section_id, max_workers)
         elif group_id:
-            return self.create_group_enrollments(enrollments, group_id)
+            return self.create_group_enrollments(enrollments, group_id, max_workers)
         else:
             raise TypeError('Realm id property required.')
 
-    def create_section_enrollments(self, enrollments, section_id):
-        return [Enrollment(raw) for raw in self._post('sections/%s/enrollments' % section_id, {'enrollments': {'enrollment': [enrollment.json() for enrollment in enrollments]}})]
+    def create_section_enrollments(self, enrollments, section_id, max_workers=1):
+        return self._bulk('POST', 'sections/%s/enrollments' % section_id, 'enrollment', Enrollment, enrollments, max_workers)
 
-    def create_group_enrollments(self, enrollments, group_id):
-        return [Enrollment(raw) for raw in self._post('groups/%s/enrollments' % group_id, {'enrollments': {'enrollment': [enrollment.json() for enrollment in enrollments]}})]
+    def create_group_enrollments(self, enrollments, group_id, max_workers=1):
+        return self._bulk('POST', 'groups/%s/enrollments' % group_id, 'enrollment', Enrollment, enrollments, max_workers)
 
     def update_enrollment(self, enrollment, group_id=None, section_id=None):
         """
@@ -400,23 +1004,23 @@ class Schoology:
         :return: List of Enrollment objects recieved from API.
         """
         if section_id:
-            return self.update_section_enrollment(section_id, enrollment)
+            return self.update_section_enrollment(enrollment, section_id)
         elif group_id:
-            return self.update_group_enrollment(group_id, enrollment)
+            return self.update_group_enrollment(enrollment, group_id)
         else:
             raise TypeError('Realm id property required.')
 
     def update_section_enrollment(self, enrollment, section_id):
-        return self.update_section_enrollments(section_id, [enrollment])
+        return self.update_section_enrollments([enrollment], section_id)
 
     def update_group_enrollment(self, enrollment, group_id):
-        return self.update_group_enrollments(group_id, [enrollment])
+        return self.update_group_enrollments([enrollment], group_id)
 
-    def update_section_enrollments(self, enrollments, section_id):
-        return [Enrollment(raw) for raw in self._put('sections/%s/enrollments' % section_id, {'enrollments': {'enrollment': [enrollment.json() for enrollment in enrollments]}})]
+    def update_section_enrollments(self, enrollments, section_id, max_workers=1):
+        return self._bulk('PUT', 'sections/%s/enrollments' % section_id, 'enrollment', Enrollment, enrollments, max_workers)
 
-    def update_group_enrollments(self, enrollments, group_id):
-        return [Enrollment(raw) for raw in self._put('groups/%s/enrollments' % group_id, {'enrollments': {'enrollment': [enrollment.json() for enrollment in enrollments]}})]
+    def update_group_enrollments(self, enrollments, group_id, max_workers=1):
+        return self._bulk('PUT', 'groups/%s/enrollments' % group_id, 'enrollment', Enrollment, enrollments, max_workers)
 
     def delete_enrollment(self, enrollment_id, section_id=None, group_id=None):
         """
@@ -442,7 +1046,14 @@ class Schoology:
 
 
     def delete_enrollments(self, enrollment_ids):
-        self._delete('enrollments', params={'enrollment_ids': ','.join(enrollment_ids)})
+        """
+        Delete multiple enrollments, self.bulk_limit per request.
+
+        :param enrollment_ids: IDs of enrollments to delete.
+        """
+        enrollment_ids = [str(enrollment_id) for enrollment_id in enrollment_ids]
+        for offset in range(0, len(enrollment_ids), self.bulk_limit):
+            self._delete('enrollments', params={'enrollment_ids': ','.join(enrollment_ids[offset:offset + self.bulk_limit])})
 
     # Course enrollments imports not implemented, similar effect can be obtained through extant methods
 
@@ -467,19 +1078,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_events(self, district_id):
-        return [Event(raw) for raw in self._get('districts/%s/events' % district_id)['event']]
+        return self._get_list(Event, 'event', 'districts/%s/events' % district_id)
 
     def get_school_events(self, school_id):
-        return [Event(raw) for raw in self._get('schools/%s/events' % school_id)['event']]
+        return self._get_list(Event, 'event', 'schools/%s/events' % school_id)
 
     def get_user_events(self, user_id):
-        return [Event(raw) for raw in self._get('users/%s/events' % user_id)['event']]
+        return self._get_list(Event, 'event', 'users/%s/events' % user_id)
 
     def get_section_events(self, section_id):
-        return [Event(raw) for raw in self._get('sections/%s/events' % section_id)['event']]
+        return self._get_list(Event, 'event', 'sections/%s/events' % section_id)
 
     def get_group_events(self, group_id):
-        return [Event(raw) for raw in self._get('groups/%s/events' % group_id)['event']]
+        return self._get_list(Event, 'event', 'groups/%s/events' % group_id)
 
 
     def create_event(self, event, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -504,19 +1115,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_district_event(self, event, district_id):
-        return Event(self._post('districts/%s/events' % district_id, event.json()))
+        return self._make(Event, self._post('districts/%s/events' % district_id, event.json()))
 
     def create_school_event(self, event, school_id):
-        return Event(self._post('schools/%s/events' % school_id, event.json()))
+        return self._make(Event, self._post('schools/%s/events' % school_id, event.json()))
 
     def create_user_event(self, event, user_id):
-        return Event(self._post('users/%s/events' % user_id, event.json()))
+        return self._make(Event, self._post('users/%s/events' % user_id, event.json()))
 
     def create_section_event(self, event, section_id):
-        return Event(self._post('sections/%s/events' % section_id, event.json()))
+        return self._make(Event, self._post('sections/%s/events' % section_id, event.json()))
 
     def create_group_event(self, event, group_id):
-        return Event(self._post('groups/%s/events' % group_id, event.json()))
+        return self._make(Event, self._post('groups/%s/events' % group_id, event.json()))
 
 
     def get_event(self, event_id, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -541,19 +1152,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_event(self, event_id, district_id):
-        return Event(self._get('districts/%s/events/%s' % (district_id, event_id)))
+        return self._make(Event, self._get('districts/%s/events/%s' % (district_id, event_id)))
 
     def get_school_event(self, event_id, school_id):
-        return Event(self._get('schools/%s/events/%s' % (school_id, event_id)))
+        return self._make(Event, self._get('schools/%s/events/%s' % (school_id, event_id)))
 
     def get_user_event(self, event_id, user_id):
-        return Event(self._get('users/%s/events/%s' % (user_id, event_id)))
+        return self._make(Event, self._get('users/%s/events/%s' % (user_id, event_id)))
 
     def get_section_event(self, event_id, section_id):
-        return Event(self._get('sections/%s/events/%s' % (section_id, event_id)))
+        return self._make(Event, self._get('sections/%s/events/%s' % (section_id, event_id)))
 
     def get_group_event(self, event_id, group_id):
-        return Event(self._get('groups/%s/events/%s' % (group_id, event_id)))
+        return self._make(Event, self._get('groups/%s/events/%s' % (group_id, event_id)))
 
     def update_event(self, event, event_id, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
         """
@@ -649,19 +1260,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_district_blog_post(self, post, district_id):
-        return BlogPost(self._post('districts/%s/posts' % district_id, post.json()))
+        return self._make(BlogPost, self._post('districts/%s/posts' % district_id, post.json()))
 
     def create_school_blog_post(self, post, school_id):
-        return BlogPost(self._post('schools/%s/posts' % school_id, post.json()))
+        return self._make(BlogPost, self._post('schools/%s/posts' % school_id, post.json()))
 
     def create_user_blog_post(self, post, user_id):
-        return BlogPost(self._post('users/%s/posts' % user_id, post.json()))
+        return self._make(BlogPost, self._post('users/%s/posts' % user_id, post.json()))
 
     def create_section_blog_post(self, post, section_id):
-        return BlogPost(self._post('sections/%s/posts' % section_id, post.json()))
+        return self._make(BlogPost, self._post('sections/%s/posts' % section_id, post.json()))
 
     def create_group_blog_post(self, post, group_id):
-        return BlogPost(self._post('groups/%s/posts' % group_id, post.json()))
+        return self._make(BlogPost, self._post('groups/%s/posts' % group_id, post.json()))
 
 
     def get_blog_posts(self, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -685,19 +1296,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_blog_posts(self, district_id):
-        return [BlogPost(raw) for raw in self._get('districts/%s/posts' % district_id)['post']]
+        return self._get_list(BlogPost, 'post', 'districts/%s/posts' % district_id)
 
     def get_school_blog_posts(self, school_id):
-        return [BlogPost(raw) for raw in self._get('schools/%s/posts' % school_id)['post']]
+        return self._get_list(BlogPost, 'post', 'schools/%s/posts' % school_id)
 
     def get_user_blog_posts(self, user_id):
-        return [BlogPost(raw) for raw in self._get('users/%s/posts' % user_id)['post']]
+        return self._get_list(BlogPost, 'post', 'users/%s/posts' % user_id)
 
     def get_section_blog_posts(self, section_id):
-        return [BlogPost(raw) for raw in self._get('sections/%s/posts' % section_id)['post']]
+        return self._get_list(BlogPost, 'post', 'sections/%s/posts' % section_id)
 
     def get_group_blog_posts(self, group_id):
-        return [BlogPost(raw) for raw in self._get('groups/%s/posts' % group_id)['post']]
+        return self._get_list(BlogPost, 'post', 'groups/%s/posts' % group_id)
 
 
     def get_blog_post(self, post_id, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -721,19 +1332,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_blog_post(self, post_id, district_id):
-        return BlogPost(self._get('districts/%s/posts/%s' % (district_id, post_id)))
+        return self._make(BlogPost, self._get('districts/%s/posts/%s' % (district_id, post_id)))
 
     def get_school_blog_post(self, post_id, school_id):
-        return BlogPost(self._get('schools/%s/posts/%s' % (school_id, post_id)))
+        return self._make(BlogPost, self._get('schools/%s/posts/%s' % (school_id, post_id)))
 
     def get_user_blog_post(self, post_id, user_id):
-        return BlogPost(self._get('users/%s/posts/%s' % (user_id, post_id)))
+        return self._make(BlogPost, self._get('users/%s/posts/%s' % (user_id, post_id)))
 
     def get_section_blog_post(self, post_id, section_id):
-        return BlogPost(self._get('sections/%s/posts/%s' % (section_id, post_id)))
+        return self._make(BlogPost, self._get('sections/%s/posts/%s' % (section_id, post_id)))
 
     def get_group_blog_post(self, post_id, group_id):
-        return BlogPost(self._get('groups/%s/posts/%s' % (group_id, post_id)))
+        return self._make(BlogPost, self._get('groups/%s/posts/%s' % (group_id, post_id)))
 
 
     def update_blog_post(self, post, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -829,19 +1440,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_district_blog_post_comment(self, comment, post_id, district_id):
-        return BlogPostComment(self._post('districts/%s/posts/%s/comments' % (district_id, post_id), comment.json()))
+        return self._make(BlogPostComment, self._post('districts/%s/posts/%s/comments' % (district_id, post_id), comment.json()))
 
     def create_school_blog_post_comment(self, comment, post_id, school_id):
-        return BlogPostComment(self._post('schools/%s/posts/%s/comments' % (school_id, post_id), comment.json()))
+        return self._make(BlogPostComment, self._post('schools/%s/posts/%s/comments' % (school_id, post_id), comment.json()))
 
     def create_user_blog_post_comment(self, comment, post_id, user_id):
-        return BlogPostComment(self._post('users/%s/posts/%s/comments' % (user_id, post_id), comment.json()))
+        return self._make(BlogPostComment, self._post('users/%s/posts/%s/comments' % (user_id, post_id), comment.json()))
 
     def create_section_blog_post_comment(self, comment, post_id, section_id):
-        return BlogPostComment(self._post('sections/%s/posts/%s/comments' % (section_id, post_id), comment.json()))
+        return self._make(BlogPostComment, self._post('sections/%s/posts/%s/comments' % (section_id, post_id), comment.json()))
 
     def create_group_blog_post_comment(self, comment, post_id, group_id):
-        return BlogPostComment(self._post('groups/%s/posts/%s/comments' % (group_id, post_id), comment.json()))
+        return self._make(BlogPostComment, self._post('groups/%s/posts/%s/comments' % (group_id, post_id), comment.json()))
 
 
     def get_blog_post_comments(self, post_id, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -865,19 +1476,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_blog_post_comments(self, post_id, district_id):
-        return [BlogPostComment(raw) for raw in self._get('districts/%s/posts/%s/comments' % (district_id, post_id))['comment']]
+        return self._get_list(BlogPostComment, 'comment', 'districts/%s/posts/%s/comments' % (district_id, post_id))
 
     def get_school_blog_post_comments(self, post_id, school_id):
-        return [BlogPostComment(raw) for raw in self._get('schools/%s/posts/%s/comments' % (school_id, post_id))['comment']]
+        return self._get_list(BlogPostComment, 'comment', 'schools/%s/posts/%s/comments' % (school_id, post_id))
 
     def get_user_blog_post_comments(self, post_id, user_id):
-        return [BlogPostComment(raw) for raw in self._get('users/%s/posts/%s/comments' % (user_id, post_id))['comment']]
+        return self._get_list(BlogPostComment, 'comment', 'users/%s/posts/%s/comments' % (user_id, post_id))
 
     def get_section_blog_post_comments(self, post_id, section_id):
-        return [BlogPostComment(raw) for raw in self._get('sections/%s/posts/%s/comments' % (section_id, post_id))['comment']]
+        return self._get_list(BlogPostComment, 'comment', 'sections/%s/posts/%s/comments' % (section_id, post_id))
 
     def get_group_blog_post_comments(self, post_id, group_id):
-        return [BlogPostComment(raw) for raw in self._get('groups/%s/posts/%s/comments' % (group_id, post_id))['comment']]
+        return self._get_list(BlogPostComment, 'comment', 'groups/%s/posts/%s/comments' % (group_id, post_id))
 
 
     def get_blog_post_comment(self, comment_id, post_id, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -903,19 +1514,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_blog_post_comment(self, comment_id, post_id, district_id):
-        return BlogPostComment(self._get('districts/%s/posts/%s/comments/%s' % (district_id, post_id, comment_id)))
+        return self._make(BlogPostComment, self._get('districts/%s/posts/%s/comments/%s' % (district_id, post_id, comment_id)))
 
     def get_school_blog_post_comment(self, comment_id, post_id, school_id):
-        return BlogPostComment(self._get('schools/%s/posts/%s/comments/%s' % (school_id, post_id, comment_id)))
+        return self._make(BlogPostComment, self._get('schools/%s/posts/%s/comments/%s' % (school_id, post_id, comment_id)))
 
     def get_user_blog_post_comment(self, comment_id, post_id, user_id):
-        return BlogPostComment(self._get('users/%s/posts/%s/comments/%s' % (user_id, post_id, comment_id)))
+        return self._make(BlogPostComment, self._get('users/%s/posts/%s/comments/%s' % (user_id, post_id, comment_id)))
 
     def get_section_blog_post_comment(self, comment_id, post_id, section_id):
-        return BlogPostComment(self._get('sections/%s/posts/%s/comments/%s' % (section_id, post_id, comment_id)))
+        return self._make(BlogPostComment, self._get('sections/%s/posts/%s/comments/%s' % (section_id, post_id, comment_id)))
 
     def get_group_blog_post_comment(self, comment_id, post_id, group_id):
-        return BlogPostComment(self._get('groups/%s/posts/%s/comments/%s' % (group_id, post_id, comment_id)))
+        return self._make(BlogPostComment, self._get('groups/%s/posts/%s/comments/%s' % (group_id, post_id, comment_id)))
 
 
     def delete_blog_post_comment(self, comment_id, post_id, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -974,16 +1585,16 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_discussions(self, district_id):
-        return [Discussion(raw) for raw in self._get('districts/%s/discussions' % district_id)['discussion']]
+        return self._get_list(Discussion, 'discussion', 'districts/%s/discussions' % district_id)
 
     def get_school_discussions(self, school_id):
-        return [Discussion(raw) for raw in self._get('schools/%s/discussions' % school_id)['discussion']]
+        return self._get_list(Discussion, 'discussion', 'schools/%s/discussions' % school_id)
 
     def get_section_discussions(self, section_id):
-        return [Discussion(raw) for raw in self._get('sections/%s/discussions' % section_id)['discussion']]
+        return self._get_list(Discussion, 'discussion', 'sections/%s/discussions' % section_id)
 
     def get_group_discussions(self, group_id):
-        return [Discussion(raw) for raw in self._get('groups/%s/discussions' % group_id)['discussion']]
+        return self._get_list(Discussion, 'discussion', 'groups/%s/discussions' % group_id)
 
 
     def create_discussion(self, discussion, district_id=None, school_id=None, section_id=None, group_id=None):
@@ -1006,16 +1617,16 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_district_discussion(self, discussion, district_id):
-        return Discussion(self._post('districts/%s/discussions/%s' % (district_id, discussion.id), discussion.json()))
+        return self._make(Discussion, self._post('districts/%s/discussions/%s' % (district_id, discussion.id), discussion.json()))
 
     def create_school_discussion(self, discussion, school_id):
-        return Discussion(self._post('schools/%s/discussions/%s' % (school_id, discussion.id), discussion.json()))
+        return self._make(Discussion, self._post('schools/%s/discussions/%s' % (school_id, discussion.id), discussion.json()))
 
     def create_section_discussion(self, discussion, section_id):
-        return Discussion(self._post('sections/%s/discussions/%s' % (section_id, discussion.id), discussion.json()))
+        return self._make(Discussion, self._post('sections/%s/discussions/%s' % (section_id, discussion.id), discussion.json()))
 
     def create_group_discussion(self, discussion, group_id):
-        return Discussion(self._post('groups/%s/discussions/%s' % (group_id, discussion.id), discussion.json()))
+        return self._make(Discussion, self._post('groups/%s/discussions/%s' % (group_id, discussion.id), discussion.json()))
 
 
     def get_discussion(self, discussion_id, district_id=None, school_id=None, section_id=None, group_id=None):
@@ -1038,16 +1649,16 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_discussion(self, discussion_id, district_id):
-        return Discussion(self._get('districts/%s/discussions/%s' % (district_id, discussion_id)))
+        return self._make(Discussion, self._get('districts/%s/discussions/%s' % (district_id, discussion_id)))
 
     def get_school_discussion(self, discussion_id, school_id):
-        return Discussion(self._get('schools/%s/discussions/%s' % (school_id, discussion_id)))
+        return self._make(Discussion, self._get('schools/%s/discussions/%s' % (school_id, discussion_id)))
 
     def get_section_discussion(self, discussion_id, section_id):
-        return Discussion(self._get('sections/%s/discussions/%s' % (section_id, discussion_id)))
+        return self._make(Discussion, self._get('sections/%s/discussions/%s' % (section_id, discussion_id)))
 
     def get_group_discussion(self, discussion_id, group_id):
-        return Discussion(self._get('groups/%s/discussions/%s' % (group_id, discussion_id)))
+        return self._make(Discussion, self._get('groups/%s/discussions/%s' % (group_id, discussion_id)))
 
 
     def delete_discussion(self, discussion_id, district_id=None, school_id=None, section_id=None, group_id=None):
@@ -1102,16 +1713,16 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_district_discussion_reply(self, reply, discussion_id, district_id):
-        return DiscussionReply(self._post('districts/%s/discussions/%s/comments' % (district_id, discussion_id), reply))
+        return self._make(DiscussionReply, self._post('districts/%s/discussions/%s/comments' % (district_id, discussion_id), reply))
 
     def create_school_discussion_reply(self, reply, discussion_id, school_id):
-        return DiscussionReply(self._post('schools/%s/discussions/%s/comments' % (school_id, discussion_id), reply))
+        return self._make(DiscussionReply, self._post('schools/%s/discussions/%s/comments' % (school_id, discussion_id), reply))
 
     def create_section_discussion_reply(self, reply, discussion_id, section_id):
-        return DiscussionReply(self._post('sections/%s/discussions/%s/comments' % (section_id, discussion_id), reply))
+        return self._make(DiscussionReply, self._post('sections/%s/discussions/%s/comments' % (section_id, discussion_id), reply))
 
     def create_group_discussion_reply(self, reply, discussion_id, group_id):
-        return DiscussionReply(self._post('groups/%s/discussions/%s/comments' % (group_id, discussion_id), reply))
+        return self._make(DiscussionReply, self._post('groups/%s/discussions/%s/comments' % (group_id, discussion_id), reply))
 
 
     def get_discussion_replies(self, discussion_id, district_id=None, school_id=None, section_id=None, group_id=None):
@@ -1134,16 +1745,16 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_discussion_replies(self, discussion_id, district_id):
-        return [DiscussionReply(raw) for raw in self._get('districts/%s/discussions/%s/comments' % (district_id, discussion_id))['comment']]
+        return self._get_list(DiscussionReply, 'comment', 'districts/%s/discussions/%s/comments' % (district_id, discussion_id))
 
     def get_school_discussion_replies(self, discussion_id, school_id):
-        return [DiscussionReply(raw) for raw in self._get('schools/%s/discussions/%s/comments' % (school_id, discussion_id))['comment']]
+        return self._get_list(DiscussionReply, 'comment', 'schools/%s/discussions/%s/comments' % (school_id, discussion_id))
 
     def get_section_discussion_replies(self, discussion_id, section_id):
-        return [DiscussionReply(raw) for raw in self._get('sections/%s/discussions/%s/comments' % (section_id, discussion_id))['comment']]
+        return self._get_list(DiscussionReply, 'comment', 'sections/%s/discussions/%s/comments' % (section_id, discussion_id))
 
     def get_group_discussion_replies(self, discussion_id, group_id):
-        return [DiscussionReply(raw) for raw in self._get('groups/%s/discussions/%s/comments' % (group_id, discussion_id))['comment']]
+        return self._get_list(DiscussionReply, 'comment', 'groups/%s/discussions/%s/comments' % (group_id, discussion_id))
 
 
     def get_discussion_reply(self, reply_id, discussion_id, district_id=None, school_id=None, user_id=None, section_id=None, group_id=None):
@@ -1168,19 +1779,19 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_district_discussion_reply(self, reply_id, discussion_id, district_id):
-        return DiscussionReply(self._get('districts/%s/discussions/%s/comments/%s' % (district_id, discussion_id, reply_id)))
+        return self._make(DiscussionReply, self._get('districts/%s/discussions/%s/comments/%s' % (district_id, discussion_id, reply_id)))
 
     def get_school_discussion_reply(self, reply_id, discussion_id, school_id):
-        return DiscussionReply(self._get('schools/%s/discussions/%s/comments/%s' % (school_id, discussion_id, reply_id)))
+        return self._make(DiscussionReply, self._get('schools/%s/discussions/%s/comments/%s' % (school_id, discussion_id, reply_id)))
 
     def get_user_discussion_reply(self, reply_id, discussion_id, user_id):
-        return DiscussionReply(self._get('schools/%s/discussions/%s/comments/%s' % (user_id, discussion_id, reply_id)))
+        return self._make(DiscussionReply, self._get('schools/%s/discussions/%s/comments/%s' % (user_id, discussion_id, reply_id)))
 
     def get_section_discussion_reply(self, reply_id, discussion_id, section_id):
-        return DiscussionReply(self._get('sections/%s/discussions/%s/comments/%s' % (section_id, discussion_id, reply_id)))
+        return self._make(DiscussionReply, self._get('sections/%s/discussions/%s/comments/%s' % (section_id, discussion_id, reply_id)))
 
     def get_group_discussion_reply(self, reply_id, discussion_id, group_id):
-        return DiscussionReply(self._get('groups/%s/discussions/%s/comments/%s' % (group_id, discussion_id, reply_id)))
+        return self._make(DiscussionReply, self._get('groups/%s/discussions/%s/comments/%s' % (group_id, discussion_id, reply_id)))
 
 
     def delete_discussion_reply(self, reply_id, discussion_id, district_id=None, school_id=None, section_id=None, group_id=None):
@@ -1232,13 +1843,13 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_user_update(self, update, user_id):
-        return Update(self._post('users/%s/updates' % user_id, update.json()))
+        return self._make(Update, self._post('users/%s/updates' % user_id, update.json()))
 
     def create_section_update(self, update, section_id):
-        return Update(self._post('sections/%s/updates' % section_id, update.json()))
+        return self._make(Update, self._post('sections/%s/updates' % section_id, update.json()))
 
     def create_group_update(self, update, group_id):
-        return Update(self._post('groups/%s/updates' % group_id, update.json()))
+        return self._make(Update, self._post('groups/%s/updates' % group_id, update.json()))
 
 
     def get_updates(self, user_id=None, section_id=None, group_id=None):
@@ -1257,13 +1868,13 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_user_updates(self, user_id):
-        return [Update(raw) for raw in self._get('users/%s/updates' % user_id)['update']]
+        return self._get_list(Update, 'update', 'users/%s/updates' % user_id)
 
     def get_section_updates(self, section_id):
-        return [Update(raw) for raw in self._get('sections/%s/updates' % section_id)['update']]
+        return self._get_list(Update, 'update', 'sections/%s/updates' % section_id)
 
     def get_group_updates(self, group_id):
-        return [Update(raw) for raw in self._get('groups/%s/updates' % group_id)['update']]
+        return self._get_list(Update, 'update', 'groups/%s/updates' % group_id)
 
 
     def get_feed(self):
@@ -1275,7 +1886,7 @@ class Schoology:
 
         :return: List of recent updates.
         """
-        return [Update(raw) for raw in self._get('recent')['update']]
+        return self._get_list(Update, 'update', 'recent')
 
 
     def get_update(self, update_id, user_id=None, section_id=None, group_id=None):
@@ -1294,13 +1905,13 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_user_update(self, update_id, user_id):
-        return Update(self._get('users/%s/updates/%s' % (user_id, update_id)))
+        return self._make(Update, self._get('users/%s/updates/%s' % (user_id, update_id)))
 
     def get_section_update(self, update_id, section_id):
-        return Update(self._get('sections/%s/updates/%s' % (section_id, update_id)))
+        return self._make(Update, self._get('sections/%s/updates/%s' % (section_id, update_id)))
 
     def get_group_update(self, update_id, group_id):
-        return Update(self._get('groups/%s/updates/%s' % (group_id, update_id)))
+        return self._make(Update, self._get('groups/%s/updates/%s' % (group_id, update_id)))
 
 
     def delete_update(self, update_id, user_id=None, section_id=None, group_id=None):
@@ -1320,13 +1931,13 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def delete_user_update(self, update_id, user_id):
-        return Update(self._delete('users/%s/updates/%s' % (user_id, update_id)))
+        return self._make(Update, self._delete('users/%s/updates/%s' % (user_id, update_id)))
 
     def delete_section_update(self, update_id, section_id):
-        return Update(self._delete('sections/%s/updates/%s' % (section_id, update_id)))
+        return self._make(Update, self._delete('sections/%s/updates/%s' % (section_id, update_id)))
 
     def delete_group_update(self, update_id, group_id):
-        return Update(self._delete('groups/%s/updates/%s' % (group_id, update_id)))
+        return self._make(Update, self._delete('groups/%s/updates/%s' % (group_id, update_id)))
 
 
     def update_update(self, update, user_id=None, section_id=None, group_id=None):
@@ -1346,13 +1957,13 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def update_user_update(self, update, user_id):
-        return Update(self._put('users/%s/updates' % user_id, update.json()))
+        return self._make(Update, self._put('users/%s/updates' % user_id, update.json()))
 
     def update_section_update(self, update, section_id):
-        return Update(self._put('sections/%s/updates' % section_id, update.json()))
+        return self._make(Update, self._put('sections/%s/updates' % section_id, update.json()))
 
     def update_group_update(self, update, group_id):
-        return Update(self._put('groups/%s/updates' % group_id, update.json()))
+        return self._make(Update, self._put('groups/%s/updates' % group_id, update.json()))
 
 
     def create_update_comment(self, comment, update_id, user_id=None, section_id=None, group_id=None):
@@ -1373,13 +1984,13 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_user_update_comment(self, comment, update_id, user_id):
-        return Update(self._post('users/%s/updates/%s/comments' % (user_id, update_id), comment.json()))
+        return self._make(Update, self._post('users/%s/updates/%s/comments' % (user_id, update_id), comment.json()))
 
     def create_section_update_comment(self, comment, update_id, section_id):
-        return Update(self._post('sections/%s/updates/%s/comments' % (section_id, update_id), comment.json()))
+        return self._make(Update, self._post('sections/%s/updates/%s/comments' % (section_id, update_id), comment.json()))
 
     def create_group_update_comment(self, comment, update_id, group_id):
-        return Update(self._post('groups/%s/updates/%s/comments' % (group_id, update_id), comment.json()))
+        return self._make(Update, self._post('groups/%s/updates/%s/comments' % (group_id, update_id), comment.json()))
 
 
     def get_update_comments(self, update_id, user_id=None, section_id=None, group_id=None):
@@ -1399,13 +2010,13 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_user_update_comments(self, update_id, user_id):
-        return [UpdateComment(raw) for raw in self._get('users/%s/updates/%s/comments' % (user_id, update_id))['comment']]
+        return self._get_list(UpdateComment, 'comment', 'users/%s/updates/%s/comments' % (user_id, update_id))
 
     def get_section_update_comments(self, update_id, section_id):
-        return [UpdateComment(raw) for raw in self._get('sections/%s/updates/%s/comments' % (section_id, update_id))['comment']]
+        return self._get_list(UpdateComment, 'comment', 'sections/%s/updates/%s/comments' % (section_id, update_id))
 
     def get_group_update_comments(self, update_id, group_id):
-        return [UpdateComment(raw) for raw in self._get('groups/%s/updates/%s/comments' % (group_id, update_id))['comment']]
+        return self._get_list(UpdateComment, 'comment', 'groups/%s/updates/%s/comments' % (group_id, update_id))
 
 
     def get_update_comment(self, comment_id, update_id, user_id=None, section_id=None, group_id=None):
@@ -1426,13 +2037,13 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_user_update_comment(self, comment_id, update_id, user_id):
-        return UpdateComment(self._get('users/%s/updates/%s/comments/%s' % (user_id, update_id, comment_id)))
+        return self._make(UpdateComment, self._get('users/%s/updates/%s/comments/%s' % (user_id, update_id, comment_id)))
 
     def get_section_update_comment(self, comment_id, update_id, section_id):
-        return UpdateComment(self._get('sections/%s/updates/%s/comments/%s' % (section_id, update_id, comment_id)))
+        return self._make(UpdateComment, self._get('sections/%s/updates/%s/comments/%s' % (section_id, update_id, comment_id)))
 
     def get_group_update_comment(self, comment_id, update_id, group_id):
-        return UpdateComment(self._get('groups/%s/updates/%s/comments/%s' % (group_id, update_id, comment_id)))
+        return self._make(UpdateComment, self._get('groups/%s/updates/%s/comments/%s' % (group_id, update_id, comment_id)))
 
 
     def delete_update_comment(self, comment_id, update_id, user_id=None, section_id=None, group_id=None):
@@ -1479,10 +2090,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_section_media_album(self, album, section_id):
-        return MediaAlbum(self._post('sections/%s/albums' % section_id, album.json()))
+        return self._make(MediaAlbum, self._post('sections/%s/albums' % section_id, album.json()))
 
     def create_group_media_album(self, album, group_id):
-        return MediaAlbum(self._post('groups/%s/albums' % group_id, album.json()))
+        return self._make(MediaAlbum, self._post('groups/%s/albums' % group_id, album.json()))
 
 
     def get_media_albums(self, section_id=None, group_id=None):
@@ -1500,10 +2111,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_section_media_albums(self, section_id):
-        return [MediaAlbum(raw) for raw in self._get('sections/%s/albums' % section_id)['album']]
+        return self._get_list(MediaAlbum, 'album', 'sections/%s/albums' % section_id)
 
     def get_group_media_albums(self, group_id):
-        return [MediaAlbum(raw) for raw in self._get('groups/%s/albums' % group_id)['album']]
+        return self._get_list(MediaAlbum, 'album', 'groups/%s/albums' % group_id)
 
 
     def get_media_album(self, album_id, section_id=None, group_id=None):
@@ -1521,10 +2132,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_section_media_album(self, album_id, section_id):
-        return MediaAlbum(self._get('sections/%s/albums/%s' % (section_id, album_id)))
+        return self._make(MediaAlbum, self._get('sections/%s/albums/%s' % (section_id, album_id)))
 
     def get_group_media_album(self, album_id, group_id):
-        return MediaAlbum(self._get('groups/%s/albums/%s' % (group_id, album_id)))
+        return self._make(MediaAlbum, self._get('groups/%s/albums/%s' % (group_id, album_id)))
 
 
     def update_media_album(self, album_id, section_id=None, group_id=None):
@@ -1542,10 +2153,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def update_section_media_album(self, album_id, section_id):
-        return MediaAlbum(self._get('sections/%s/albums/%s' % (section_id, album_id)))
+        return self._make(MediaAlbum, self._get('sections/%s/albums/%s' % (section_id, album_id)))
 
     def update_group_media_album(self, album_id, group_id):
-        return MediaAlbum(self._get('groups/%s/albums/%s' % (group_id, album_id)))
+        return self._make(MediaAlbum, self._get('groups/%s/albums/%s' % (group_id, album_id)))
 
 
     def delete_media_album(self, album_id, section_id=None, group_id=None):
@@ -1588,10 +2199,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_section_media_album_content(self, content_id, album_id, section_id):
-        return Media(self._get('sections/%s/albums/%s/content/%s' % (section_id, album_id, content_id)))
+        return self._make(Media, self._get('sections/%s/albums/%s/content/%s' % (section_id, album_id, content_id)))
 
     def get_group_media_album_content(self, content_id, album_id, group_id):
-        return Media(self._get('groups/%s/albums/%s/content/%s' % (group_id, album_id, content_id)))
+        return self._make(Media, self._get('groups/%s/albums/%s/content/%s' % (group_id, album_id, content_id)))
 
 
     def update_media_album_content(self, content, content_id, album_id, section_id=None, group_id=None):
@@ -1642,10 +2253,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_section_media_album_content(self, content, content_id, album_id, section_id):
-        return Media(self._post('sections/%s/albums/%s/content' % (section_id, album_id), content.json()))
+        return self._make(Media, self._post('sections/%s/albums/%s/content' % (section_id, album_id), content.json()))
 
     def create_group_media_album_content(self, content, content_id, album_id, group_id):
-        return Media(self._post('groups/%s/albums/%s/content' % (group_id, album_id), content.json()))
+        return self._make(Media, self._post('groups/%s/albums/%s/content' % (group_id, album_id), content.json()))
 
 
     def delete_media_album_content(self, content_id, album_id, section_id=None, group_id=None):
@@ -1690,7 +2301,7 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def create_school_media_album(self, document, school_id):
-        return Document(self._post('schools/%s/documents' % school_id, document.json()))
+        return self._make(Document, self._post('schools/%s/documents' % school_id, document.json()))
 
 
 
@@ -1709,10 +2320,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_school_documents(self, school_id):
-        return [Document(raw) for raw in self._get('schools/%s/documents' % school_id)['document']]
+        return self._get_list(Document, 'document', 'schools/%s/documents' % school_id)
 
     def get_section_documents(self, section_id):
-        return [Document(raw) for raw in self._get('sections/%s/documents' % section_id)['document']]
+        return self._get_list(Document, 'document', 'sections/%s/documents' % section_id)
 
 
     def get_document(self, document_id, section_id=None, group_id=None):
@@ -1730,10 +2341,10 @@ class Schoology:
             raise TypeError('Realm id property required.')
 
     def get_school_document(self, document_id, school_id):
-        return Document(self._get('schools/%s/documents/%s' % (school_id, document_id)))
+        return self._make(Document, self._get('schools/%s/documents/%s' % (school_id, document_id)))
 
     def get_section_document(self, document_id, section_id):
-        return Document(self._get('sections/%s/documents/%s' % (section_id, document_id)))
+        return self._make(Document, self._get('sections/%s/documents/%s' % (section_id, document_id)))
 
 
     def update_document(self, document, document_id, section_id=None, group_id=None):
@@ -1787,7 +2398,7 @@ class Schoology:
         :param section_id: ID of section whose grading scale to get data on.
         :return: GradingScale object.
         """
-        return GradingScale(self._get('sections/%s/grading_scales' % section_id))
+        return self._make(GradingScale, self._get('sections/%s/grading_scales' % section_id))
 
 
     def get_rubrics(self, section_id):
@@ -1797,7 +2408,7 @@ class Schoology:
         :param section_id: ID of section from which to get rubrics.
         :return: List of Rubric objects.
         """
-        return [Rubric(raw) for raw in self._get('sections/%s/grading_rubrics' % section_id)['grading_rubric']]
+        return self._get_list(Rubric, 'grading_rubric', 'sections/%s/grading_rubrics' % section_id)
 
     def get_rubric(self, rubric_id, section_id):
         """
@@ -1806,7 +2417,7 @@ class Schoology:
         :param rubric_id: ID of rubric on which to get data.
         :param section_id: ID of section in which rubric is used.
         """
-        return Rubric(self._get('sections/%s/grading_rubrics/%s' % (section_id, rubric_id)))
+        return self._make(Rubric, self._get('sections/%s/grading_rubrics/%s' % (section_id, rubric_id)))
 
 
     def create_grading_categories(self, categories, section_id):
@@ -1816,7 +2427,7 @@ class Schoology:
         :param categories: List of GradingCategory objects to create.
         :param section_id: ID of section in which to create categories.
         """
-        return [GradingCategory(raw) for raw in self._put('sections/%s/grading_categories' % section_id, {'grading_categories': {'grading_category': [category.json() for category in categories]}})['grading_category']]
+        return [self._make(GradingCategory, raw) for raw in self._put('sections/%s/grading_categories' % section_id, {'grading_categories': {'grading_category': [category.json() for category in categories]}})['grading_category']]
 
     def get_grading_categories(self, section_id):
         """
@@ -1824,7 +2435,7 @@ class Schoology:
 
         :param section_id: ID of section whose categories to get.
         """
-        return [GradingCategory(raw) for raw in self._get('sections/%s/grading_categories' % section_id)['grading_category']]
+        return self._get_list(GradingCategory, 'grading_category', 'sections/%s/grading_categories' % section_id)
 
     def get_grading_category(self, category_id, section_id):
         """
@@ -1833,7 +2444,7 @@ class Schoology:
         :param category_id: ID of category.
         :param section_id: ID of category's section.
         """
-        return GradingCategory(self._get('sections/%s/grading_categories/%s' % (section_id, category_id)))
+        return self._make(GradingCategory, self._get('sections/%s/grading_categories/%s' % (section_id, category_id)))
 
     def update_grading_category(self, category, section_id):
         """
@@ -1861,7 +2472,7 @@ class Schoology:
         :param groups: List of GradingGroup objects to create.
         :param section_id: ID of section in which to create groups.
         """
-        return [GradingGroup(raw) for raw in self._put('sections/%s/grading_groups' % section_id, {'grading_groups': {'grading_group': [group.json() for group in groups]}})['grading_group']]
+        return [self._make(GradingGroup, raw) for raw in self._put('sections/%s/grading_groups' % section_id, {'grading_groups': {'grading_group': [group.json() for group in groups]}})['grading_group']]
 
     def get_grading_groups(self, section_id):
         """
@@ -1869,7 +2480,7 @@ class Schoology:
 
         :param section_id: ID of section whose groups to get.
         """
-        return [GradingGroup(raw) for raw in self._get('sections/%s/grading_groups' % section_id)['grading_group']]
+        return self._get_list(GradingGroup, 'grading_group', 'sections/%s/grading_groups' % section_id)
 
     def get_grading_group(self, group_id, section_id):
         """
@@ -1878,7 +2489,7 @@ class Schoology:
         :param group_id: ID of group.
         :param section_id: ID of group's section.
         """
-        return GradingGroup(self._get('sections/%s/grading_groups/%s' % (section_id, group_id)))
+        return self._make(GradingGroup, self._get('sections/%s/grading_groups/%s' % (section_id, group_id)))
 
     def update_grading_group(self, group, section_id):
         """
@@ -1900,10 +2511,10 @@ class Schoology:
         self._delete('sections/%s/grading_groups/%s' % (section_id, group_id))
 
     def create_assignment(self, assignment, section_id):
-        return Assignment(self._post('/sections/%s/assignments' % section_id, assignment.json()))
+        return self._make(Assignment, self._post('/sections/%s/assignments' % section_id, assignment.json()))
 
     def get_assignments(self, section_id, with_attachments: bool = True):
-        return [Assignment(raw) for raw in self._get('sections/%s/assignments' % section_id, {'with_attachments': int(with_attachments)})['assignment']]
+        return self._get_list(Assignment, 'assignment', 'sections/%s/assignments' % section_id, {'with_attachments': int(with_attachments)})
 
     def get_file(self, url):
         """
@@ -1912,27 +2523,139 @@ class Schoology:
         :param url: URL of the file to retrieve.
         :return: Response containing the file data in binary format.
         """
-        response = self.schoology_auth.oauth.get(
-            url=url,
+        response = self._request(
+            'GET',
+            url,
             #headers=self.schoology_auth._request_header(),
             #auth=self.schoology_auth.oauth.auth
         )
-        response.raise_for_status()
         try:
             return response
         except JSONDecodeError:
             raise NoDataError(f'Get request to {response.url} failed: {response.text}')
 
+    def download_file(self, url, destination, resume=False, chunk_size=1048576, max_resumes=5):
+        """
+        Download a file from the Schoology API, writing it out chunk by chunk rather than holding it in memory.
+
+        If the connection drops, the download picks up where it left off with an HTTP Range request.
+        The number of bytes received is checked against the size announced by the server.
+
+        :param url: URL of the file to retrieve.
+        :param destination: Path to write the file to, or a binary file-like object to write it into.
+        :param resume: Whether to continue a partial file already at the destination path, rather than overwrite it.
+        :param chunk_size: Number of bytes to read and write at a time.
+        :param max_resumes: Maximum number of times to resume after losing the connection.
+        :return: Download object with the size of the file and the throughput achieved.
+        """
+        if isinstance(destination, (str, os.PathLike)):
+            offset = os.path.getsize(destination) if resume and os.path.exists(destination) else 0
+            with open(destination, 'ab' if offset else 'wb') as file:
+                return self._download(url, file, destination, offset, chunk_size, max_resumes)
+        return self._download(url, destination, destination, 0, chunk_size, max_resumes)
+
+    def _download(self, url, file, destination, offset, chunk_size, max_resumes):
+        """
+        Download a file into a file object. See download_file.
+
+        :param offset: Number of bytes of the file already written, before the current position of the file object.
+        """
+        started = time.monotonic()
+        origin = file.tell() - offset if file.seekable() else None
+        written = offset
+        size = None
+        resumes = 0
+        while True:
+            try:
+                headers = {'Range': 'bytes=%d-' % written} if written else {}
+                with self._request('GET', url, headers=headers, stream=True) as response:
+                    if written and response.status_code != 206:
+                        # The server ignored the range, so the file has to be written again from the start.
+                        if origin is None:
+                            raise IncompleteDownloadError(f'Could not resume download of {url}: range requests are not supported.')
+                        file.seek(origin)
+                        file.truncate()
+                        written = 0
+                    size = expected_size(response.status_code, response.headers) or size
+                    for chunk in response.iter_content(chunk_size):
+                        file.write(chunk)
+                        written += len(chunk)
+                break
+            except requests.HTTPError as e:
+                # 416 means the partial file held is already complete.
+                if not written or e.response is None or e.response.status_code != 416:
+                    raise
+                size = expected_size(416, e.response.headers) or written
+                break
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                if resumes >= max_resumes:
+                    raise
+                resumes += 1
+        if size is not None and written != size:
+            raise IncompleteDownloadError(f'Download of {url} ended after {written} of {size} bytes.')
+        return Download(url, destination, written, offset, time.monotonic() - started, resumes)
+
+    def download_attachments(self, items, directory, submissions=True, max_workers=8, max_per_host=4, resume=True, manifest=None):
+        """
+        Download every file attached to a set of models, or to the assignments of a section, several at a time.
+
+        :param items: Section ID, or models fetched with their attachments, e.g. the result of get_assignments.
+        :param directory: Directory to save the files into, created if need be. Each is named <attachment ID>-<filename>.
+        :param submissions: When items is a section ID, whether to include the files attached to submissions as well as
+                            to assignments. Submissions that cannot be listed, e.g. for lack of permission, are skipped.
+        :param max_workers: Maximum number of downloads in progress at once.
+        :param max_per_host: Maximum number of downloads in progress at once from the same host.
+        :param resume: Whether to continue partial files left in the directory by an earlier run. Files already complete
+                       are not downloaded again.
+        :param manifest: Optional path to write the list of results to as JSON.
+        :return: List with a dictionary per file giving its URL, path and size, or the error its download ran into.
+        """
+        if isinstance(items, (int, str)):
+            items = self._section_attachments(items, submissions, max_workers)
+        files = attachment_files(items)
+        os.makedirs(directory, exist_ok=True)
+        self._pool_connections(max_workers)
+        hosts = {urlparse(file['download_path']).netloc: None for file in files}
+        hosts = {host: threading.Semaphore(max_per_host) for host in hosts}
+
+        def download(file):
+            path = attachment_path(directory, file)
+            with hosts[urlparse(file['download_path']).netloc]:
+                try:
+                    return manifest_entry(file, path, self.download_file(file['download_path'], path, resume=resume))
+                except Exception as e:
+                    return manifest_entry(file, path, e)
+
+        results = self._map(download, files, max_workers)
+        if manifest is not None:
+            with open(manifest, 'w') as f:
+                json.dump(results, f, indent=4)
+        return results
+
+    def _section_attachments(self, section_id, submissions, max_workers):
+        """
+        Fetch every assignment of a section, and optionally every submission to them, with their attachments.
+
+        :return: List of lists of models.
+        """
+        assignments = list(self.paginate(self.get_assignments, section_id, with_attachments=True))
+        items = [assignments]
+        if submissions:
+            revisions = self.get_many(lambda assignment_id: list(self.paginate(self.get_assignment_submissions, section_id, assignment_id)),
+                                      [assignment['id'] for assignment in assignments], max_workers=max_workers)
+            items += [revision for revision in revisions if not isinstance(revision, Exception)]
+        return items
+
 
     def get_assignment(self, section_id, assignment_id, with_attachments: bool = True):
-        return Assignment(self._get('sections/%s/assignments/%s' % (section_id, assignment_id), {'with_attachments': int(with_attachments)}))
+        return self._make(Assignment, self._get('sections/%s/assignments/%s' % (section_id, assignment_id), {'with_attachments': int(with_attachments)}))
 
 
     def get_assignment_comments(self, section_id, assignment_id):
-        return [Assignment(raw) for raw in self._get('sections/%s/assignments/%s/comments' % (section_id, assignment_id))['comment']]
+        return self._get_list(Assignment, 'comment', 'sections/%s/assignments/%s/comments' % (section_id, assignment_id))
 
     def get_assignment_comment(self, section_id, assignment_id, comment_id):
-        return Assignment(self._get('sections/%s/assignments/%s' % (section_id, assignment_id)))
+        return self._make(Assignment, self._get('sections/%s/assignments/%s' % (section_id, assignment_id)))
 
 
     # TODO: Support Grades
@@ -1940,80 +2663,80 @@ class Schoology:
     # TODO: Support Submissions
 
     def get_assignment_submissions(self, section_id, assignment_id, with_attachments: bool = True):
-        return [Submission(raw) for raw in self._get('sections/%s/submissions/%s' % (section_id, assignment_id), {'with_attachments': int(with_attachments)})['revision']]
+        return self._get_list(Submission, 'revision', 'sections/%s/submissions/%s' % (section_id, assignment_id), {'with_attachments': int(with_attachments)})
 
     def get_user_assignment_submissions(self, section_id, assignment_id, user_id, with_attachments: bool = True):
-        return [Submission(raw) for raw in self._get('sections/%s/submissions/%s/%s' % (section_id, assignment_id, user_id), {'with_attachments': int(with_attachments)})['revision']]
+        return self._get_list(Submission, 'revision', 'sections/%s/submissions/%s/%s' % (section_id, assignment_id, user_id), {'with_attachments': int(with_attachments)})
     
 
     # TODO: Support Course Content Folders
 
     def get_section_folder(self, section_id, folder_id):
-        return CourseFolder(self._get('courses/%s/folder/%s' % (section_id, folder_id)))
+        return self._make(CourseFolder, self._get('courses/%s/folder/%s' % (section_id, folder_id)))
 
     # TODO: Support Pages
 
     def get_pages(self, section_id, with_content: bool = True, with_attachments: bool = True):
-        return [Page(raw) for raw in self._get('sections/%s/pages' % (section_id), {'withcontent': int(with_content), 'with_attachments': int(with_attachments)})['page']]
+        return self._get_list(Page, 'page', 'sections/%s/pages' % (section_id), {'withcontent': int(with_content), 'with_attachments': int(with_attachments)})
 
     def get_section_page(self, page_id, section_id, with_attachments: bool = True):
-        return Page(self._get('sections/%s/page/%s' % (section_id, page_id), {'with_attachments': int(with_attachments)}))
+        return self._make(Page, self._get('sections/%s/page/%s' % (section_id, page_id), {'with_attachments': int(with_attachments)}))
 
     # TODO: Support SCORM Packages
     # TODO: Support Web Content Package
     # TODO: Support Completion
 
     def get_friend_requests(self, user_id):
-        return [FriendRequest(raw) for raw in self._get('users/%s/requests/friends' % user_id)['request']]
+        return self._get_list(FriendRequest, 'request', 'users/%s/requests/friends' % user_id)
 
     def get_friend_request(self, user_id, request_id):
-        return FriendRequest(self._get('users/%s/requests/friends/%s' % (user_id, request_id)))
+        return self._make(FriendRequest, self._get('users/%s/requests/friends/%s' % (user_id, request_id)))
 
 
     def get_user_section_invites(self, user_id):
-        return [Invite(raw) for raw in self._get('users/%s/invites/sections' % user_id)['invite']]
+        return self._get_list(Invite, 'invite', 'users/%s/invites/sections' % user_id)
 
     def get_user_group_invites(self, user_id):
-        return [Invite(raw) for raw in self._get('users/%s/invites/groups' % user_id)['invite']]
+        return self._get_list(Invite, 'invite', 'users/%s/invites/groups' % user_id)
 
     def get_user_section_invite(self, user_id, invite_id):
-        return Invite(self._get('users/%s/invites/sections/%s' % (user_id, invite_id)))
+        return self._make(Invite, self._get('users/%s/invites/sections/%s' % (user_id, invite_id)))
 
     def get_user_group_invite(self, user_id, invite_id):
-        return Invite(self._get('users/%s/invites/groups/%s' % (user_id, invite_id)))
+        return self._make(Invite, self._get('users/%s/invites/groups/%s' % (user_id, invite_id)))
 
 
     def get_user_network(self, user_id):
-        return [User(raw) for raw in self._get('users/%s/network' % user_id)['users']]
+        return self._get_list(User, 'users', 'users/%s/network' % user_id)
 
 
     def get_user_grades(self, user_id):
-        return [Grade(raw) for raw in self._get('users/%s/grades' % user_id)['section']]
+        return self._get_list(Grade, 'section', 'users/%s/grades' % user_id)
 
     def get_user_grades_by_section(self, user_id, section_id):
-        return [Grade(raw) for raw in self._get('users/%s/grades' % user_id, params={'section_id': section_id})['section']]
+        return self._get_list(Grade, 'section', 'users/%s/grades' % user_id, params={'section_id': section_id})
 
     def get_user_sections(self, user_id):
-        return [Section(raw) for raw in self._get('users/%s/sections' % user_id)['section']]
+        return self._get_list(Section, 'section', 'users/%s/sections' % user_id)
 
     def get_user_groups(self, user_id):
-        return [Group(raw) for raw in self._get('users/%s/groups' % user_id)['group']]
+        return self._get_list(Group, 'group', 'users/%s/groups' % user_id)
 
     # TODO: Implement get_user_requests
     # TODO: Implement get_user_invites
     # TODO: Implement get_user_external_id
 
     def get_grading_periods(self):
-        return [GradingPeriod(raw) for raw in self._get('gradingperiods')['gradingperiods']]
+        return self._get_list(GradingPeriod, 'gradingperiods', 'gradingperiods')
 
     def get_grading_period(self, gradingperiod_id):
-        return GradingPeriod(self._get('gradingperiods/%s' % gradingperiod_id))
+        return self._make(GradingPeriod, self._get('gradingperiods/%s' % gradingperiod_id))
 
     def get_roles(self):
-        return [Role(raw) for raw in self._get('roles')['role']]
+        return self._get_list(Role, 'role', 'roles')
 
     def get_role(self, role_id):
-        return Role(self._get('roles/%s' % role_id))
+        return self._make(Role, self._get('roles/%s' % role_id))
 
     def get_messages(self, message_folder):
         """
@@ -2027,10 +2750,10 @@ class Schoology:
             return self.get_inbox_messages()
 
     def get_sent_messages(self):
-        return [MessageThread(raw) for raw in self._get('messages/sent')['message']]
+        return self._get_list(MessageThread, 'message', 'messages/sent')
 
     def get_inbox_messages(self):
-        return [MessageThread(raw) for raw in self._get('messages/inbox')['message']]
+        return self._get_list(MessageThread, 'message', 'messages/inbox')
 
     def get_message(self, message_id):
         """
@@ -2041,7 +2764,7 @@ class Schoology:
         :param message_id: ID of the message thread desired.
         :return: list of messages in that thread.
         """
-        return [Message(raw) for raw in self._get('messages/inbox/%s' % message_id)['message']]
+        return self._get_list(Message, 'message', 'messages/inbox/%s' % message_id)
 
 
     def create_message(self, message):
@@ -2052,7 +2775,7 @@ class Schoology:
         """
         if isinstance(message.recipient_ids, list):
             message.recipient_ids = ','.join(message.recipient_ids)
-        return Message(self._post('messages', message.json()))
+        return self._make(Message, self._post('messages', message.json()))
 
     def send_message(self, subject, content, user_ids):
         """
@@ -2126,7 +2849,7 @@ class Schoology:
         :param id: ID of object to check likes of.
         :return: List of users who have liked an object.
         """
-        return [User(raw) for raw in self._get('like/%s' % id)['users']]
+        return self._get_list(User, 'users', 'like/%s' % id)
 
     def like_comment(self, id, comment_id):
         """
@@ -2154,7 +2877,7 @@ class Schoology:
         :param comment_id: ID of comment to check likes of.
         :return List of users who have liked the comment.
         """
-        return [User(raw) for raw in self._get('like/%s/comment/%s' % (id, comment_id))['users']]
+        return self._get_list(User, 'users', 'like/%s/comment/%s' % (id, comment_id))
 
     def vote(self, poll_id, choice_id):
         """
@@ -2181,15 +2904,14 @@ class Schoology:
         start_time = end_time - 604800 if start_time is None else start_time
         if start_time < end_time - 604800:
             raise AttributeError('Start timestamp must be no earlier than 7 days before end timestamp.')
-        return [Action(raw) for raw in self._get('analytics/users/%s' % user_id,
-                                                 params={
-                                                     'start_time': start_time,
-                                                     'end_time': end_time,
-                                                     'start': self.start
-                                                 })['actions']]
+        return self._get_list(Action, 'actions', 'analytics/users/%s' % user_id,
+                              params={
+                                  'start_time': start_time,
+                                  'end_time': end_time,
+                              })
 
     # TODO: Implement other analytics endpoints
-    # TODO: Implement multi-get(!) and multi-options requests. Don't seem to work right now.
+    # TODO: Implement multi-options requests.
 
     # TODO: Support all User-Specific Objects, User Information, etc. requests
 
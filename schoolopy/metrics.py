@@ -0,0 +1,174 @@
+import bisect
+import re
+import threading
+from urllib.parse import urlparse
+
+_identifier = re.compile(r'^(\d+|[0-9a-f]{16,})(\.\w+)?$')
+
+
+def endpoint_template(url, api_host=''):
+    """
+    Reduce a URL to the endpoint it requests, with IDs replaced by placeholders, e.g. 'sections/{id}/enrollments'.
+
+    :param url: Full URL, or path following the API root.
+    :param api_host: Root URL of the API, removed from the start of url.
+    :return: Endpoint template.
+    """
+    if api_host and url.startswith(api_host):
+        url = url[len(api_host):]
+    path = urlparse(url).path.strip('/')
+    return '/'.join('{id}' if _identifier.match(segment) else segment for segment in path.split('/'))
+
+
+class RequestEvent:
+    """
+    Record of one request made by a client, or answered from its cache, as passed to hooks.
+
+    status is None when no response was received, and error holds the exception the request ended with, if any.
+    attempts counts the times the request was sent, so attempts - 1 of them were retries. waited is the time spent
+    waiting for the rate limiter and between retries, included in elapsed. bytes is the size of the response body,
+    or None if unknown, as for streamed downloads without a Content-Length.
+    """
+    def __init__(self, verb, url, endpoint, status=None, elapsed=0.0, bytes=None, request_bytes=0, attempts=0,
+                 waited=0.0, cache_hit=False, error=None):
+        self.verb = verb
+        self.url = url
+        self.endpoint = endpoint
+        self.status = status
+        self.elapsed = elapsed
+        self.bytes = bytes
+        self.request_bytes = request_bytes
+        self.attempts = attempts
+        self.waited = waited
+        self.cache_hit = cache_hit
+        self.error = error
+
+    @property
+    def retries(self):
+        return max(0, self.attempts - 1)
+
+    def to_dict(self):
+        """
+        :return: Dictionary of the event's fields, with the error as a string, suitable for logging as JSON.
+        """
+        event = dict(self.__dict__, retries=self.retries)
+        if self.error is not None:
+            event['error'] = '%s: %s' % (type(self.error).__name__, self.error)
+        return event
+
+    def __repr__(self):
+        return 'RequestEvent(%s %s, status=%s, %.1fms%s)' % (self.verb, self.endpoint, self.status, self.elapsed * 1000,
+                                                             ', cache hit' if self.cache_hit else '')
+
+
+class _EndpointStats:
+    def __init__(self, buckets):
+        self.count = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.bytes = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(buckets) + 1)
+
+
+class Metrics:
+    """
+    Hook aggregating request events into per-endpoint counts, byte totals and latency histograms.
+
+    Pass an instance in a client's hooks, then call summary() or report() to see which endpoints take up the most time.
+    """
+    buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, buckets=None):
+        """
+        :param buckets: Upper bounds in seconds of the histogram's buckets, in increasing order. Slower requests are
+                        counted in a final, unbounded bucket.
+        """
+        if buckets is not None:
+            self.buckets = tuple(buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        """
+        Record an event. Cache hits are only counted, apart from the requests sent.
+
+        :param event: RequestEvent.
+        """
+        with self._lock:
+            stats = self._endpoints.get((event.verb, event.endpoint))
+            if stats is None:
+                stats = self._endpoints[(event.verb, event.endpoint)] = _EndpointStats(self.buckets)
+            if event.cache_hit:
+                # Kept out of the request count and latencies, which answers from the cache would drag toward zero.
+                stats.cache_hits += 1
+                return
+            stats.count += 1
+            stats.errors += event.error is not None
+            stats.retries += event.retries
+            stats.bytes += event.bytes or 0
+            stats.total += event.elapsed
+            stats.max = max(stats.max, event.elapsed)
+            stats.histogram[bisect.bisect_left(self.buckets, event.elapsed)] += 1
+
+    def _quantile(self, stats, quantile):
+        """
+        Estimate a latency quantile as the upper bound of the bucket it falls into.
+        """
+        rank = quantile * stats.count
+        seen = 0
+        for bound, count in zip(self.buckets, stats.histogram):
+            seen += count
+            if seen >= rank:
+                return min(bound, stats.max)
+        return stats.max
+
+    def summary(self):
+        """
+        Summarize the requests made to each endpoint.
+
+        Counts and latencies cover the requests sent over the network; answers from the cache are counted in cache_hits.
+
+        :return: List of dictionaries, one per endpoint and HTTP method, those taking the most time in total first.
+        """
+        with self._lock:
+            summary = [{
+                'verb': verb,
+                'endpoint': endpoint,
+                'count': stats.count,
+                'errors': stats.errors,
+                'cache_hits': stats.cache_hits,
+                'retries': stats.retries,
+                'bytes': stats.bytes,
+                'total_seconds': stats.total,
+                'mean_seconds': stats.total / stats.count if stats.count else 0.0,
+                'p50_seconds': self._quantile(stats, 0.5),
+                'p95_seconds': self._quantile(stats, 0.95),
+                'p99_seconds': self._quantile(stats, 0.99),
+                'max_seconds': stats.max,
+                'histogram': dict(zip([str(bound) for bound in self.buckets] + ['inf'], stats.histogram)),
+            } for (verb, endpoint), stats in self._endpoints.items()]
+        return sorted(summary, key=lambda entry: entry['total_seconds'], reverse=True)
+
+    def report(self):
+        """
+        Format the summary as a table.
+
+        :return: String.
+        """
+        lines = ['%-6s %-40s %7s %6s %6s %10s %9s %9s %9s' % ('verb', 'endpoint', 'count', 'errors', 'hits', 'total (s)',
+                                                              'p50 (ms)', 'p95 (ms)', 'max (ms)')]
+        for entry in self.summary():
+            lines.append('%-6s %-40s %7d %6d %6d %10.3f %9.1f %9.1f %9.1f' % (
+                entry['verb'], entry['endpoint'], entry['count'], entry['errors'], entry['cache_hits'],
+                entry['total_seconds'], entry['p50_seconds'] * 1000, entry['p95_seconds'] * 1000, entry['max_seconds'] * 1000))
+        return '\n'.join(lines)
+
+    def reset(self):
+        """
+        Forget every event recorded.
+        """
+        with self._lock:
+            self._endpoints.clear()
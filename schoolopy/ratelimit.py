@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how quickly requests are sent.
+
+    Schoology allows each consumer key 50 requests every 5 seconds. Callers over that rate are made to wait
+    just long enough for a token to free up, in the order they asked for one. A limiter may be shared by any
+    number of threads, coroutines and clients; use for_key() to get the one limiter for a given consumer key.
+    """
+    _limiters = {}
+    _limiters_lock = threading.Lock()
+
+    def __init__(self, requests=50, period=5, burst=None):
+        """
+        :param requests: Number of requests allowed per period.
+        :param period: Length of the period in seconds.
+        :param burst: Number of requests that may be sent at once after a quiet spell. Defaults to requests.
+        """
+        self.rate = requests / period
+        self.capacity = requests if burst is None else burst
+        self.requests = 0
+        self.waited = 0.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_key(cls, consumer_key, requests=50, period=5, burst=None):
+        """
+        Get the limiter shared by every client using a consumer key, creating it if need be.
+
+        :param consumer_key: Consumer key the quota applies to.
+        :return: RateLimiter for that key.
+        """
+        with cls._limiters_lock:
+            if consumer_key not in cls._limiters:
+                cls._limiters[consumer_key] = cls(requests, period, burst)
+            return cls._limiters[consumer_key]
+
+    def _reserve(self):
+        """
+        Take a token, borrowing against future ones if none is left.
+
+        :return: Seconds to wait before the token may be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate)
+            self.requests += 1
+            self.waited += wait
+            return wait
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+
+        :return: Seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        """
+        Wait, without blocking the event loop, until a request may be sent.
+
+        :return: Seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
@@ -0,0 +1,136 @@
+import asyncio
+
+from .main import Schoology
+from .models import User, Section, Group, Course
+
+
+class Resolver:
+    """
+    Fetches the objects a batch of models refer to by ID, such as the author of each update in a feed, and attaches
+    them to the models, in a fixed number of round trips rather than one request per model.
+
+    The distinct IDs of each kind are fetched together, through multi_get or concurrently through get_many, and
+    remembered, so that objects already resolved, or held by the client's identity map, are not fetched again.
+    """
+    # Fields holding the IDs of related objects, with the key to attach each object under, the client method fetching
+    # it and its model class.
+    relations = {
+        'uid': ('user', 'get_user', User),
+        'section_id': ('section', 'get_section', Section),
+        'group_id': ('group', 'get_group', Group),
+        'course_id': ('course', 'get_course', Course),
+    }
+
+    def __init__(self, schoology, fields=None, multi_get=True, max_workers=8):
+        """
+        :param schoology: Schoology or AsyncSchoology instance to fetch objects with.
+        :param fields: Fields of the models to resolve, among those of Resolver.relations. Defaults to all of them.
+        :param multi_get: Whether to combine requests through Schoology's multiget endpoint. If False, objects are
+                          fetched with get_many.
+        :param max_workers: Maximum number of requests in progress at once when not using multi_get.
+        """
+        self.schoology = schoology
+        self.fields = list(self.relations if fields is None else fields)
+        for field in self.fields:
+            if field not in self.relations:
+                raise ValueError('Cannot resolve field %r.' % field)
+        self.multi_get = multi_get
+        self.max_workers = max_workers
+        self.errors = {}
+        self._objects = {}
+
+    def _plan(self, items):
+        """
+        Work out which objects referred to by a batch of models still need fetching.
+
+        :param items: Models.
+        :return: Dictionary mapping client method names to lists of distinct IDs to fetch with them.
+        """
+        identity_map = getattr(self.schoology, 'identity_map', None)
+        plan = {}
+        for item in items:
+            for field in self.fields:
+                id = item.get(field)
+                if not id:
+                    continue
+                attribute, method, model = self.relations[field]
+                key = (method, str(id))
+                if key in self._objects:
+                    continue
+                held = identity_map.get(model, id) if identity_map is not None else None
+                if held is not None:
+                    self._objects[key] = held
+                    continue
+                ids = plan.setdefault(method, {})
+                ids.setdefault(key[1], id)
+        return {method: list(ids.values()) for method, ids in plan.items()}
+
+    def _store(self, method, ids, results):
+        """
+        Remember the objects fetched with a method, and the errors met fetching those that failed.
+        """
+        for id, result in zip(ids, results):
+            key = (method, str(id))
+            if isinstance(result, Exception):
+                self.errors[key] = result
+            else:
+                self.errors.pop(key, None)
+                self._objects[key] = result
+
+    def _attach(self, items):
+        """
+        Attach the objects resolved to the models referring to them, e.g. update['user'] for update['uid'].
+        """
+        for item in items:
+            for field in self.fields:
+                id = item.get(field)
+                if not id:
+                    continue
+                attribute, method, model = self.relations[field]
+                resolved = self._objects.get((method, str(id)))
+                if resolved is not None:
+                    item[attribute] = resolved
+        return items
+
+    def _fetch(self, method, ids):
+        if self.multi_get:
+            return self.schoology.multi_get(method, ids)
+        return self.schoology.get_many(method, ids, max_workers=self.max_workers)
+
+    def resolve(self, items):
+        """
+        Fetch the objects a batch of models refer to and attach them to the models, e.g. as update.user.
+
+        Objects that could not be fetched are left out, with the exception raised in self.errors under the tuple of
+        the method and ID, and tried again on the next call.
+
+        :param items: List of models, such as a page of get_feed().
+        :return: The models given.
+        """
+        items = list(items)
+        plan = list(self._plan(items).items())
+        results = Schoology._map(lambda entry: self._fetch(*entry), plan, max(len(plan), 1))
+        for (method, ids), fetched in zip(plan, results):
+            self._store(method, ids, fetched)
+        return self._attach(items)
+
+    async def resolve_async(self, items):
+        """
+        Like resolve, for a Resolver built on an AsyncSchoology instance.
+
+        :param items: List of models.
+        :return: The models given.
+        """
+        items = list(items)
+        plan = list(self._plan(items).items())
+        results = await asyncio.gather(*[self._fetch(method, ids) for method, ids in plan])
+        for (method, ids), fetched in zip(plan, results):
+            self._store(method, ids, fetched)
+        return self._attach(items)
+
+    def clear(self):
+        """
+        Forget the objects resolved so far, so that they are fetched again.
+        """
+        self._objects.clear()
+        self.errors.clear()
@@ -0,0 +1,83 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    Decides whether, and after how long, a failed request is sent again.
+
+    Requests are retried after connection errors and responses with one of retry_statuses, waiting for as long as
+    the response's Retry-After header asks or otherwise for a jittered, exponentially growing delay.
+    POST requests are not idempotent, so they are only retried when Schoology turned them away with 429 Too Many
+    Requests, meaning they were never processed.
+    """
+    idempotent_methods = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+    def __init__(self, max_attempts=5, backoff=0.5, max_backoff=60, retry_statuses=(429, 500, 502, 503, 504)):
+        """
+        :param max_attempts: Maximum number of times to send a request, including the first.
+        :param backoff: Upper bound in seconds of the delay before the first retry, doubled for each further one.
+        :param max_backoff: Cap in seconds on the delay between attempts when Retry-After is absent.
+        :param retry_statuses: HTTP status codes worth retrying.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retries = 0
+        self.exhausted = 0
+        self._lock = threading.Lock()
+
+    def should_retry(self, verb, attempt, status=None):
+        """
+        Decide whether to retry a failed request, keeping count of the outcome.
+
+        :param verb: HTTP method of the request.
+        :param attempt: Number of times the request has been sent so far.
+        :param status: HTTP status code received, or None if the connection failed.
+        :return: Whether to send the request again.
+        """
+        if status is not None and status not in self.retry_statuses:
+            return False
+        if verb not in self.idempotent_methods and status != 429:
+            return False
+        with self._lock:
+            if attempt >= self.max_attempts:
+                self.exhausted += 1
+                return False
+            self.retries += 1
+            return True
+
+    def delay(self, attempt, headers=None):
+        """
+        Work out how long to wait before sending a request again.
+
+        :param attempt: Number of times the request has been sent so far.
+        :param headers: Headers of the failed response, if any.
+        :return: Delay in seconds.
+        """
+        retry_after = self._retry_after(headers)
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def _retry_after(headers):
+        """
+        Read a Retry-After header, given either as a number of seconds or as an HTTP date.
+
+        :return: Seconds to wait, or None if there is no usable header.
+        """
+        value = (headers or {}).get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
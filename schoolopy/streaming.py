@@ -0,0 +1,134 @@
+import codecs
+import json
+import re
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r'[ \t\n\r]*')
+_delimiters = ' \t\n\r,:]}'
+# Yielded by the parser when it needs the next chunk.
+_more = object()
+
+
+class ItemStream:
+    """
+    Incremental parser for a JSON object holding a list of items, such as a page of results from a list endpoint.
+
+    Iterating over the stream reads chunks of the document only as far as needed to yield the next item of the list
+    under key, so that no more than one item has to be held in memory at once. The object's other members are decoded
+    in full and collected into members as they are passed. Streams over an async iterable of chunks are iterated with
+    async for.
+    """
+    def __init__(self, chunks, key):
+        """
+        :param chunks: Iterable or async iterable of bytes or str making up the document, e.g.
+                       response.iter_content(65536) or, with aiohttp, response.content.iter_chunked(65536).
+        :param key: Key of the list to stream.
+        """
+        self.chunks = chunks.__aiter__() if hasattr(chunks, '__aiter__') else iter(chunks)
+        self.key = key
+        self.members = {}
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._exhausted = False
+
+    def __iter__(self):
+        for item in self._parse():
+            if item is _more:
+                self._read(next(self.chunks, None))
+            else:
+                yield item
+
+    async def __aiter__(self):
+        for item in self._parse():
+            if item is _more:
+                try:
+                    chunk = await self.chunks.__anext__()
+                except StopAsyncIteration:
+                    chunk = None
+                self._read(chunk)
+            else:
+                yield item
+
+    def _parse(self):
+        """
+        Parse the document as far as the buffer allows, yielding _more whenever the next chunk is needed.
+        """
+        yield from self._expect('{')
+        if (yield from self._peek()) == '}':
+            self._position += 1
+            return
+        while True:
+            name = yield from self._value()
+            yield from self._expect(':')
+            if name == self.key and (yield from self._peek()) == '[':
+                self._position += 1
+                if (yield from self._peek()) == ']':
+                    self._position += 1
+                else:
+                    while True:
+                        yield (yield from self._value())
+                        if (yield from self._expect(',]')) == ']':
+                            break
+            else:
+                self.members[name] = yield from self._value()
+            if (yield from self._expect(',}')) == '}':
+                return
+
+    def _read(self, chunk):
+        """
+        Append the next chunk to the buffer, dropping what has already been parsed.
+
+        :param chunk: Chunk read, or None at the end of the document.
+        """
+        if chunk is None:
+            self._exhausted = True
+            chunk = self._text.decode(b'', final=True)
+        elif isinstance(chunk, bytes):
+            chunk = self._text.decode(chunk)
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+
+    def _peek(self):
+        """
+        Skip whitespace, reading further as need be.
+
+        :return: Next significant character, or an empty string at the end of the document.
+        """
+        while True:
+            self._position = _whitespace.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._exhausted:
+                return ''
+            yield _more
+
+    def _expect(self, characters):
+        """
+        Consume one of a set of structural characters.
+
+        :return: Character consumed.
+        """
+        character = yield from self._peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError('Expecting one of %r' % characters, self._buffer, self._position)
+        self._position += 1
+        return character
+
+    def _value(self):
+        """
+        Decode the next complete JSON value, reading further until it has been received in full.
+        """
+        yield from self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+                # A number is only complete once followed by a delimiter, as the next chunk may carry on with
+                # more digits, a fraction or an exponent.
+                if self._exhausted or (end < len(self._buffer) and self._buffer[end] in _delimiters):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            yield _more
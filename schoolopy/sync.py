@@ -0,0 +1,163 @@
+from .models import Enrollment
+
+
+class EnrollmentPlan:
+    """
+    Changes needed to bring the enrollments of a section or group in line with a desired roster.
+
+    creates holds the enrollments to add, updates the changed fields of existing enrollments along with their id,
+    and deletes the existing enrollments no longer on the roster.
+    """
+    def __init__(self, creates, updates, deletes, unchanged):
+        """
+        :param creates: List of Enrollment objects to create.
+        :param updates: List of Enrollment objects to update, each holding the id of the enrollment and the fields to change.
+        :param deletes: List of existing Enrollment objects to delete.
+        :param unchanged: Number of enrollments already as desired.
+        """
+        self.creates = creates
+        self.updates = updates
+        self.deletes = deletes
+        self.unchanged = unchanged
+
+    def __len__(self):
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+    def __repr__(self):
+        return 'EnrollmentPlan(%d to create, %d to update, %d to delete, %d unchanged)' % (
+            len(self.creates), len(self.updates), len(self.deletes), self.unchanged)
+
+    def report(self):
+        """
+        Describe every change planned, one per line.
+
+        :return: String.
+        """
+        lines = ['create uid %s %s' % (enrollment['uid'], self._fields(enrollment)) for enrollment in self.creates]
+        lines += ['update uid %s %s' % (enrollment['uid'], self._fields(enrollment)) for enrollment in self.updates]
+        lines += ['delete uid %s (enrollment %s)' % (enrollment.get('uid'), enrollment['id']) for enrollment in self.deletes]
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _fields(enrollment):
+        return ', '.join('%s=%s' % (key, value) for key, value in enrollment.items() if key not in ('id', 'uid'))
+
+
+class EnrollmentSync:
+    """
+    Synchronizes the enrollments of a section or group with a roster, such as one exported from a student
+    information system, making only the writes needed.
+
+    Current enrollments are fetched in full and indexed by uid. Comparing them with the roster gives an EnrollmentPlan,
+    which can be inspected before it is applied through the bulk enrollment methods.
+    """
+    fields = ('admin', 'status')
+
+    def __init__(self, schoology, section_id=None, group_id=None, fields=None, delete=True, keep_admins=True):
+        """
+        :param schoology: Schoology instance to make requests through.
+        :param *_id: ID of realm. Either section_id or group_id must be given.
+        :param fields: Enrollment fields to keep in line with the roster. Defaults to admin and status.
+        :param delete: Whether to delete enrollments of users missing from the roster.
+        :param keep_admins: Whether to keep admin enrollments, such as those of teachers, when their users are missing
+                            from the roster, as rosters often only list students.
+        """
+        if not section_id and not group_id:
+            raise TypeError('Realm id property required.')
+        self.schoology = schoology
+        self.section_id = section_id
+        self.group_id = group_id
+        if fields is not None:
+            self.fields = tuple(fields)
+        self.delete = delete
+        self.keep_admins = keep_admins
+
+    def _path(self):
+        if self.section_id:
+            return 'sections/%s/enrollments' % self.section_id
+        return 'groups/%s/enrollments' % self.group_id
+
+    def current(self):
+        """
+        Fetch every current enrollment of the realm.
+
+        Pages are read from the first, whatever the client's start, as enrollments skipped would be taken as missing.
+
+        :return: Dictionary mapping uids to Enrollment objects.
+        """
+        if self.section_id:
+            enrollments = self.schoology.paginate(self.schoology.get_section_enrollments, self.section_id, start=0)
+        else:
+            enrollments = self.schoology.paginate(self.schoology.get_group_enrollments, self.group_id, start=0)
+        index = {}
+        for enrollment in enrollments:
+            index.setdefault(str(enrollment['uid']), enrollment)
+        return index
+
+    def plan(self, roster, current=None):
+        """
+        Work out the changes needed to match a roster.
+
+        :param roster: Iterable of Enrollment objects or dictionaries, each with a uid and the fields desired.
+                       Fields left out are not compared.
+        :param current: Current enrollments as returned by current(), fetched if not given.
+        :return: EnrollmentPlan.
+        """
+        if current is None:
+            current = self.current()
+        creates = []
+        updates = []
+        unchanged = 0
+        wanted = set()
+        for entry in roster:
+            uid = str(entry['uid'])
+            if uid in wanted:
+                continue
+            wanted.add(uid)
+            existing = current.get(uid)
+            if existing is None:
+                creates.append(Enrollment(entry))
+                continue
+            changes = {field: entry[field] for field in self.fields
+                       if field in entry and str(entry[field]) != str(existing.get(field))}
+            if changes:
+                updates.append(Enrollment(dict(changes, id=existing['id'], uid=existing['uid'])))
+            else:
+                unchanged += 1
+        deletes = [enrollment for uid, enrollment in current.items()
+                   if uid not in wanted and not (self.keep_admins and str(enrollment.get('admin')) == '1')] if self.delete else []
+        return EnrollmentPlan(creates, updates, deletes, unchanged)
+
+    def apply(self, plan, max_workers=1):
+        """
+        Make the changes of a plan through bulk requests.
+
+        :param plan: EnrollmentPlan from plan().
+        :param max_workers: Maximum number of requests in flight at once.
+        :return: Dictionary with the results of the creates and updates, in the order planned, as returned by the bulk
+                 methods, and the IDs of the enrollments deleted.
+        """
+        created = self.schoology.create_enrollments(plan.creates, section_id=self.section_id, group_id=self.group_id,
+                                                    max_workers=max_workers) if plan.creates else []
+        if self.section_id:
+            updated = self.schoology.update_section_enrollments(plan.updates, self.section_id, max_workers) if plan.updates else []
+        else:
+            updated = self.schoology.update_group_enrollments(plan.updates, self.group_id, max_workers) if plan.updates else []
+        deleted = [enrollment['id'] for enrollment in plan.deletes]
+        if deleted:
+            self.schoology.delete_enrollments(deleted)
+            # Bulk deletes go to the enrollments endpoint, leaving the realm's cached listing to be dropped here.
+            if self.schoology.cache is not None:
+                self.schoology.cache.invalidate(self._path())
+        return {'created': created, 'updated': updated, 'deleted': deleted}
+
+    def run(self, roster, max_workers=1):
+        """
+        Plan and apply the changes needed to match a roster.
+
+        :param roster: Iterable of Enrollment objects or dictionaries, see plan().
+        :param max_workers: Maximum number of requests in flight at once.
+        :return: Tuple of the EnrollmentPlan and the results of applying it.
+        """
+        plan = self.plan(roster)
+        return plan, self.apply(plan, max_workers)
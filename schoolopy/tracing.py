@@ -0,0 +1,187 @@
+import contextvars
+import functools
+import inspect
+import threading
+import time
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:
+    trace = None
+
+# Methods returning lazy iterators, whose requests happen after they return, and housekeeping.
+_untraced = frozenset(['paginate', 'stream', 'close'])
+
+
+class Tracer:
+    """
+    Traces a client's work: a span for each public method called, with a child span for each HTTP request it makes,
+    so that the requests behind helpers such as get_sections() show up nested under them.
+
+    Spans are sent to an OpenTelemetry tracer, by default that of the global tracer provider, or to a SpanRecorder.
+    Without OpenTelemetry installed and no tracer given, tracing does nothing.
+    Calls replayed by AsyncSchoology and multi_get(), and list methods passed to paginate(), get no span of their own,
+    but their requests do.
+    """
+    def __init__(self, tracer=None, name='schoolopy'):
+        """
+        :param tracer: OpenTelemetry tracer, or SpanRecorder, to create spans with.
+        :param name: Instrumentation name to get the global tracer by, if tracer is not given.
+        """
+        if tracer is None and trace is not None:
+            tracer = trace.get_tracer(name)
+        self.tracer = tracer
+
+    def instrument(self, client):
+        """
+        Open a span around every public method of a client, Schoology or AsyncSchoology.
+
+        Only this instance is affected, so clients without tracing pay nothing for it.
+
+        :param client: Client to instrument.
+        """
+        if self.tracer is None:
+            return
+        local = getattr(client, '_local', None)
+        for name in dir(type(client)):
+            function = getattr(type(client), name)
+            if name.startswith('_') or name in _untraced or not inspect.isfunction(function):
+                continue
+            span_name = '%s.%s' % (type(client).__name__, name)
+            if inspect.iscoroutinefunction(function):
+                setattr(client, name, self._wrap_async(span_name, getattr(client, name)))
+            elif not inspect.isasyncgenfunction(function):
+                setattr(client, name, self._wrap(span_name, getattr(client, name), local))
+
+    def _wrap(self, span_name, method, local):
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            if getattr(local, 'replay', None) is not None or getattr(local, 'paginate', False):
+                return method(*args, **kwargs)
+            with self.tracer.start_as_current_span(span_name):
+                return method(*args, **kwargs)
+        return call
+
+    def _wrap_async(self, span_name, method):
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            with self.tracer.start_as_current_span(span_name):
+                return await method(*args, **kwargs)
+        return call
+
+    def __call__(self, event):
+        """
+        Record a finished request as a span, as a child of the current one. Used as a hook.
+
+        :param event: metrics.RequestEvent.
+        """
+        if self.tracer is None:
+            return
+        end = time.time_ns()
+        attributes = {
+            'http.request.method': event.verb,
+            'url.full': event.url,
+            'http.route': event.endpoint,
+            'http.response.status_code': event.status,
+            'schoology.attempts': event.attempts,
+            'schoology.bytes': event.bytes,
+            'schoology.waited': event.waited,
+            'schoology.cache_hit': event.cache_hit,
+        }
+        span = self.tracer.start_span('%s %s' % (event.verb, event.endpoint), start_time=end - int(event.elapsed * 1e9),
+                                      attributes={key: value for key, value in attributes.items() if value is not None})
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)) if trace is not None else 'error')
+        span.end(end_time=end)
+
+
+class _Span:
+    def __init__(self, name, parent, attributes, start_time):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.start_time = start_time
+        self.end_time = None
+        self.status = None
+        self.events = []
+        self.children = []
+
+    @property
+    def duration(self):
+        return ((self.end_time or time.time_ns()) - self.start_time) / 1e9
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_status(self, status, description=None):
+        self.status = status
+
+    def record_exception(self, exception, attributes=None, timestamp=None, escaped=False):
+        self.events.append(exception)
+
+    def end(self, end_time=None):
+        self.end_time = end_time or time.time_ns()
+
+    def __repr__(self):
+        return '_Span(%r, %.1fms)' % (self.name, self.duration * 1000)
+
+
+class SpanRecorder:
+    """
+    Minimal stand-in for an OpenTelemetry tracer, keeping spans in memory as trees, for inspecting a client's
+    request fan-out without an OpenTelemetry SDK. Pass it to Tracer.
+    """
+    def __init__(self):
+        self.roots = []
+        self._current = contextvars.ContextVar('schoolopy_span', default=None)
+        self._lock = threading.Lock()
+
+    def start_span(self, name, context=None, kind=None, attributes=None, links=None, start_time=None, **kwargs):
+        parent = self._current.get()
+        span = _Span(name, parent, attributes, start_time or time.time_ns())
+        with self._lock:
+            (self.roots if parent is None else parent.children).append(span)
+        return span
+
+    def start_as_current_span(self, name, **kwargs):
+        return _CurrentSpan(self, self.start_span(name, **kwargs))
+
+    def report(self):
+        """
+        Format the spans recorded as indented trees, with their durations.
+
+        :return: String.
+        """
+        lines = []
+
+        def add(span, depth):
+            lines.append('%s%s %.1fms%s' % ('  ' * depth, span.name, span.duration * 1000, ' (error)' if span.events else ''))
+            for child in span.children:
+                add(child, depth + 1)
+
+        for root in self.roots:
+            add(root, 0)
+        return '\n'.join(lines)
+
+    def clear(self):
+        with self._lock:
+            self.roots = []
+
+
+class _CurrentSpan:
+    def __init__(self, recorder, span):
+        self.recorder = recorder
+        self.span = span
+
+    def __enter__(self):
+        self.token = self.recorder._current.set(self.span)
+        return self.span
+
+    def __exit__(self, type, value, traceback):
+        if value is not None:
+            self.span.record_exception(value)
+            self.span.set_status('error')
+        self.span.end()
+        self.recorder._current.reset(self.token)
@@ -15,4 +15,10 @@ setup(name='schoolopy',
       license='MIT',
       packages=['schoolopy'],
       install_requires=['requests', 'requests-oauthlib', 'oauthlib'],
+      extras_require={
+          'async': ['aiohttp'],
+          'fast': ['orjson'],
+          'tracing': ['opentelemetry-api'],
+          'columnar': ['numpy', 'pandas', 'pyarrow'],
+      },
       zip_safe=False)
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+import schoolopy
+from schoolopy.fake import FakeSchoology
+
+pytest.importorskip('aiohttp')
+
+
+@pytest.fixture
+def served():
+    fake = FakeSchoology(users=10, sections=1, enrollments=120, assignments=1)
+    api_host = fake.serve()
+    yield fake, api_host
+    fake.close()
+
+
+def run(api_host, function):
+    async def main():
+        async with schoolopy.AsyncSchoology(schoolopy.Auth('key', 'secret'), api_host=api_host) as asc:
+            return await function(asc)
+    return asyncio.run(main())
+
+
+def test_bulk_create_from_generator(served):
+    fake, api_host = served
+    users = (schoolopy.User({'name_first': 'New%d' % i, 'school_uid': 'N%d' % i}) for i in range(120))
+    results = run(api_host, lambda asc: asc.create_users(users))
+    assert len(results) == 120
+    assert len(fake.collections['users'][1]) == 130
+
+
+def test_bulk_delete_from_generator(served):
+    fake, api_host = served
+    path = 'sections/%s/enrollments' % fake.collections['users/100000/sections'][1][0]['id']
+    ids = (enrollment['id'] for enrollment in list(fake.collections[path][1]))
+    run(api_host, lambda asc: asc.delete_enrollments(ids))
+    assert not fake.collections[path][1]
+
+
+def test_stream_matches_paginate(served):
+    fake, api_host = served
+    section_id = fake.collections['users/100000/sections'][1][0]['id']
+
+    async def read(asc):
+        asc.limit = 50
+        asc._sync.stream_chunk_size = 7
+        streamed = [enrollment async for enrollment in asc.stream(asc.get_section_enrollments, section_id)]
+        paginated = [enrollment async for enrollment in asc.paginate(asc.get_section_enrollments, section_id)]
+        return streamed, paginated
+
+    streamed, paginated = run(api_host, read)
+    assert len(streamed) == 120
+    assert streamed == paginated
+
+
+def test_stream_stopped_early(served):
+    fake, api_host = served
+    section_id = fake.collections['users/100000/sections'][1][0]['id']
+
+    async def read(asc):
+        items = asc.stream(asc.get_section_enrollments, section_id)
+        first = [await items.__anext__() for _ in range(3)]
+        await items.aclose()
+        return first
+
+    assert len(run(api_host, read)) == 3
@@ -0,0 +1,24 @@
+import pytest
+
+import schoolopy
+
+numpy = pytest.importorskip('numpy')
+
+
+def test_to_numpy_types():
+    columns = schoolopy.to_numpy([{'a': 1, 'b': True, 'c': 1.5}, {'a': 2, 'b': False, 'c': None}])
+    assert columns['a'].dtype == numpy.int64
+    assert columns['b'].dtype == bool
+    assert columns['c'].dtype == numpy.float64
+
+
+def test_to_numpy_ints_beyond_int64():
+    column = schoolopy.to_numpy([{'a': 1}, {'a': 2 ** 70}])['a']
+    assert column.dtype == object
+    assert list(column) == [1, 2 ** 70]
+
+
+def test_to_arrow_ints_beyond_int64():
+    pytest.importorskip('pyarrow')
+    table = schoolopy.to_arrow([{'a': 1}, {'a': 2 ** 70}])
+    assert table.column('a').to_pylist() == ['1', str(2 ** 70)]
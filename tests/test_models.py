@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+import schoolopy
+from schoolopy.codec import available_codecs
+from schoolopy.fake import FakeSchoology
+
+
+@pytest.fixture
+def fake():
+    return FakeSchoology(users=10, sections=1, enrollments=5, assignments=1)
+
+
+def client(fake, model_style):
+    sc = schoolopy.Schoology(schoolopy.Auth('key', 'secret'), transport=fake)
+    sc.model_style = model_style
+    return sc
+
+
+@pytest.mark.parametrize('codec', available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_encode_compact_models(codec):
+    user = schoolopy.compact.User({'uid': '100001', 'name_first': 'Ada', 'extra': [1]})
+    assert json.loads(codec.dumps({'user': user})) == {'user': {'uid': '100001', 'name_first': 'Ada', 'extra': [1]}}
+
+
+def test_compact_model_written_back(fake):
+    sc = client(fake, 'compact')
+    user = sc.get_user('100001')
+    user.name_first = 'Changed'
+    created = sc.create_user(user)
+    assert isinstance(created, schoolopy.compact.User)
+    assert fake.objects['users/%s' % created.id]['name_first'] == 'Changed'
+    assert fake.objects['users/%s' % created.id]['uid'] == '100001'
+
+
+@pytest.mark.parametrize('codec', available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_encode_lazy_models(codec):
+    users = schoolopy.lazy.LazySequence(schoolopy.lazy.User, [{'uid': '100001'}, {'uid': '100002'}])
+    assert json.loads(codec.dumps({'users': users, 'user': users[0]})) == {
+        'users': [{'uid': '100001'}, {'uid': '100002'}],
+        'user': {'uid': '100001'},
+    }
+
+
+def test_lazy_model_written_back(fake):
+    sc = client(fake, 'lazy')
+    user = sc.get_users()[1]
+    user.name_first = 'Changed'
+    created = sc.create_user(user)
+    assert isinstance(created, schoolopy.lazy.User)
+    assert fake.objects['users/%s' % created.id]['name_first'] == 'Changed'
+    assert fake.objects['users/100001']['name_first'] != 'Changed'
+
+
+def test_bulk_results_held_by_identity_map(fake):
+    sc = schoolopy.Schoology(schoolopy.Auth('key', 'secret'), transport=fake, identity_map=schoolopy.IdentityMap())
+    created = sc.create_users([schoolopy.User({'name_first': 'New', 'school_uid': 'N1'})])
+    assert sc.identity_map.get(schoolopy.User, created[0]['id']) is created[0]
+    assert sc.get_user(created[0]['id']) is created[0]
@@ -0,0 +1,32 @@
+import schoolopy
+from schoolopy.fake import FakeSchoology
+
+
+class Recorder:
+    """
+    Transport passing requests to a FakeSchoology, keeping every response it returns.
+    """
+    def __init__(self, fake):
+        self.fake = fake
+        self.responses = []
+
+    def request(self, *args, **kwargs):
+        response = self.fake.request(*args, **kwargs)
+        response.closed = False
+
+        def close():
+            response.closed = True
+        response.close = close
+        self.responses.append(response)
+        return response
+
+
+def test_retried_responses_closed():
+    fake = FakeSchoology(users=10, sections=1, enrollments=5, assignments=1)
+    fake.fail(503, times=2)
+    transport = Recorder(fake)
+    sc = schoolopy.Schoology(schoolopy.Auth('key', 'secret'), transport=transport,
+                             retry=schoolopy.RetryPolicy(backoff=0))
+    assert sc.get_user('100001')['uid'] == '100001'
+    assert [response.status_code for response in transport.responses] == [503, 503, 200]
+    assert [response.closed for response in transport.responses] == [True, True, False]
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from schoolopy.streaming import ItemStream
+
+documents = [
+    '{"user":[-2.5e10,3]}',
+    '{"total":12.25,"user":[1,-0.5,2E-3,true,null,{"a":[1.5]}],"links":{"next":"x"}}',
+    '{"user":[{"uid":"100001","grade":97.5},{"uid":"100002","grade":1e2}],"total":2}',
+]
+
+
+def chunked(text, size):
+    data = text.encode('utf-8')
+    return [data[offset:offset + size] for offset in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 4, 5, 7])
+@pytest.mark.parametrize('document', documents)
+def test_chunk_boundaries(document, size):
+    stream = ItemStream(chunked(document, size), 'user')
+    expected = json.loads(document)
+    assert list(stream) == expected.pop('user')
+    assert stream.members == expected
+
+
+def test_number_split_at_fraction():
+    assert list(ItemStream([b'{"user":[-2.', b'5e10,3]}'], 'user')) == [-2.5e10, 3]
+
+
+def test_number_split_at_exponent():
+    assert list(ItemStream([b'{"user":[1e', b'3]}'], 'user')) == [1e3]
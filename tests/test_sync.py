@@ -0,0 +1,30 @@
+import pytest
+
+import schoolopy
+from schoolopy.fake import FakeSchoology
+
+
+@pytest.fixture
+def fake():
+    return FakeSchoology(users=10, sections=1, enrollments=30, assignments=1)
+
+
+def test_deletes_not_replanned_from_cache(fake):
+    sc = schoolopy.Schoology(schoolopy.Auth('key', 'secret'), transport=fake, cache=schoolopy.ResponseCache())
+    sc.limit = 10
+    section_id = fake.collections['users/100000/sections'][1][0]['id']
+    sync = schoolopy.EnrollmentSync(sc, section_id=section_id, keep_admins=False)
+    roster = list(sync.current().values())[:5]
+    plan, results = sync.run(roster)
+    assert plan.deletes and len(results['deleted']) == len(plan.deletes)
+    replan = sync.plan(roster)
+    assert not replan.deletes
+    assert replan.unchanged == 5
+
+
+def test_current_reads_from_first_page(fake):
+    sc = schoolopy.Schoology(schoolopy.Auth('key', 'secret'), transport=fake)
+    sc.limit = 10
+    sc.start = 20
+    section_id = fake.collections['users/100000/sections'][1][0]['id']
+    assert len(schoolopy.EnrollmentSync(sc, section_id=section_id).current()) == 30